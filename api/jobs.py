@@ -0,0 +1,247 @@
+"""Job registry: targets (JD, role title, keywords) registered once and analyzed by ID.
+
+A registered job is stored in SQLite together with its target keyword sets (plain, and
+stemmed with the word to show for each stem), so later analyses send only the resume and skip
+parsing and tokenizing the job description. Every update bumps the job's version; the version is the HTTP ETag, and PUT or
+analyze with a stale If-Match is rejected. Compiled targets (match.CompiledTargets) are cached
+per process by (id, version, stem, tables version), so an update in one worker is seen by the
+others on their next request without any cross-process invalidation. Stored target sets record
+the digest of the tables they were tokenized with and the stemmer version (stem.py). After a
+tables swap (resume_analyzer/tables.py) or a stemmer change, a job whose stored sets were built
+with other tables or another stemmer is re-tokenized from its spec on first use.
+
+The database path comes from JOBS_DB_PATH (default jobs.sqlite3 in the working directory).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from resume_analyzer.analyzer import build_target_keywords, build_targets
+from resume_analyzer.match import CompiledTargets
+from resume_analyzer.stem import STEMMER_VERSION
+from resume_analyzer.tables import current_tables, pin_tables
+
+DEFAULT_JOBS_DB_PATH = "jobs.sqlite3"
+COMPILED_CACHE_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    spec TEXT NOT NULL,
+    targets TEXT NOT NULL,
+    stemmed_targets TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    tables TEXT NOT NULL DEFAULT '',
+    stemmer INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class VersionConflict(Exception):
+    """The job changed since the version the caller expected."""
+
+    def __init__(self, current: int) -> None:
+        super().__init__(f"job is at version {current}")
+        self.current = current
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """A registered job: its target spec, version and the derived target keyword count."""
+
+    id: str
+    version: int
+    job_description: str | None
+    role_title: str | None
+    keywords: list[str] | None
+    target_count: int
+    created_at: float
+    updated_at: float
+
+
+def _compile_spec(spec: dict) -> tuple[str, str, str]:
+    """
+    (plain targets JSON, stemmed targets JSON {stem: word}, tables digest) for a spec, built
+    with the current stemmer (STEMMER_VERSION).
+    """
+    with pin_tables() as tables:
+        plain = sorted(build_target_keywords(**spec))
+        stemmed, surface = build_targets(**spec, stem=True)
+    stemmed_json = json.dumps({t: surface.get(t, t) for t in sorted(stemmed)})
+    return json.dumps(plain), stemmed_json, tables.digest
+
+
+class JobStore:
+    """SQLite-backed job registry, safe to share between threads of one process."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL lets prefork workers read while another worker writes.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "tables" not in columns:  # databases created before tables were versioned
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN tables TEXT NOT NULL DEFAULT ''")
+        if "stemmer" not in columns:  # databases created before the stemmer was versioned
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN stemmer INTEGER NOT NULL DEFAULT 0")
+        self._lock = threading.Lock()
+        self._compiled: OrderedDict[
+            tuple[str, int, bool, int], tuple[frozenset[str], CompiledTargets]
+        ] = OrderedDict()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _job(self, row: tuple) -> Job:
+        job_id, version, spec, targets, created_at, updated_at = row
+        spec = json.loads(spec)
+        return Job(
+            id=job_id,
+            version=version,
+            job_description=spec["job_description"],
+            role_title=spec["role_title"],
+            keywords=spec["keywords"],
+            target_count=len(json.loads(targets)),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def _fetch(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, version, spec, targets, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._job(row) if row else None
+
+    def create(
+        self,
+        job_description: str | None = None,
+        role_title: str | None = None,
+        keywords: list[str] | None = None,
+    ) -> Job:
+        """Register a job at version 1."""
+        spec = {"job_description": job_description, "role_title": role_title, "keywords": keywords}
+        targets, stemmed, digest = _compile_spec(spec)
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, json.dumps(spec), targets, stemmed, now, now, digest, STEMMER_VERSION),
+            )
+        return self._fetch(job_id)
+
+    def get(self, job_id: str) -> Job | None:
+        return self._fetch(job_id)
+
+    def update(
+        self,
+        job_id: str,
+        job_description: str | None = None,
+        role_title: str | None = None,
+        keywords: list[str] | None = None,
+        expected_version: int | None = None,
+    ) -> Job | None:
+        """
+        Replace a job's targets and bump its version. None if the job does not exist; raises
+        VersionConflict if expected_version is given and no longer current.
+        """
+        spec = {"job_description": job_description, "role_title": role_title, "keywords": keywords}
+        targets, stemmed, digest = _compile_spec(spec)
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            version = row[0] if expected_version is None else expected_version
+            updated = self._conn.execute(
+                "UPDATE jobs SET version = version + 1, spec = ?, targets = ?, stemmed_targets = ?,"
+                " updated_at = ?, tables = ?, stemmer = ? WHERE id = ? AND version = ?",
+                (
+                    json.dumps(spec),
+                    targets,
+                    stemmed,
+                    time.time(),
+                    digest,
+                    STEMMER_VERSION,
+                    job_id,
+                    version,
+                ),
+            ).rowcount
+            if not updated:
+                current = self._conn.execute(
+                    "SELECT version FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                raise VersionConflict(current[0] if current else row[0])
+        return self._fetch(job_id)
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            return bool(self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,)).rowcount)
+
+    def targets(
+        self, job_id: str, stem: bool = False
+    ) -> tuple[int, frozenset[str], CompiledTargets] | None:
+        """
+        (version, target keywords, compiled targets) of a job's current version under the
+        current tables, or None if it does not exist. Only the version is read from the
+        database when the compiled form is already cached.
+        """
+        column = "stemmed_targets" if stem else "targets"
+        tables = current_tables()
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            key = (job_id, row[0], stem, tables.version)
+            cached = self._compiled.get(key)
+            if cached is not None:
+                self._compiled.move_to_end(key)
+                return row[0], *cached
+            row = self._conn.execute(
+                f"SELECT version, {column}, tables, stemmer, spec FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        version, stored, digest, stemmer, spec = row
+        with pin_tables(tables):
+            if digest != tables.digest or (stem and stemmer != STEMMER_VERSION):
+                built, surface = build_targets(**json.loads(spec), stem=stem)
+                targets = frozenset(built)
+            else:
+                loaded = json.loads(stored)
+                targets = frozenset(loaded)
+                surface = loaded if stem else {}
+            compiled = CompiledTargets(targets, surface_forms=surface)
+        with self._lock:
+            self._compiled[(job_id, version, stem, tables.version)] = (targets, compiled)
+            while len(self._compiled) > COMPILED_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+        return version, targets, compiled
+
+
+_store: JobStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """
+    Process-wide store at JOBS_DB_PATH, opened on first use (FastAPI dependency). Not opened
+    by warm-up, so each prefork worker gets its own connection.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore(os.environ.get("JOBS_DB_PATH", DEFAULT_JOBS_DB_PATH))
+        return _store
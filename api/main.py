@@ -2,11 +2,63 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+import functools
+import hashlib
+import hmac
+import io
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+from xml.etree.ElementTree import ParseError
+
+import anyio
+from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
-from resume_analyzer.analyzer import analyze_and_summary
+from api.jobs import Job, JobStore, VersionConflict, get_job_store
+from api.scheduling import Scheduler, default_lanes, estimate_cost
+from resume_analyzer.analyzer import (
+    analyze_and_summary,
+    analyze_counts,
+    analyze_fragments,
+    score_only,
+    score_only_fragments,
+    score_tokens,
+)
+from resume_analyzer.budget import BudgetExceeded, time_budget
+from resume_analyzer.documents import (
+    detect_format,
+    iter_docx_fragments,
+    iter_html_fragments,
+    iter_text_chunks,
+)
+from resume_analyzer.extract import count_keywords, count_keywords_compact, iter_keywords
+from resume_analyzer.fuzzy import known_vocabulary_index
+from resume_analyzer.models import format_readable_summary
+from resume_analyzer.stem import fold_stems
+from resume_analyzer.tables import (
+    TABLES_FILE_ENV,
+    Tables,
+    TablesWatcher,
+    current_tables,
+    default_tables,
+    load_tables_file,
+    pin_tables,
+    swap_tables,
+    tables_from_data,
+    tables_summary,
+    watch_tables_file,
+    write_tables_file,
+)
 
 # Limits to prevent abuse and keep responses fast (plain-text resumes/JDs rarely exceed these).
 MAX_RESUME_LENGTH = 500_000
@@ -14,11 +66,103 @@ MAX_JOB_DESCRIPTION_LENGTH = 200_000
 MAX_KEYWORDS_ITEMS = 1_000
 MAX_KEYWORD_LENGTH = 200
 MAX_ROLE_TITLE_LENGTH = 500
+MAX_DOCUMENT_BYTES = 5_000_000
+MAX_TABLE_ITEMS = 100_000
+MAX_BATCH_ITEMS = 64
+
+# Shared secret for /admin endpoints (X-Admin-Token); unset disables them.
+ADMIN_TOKEN_ENV = "ADMIN_TOKEN"
+# CPU time budget per analysis in ms (unset: none); X-Time-Budget-Ms can only lower it.
+TIME_BUDGET_MS_ENV = "TIME_BUDGET_MS"
+# Directory where inputs that exceeded their budget are saved for profiling (unset: not saved).
+SLOW_INPUT_DIR_ENV = "SLOW_INPUT_DIR"
+
+T = TypeVar("T")
+logger = logging.getLogger("api.main")
+
+# Exercises every lazily built table and cache (fuzzy index, stem memo, token-ID vocabulary).
+_WARM_UP_RESUME = (
+    "Senior Python3 developer. Built and deployed microservices with Node.js, C++ and .NET; "
+    "managed Kubernetes (k8s) clusters on AWS and GCP; Postgres, MongoDB, Redis, Kafka, "
+    "Elasticsearch; React/TypeScript frontends; REST and GraphQL APIs; machine learning."
+)
+_WARM_UP_KEYWORDS = ["python", "javascript", "kubernetes", "postgresql", "machine learning", "sql"]
+
+_ready = threading.Event()
+# Analysis runs in size-based lanes so large requests cannot hold every worker thread.
+scheduler = Scheduler(default_lanes())
+# Polls TABLES_FILE in this worker (started by the lifespan).
+_tables_watcher: TablesWatcher | None = None
+
+
+def warm_up() -> None:
+    """
+    Build lazily created tables and caches and run each analysis path once, so the first
+    request does no one-off work. Idempotent. The prefork launcher (api/prefork.py) calls this
+    in the parent before forking; single-process servers run it at startup.
+    """
+    if _ready.is_set():
+        return
+    if os.environ.get(TABLES_FILE_ENV):
+        swap_tables(load_tables_file(os.environ[TABLES_FILE_ENV]))
+    known_vocabulary_index()
+    count_keywords_compact(_WARM_UP_RESUME)
+    for stem in (False, True):
+        analyze_and_summary(_WARM_UP_RESUME, keywords=_WARM_UP_KEYWORDS, fuzzy=True, stem=stem)
+        score_only(_WARM_UP_RESUME, job_description=_WARM_UP_RESUME, fuzzy=True, stem=stem)
+    AnalyzeRequest(resume_text=_WARM_UP_RESUME, keywords=_WARM_UP_KEYWORDS)
+    app.openapi()
+    _ready.set()
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global _tables_watcher
+    warm_up()
+    # Started here, not in warm_up(): the watcher thread would not survive a prefork fork.
+    _tables_watcher = watch_tables_file()
+    yield
+    if _tables_watcher is not None:
+        _tables_watcher.stop()
+        _tables_watcher = None
+
+
+class _PinTablesMiddleware:
+    """
+    Serve each request from one tables snapshot (see resume_analyzer/tables.py), whatever
+    swaps happen while it runs. Its version (a per-process counter) and content digest (the
+    same in every worker) are returned in X-Tables-Version and X-Tables-Digest headers.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with pin_tables() as tables:
+            version = str(tables.version).encode("ascii")
+            digest = tables.digest.encode("ascii")
+
+            async def send_with_version(message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = [
+                        *message.get("headers", []),
+                        (b"x-tables-version", version),
+                        (b"x-tables-digest", digest),
+                    ]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_version)
+
 
 app = FastAPI(
     title="Resume Analyzer API",
     description="Evaluate plain-text resume against job description or keyword list. Returns JSON + readable summary.",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +171,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(_PinTablesMiddleware)
 
 
 class AnalyzeRequest(BaseModel):
@@ -53,6 +198,14 @@ class AnalyzeRequest(BaseModel):
         max_length=MAX_KEYWORDS_ITEMS,
         description="Target keywords (optional)",
     )
+    fuzzy: bool = Field(False, description="Also match likely misspellings of target keywords")
+    stem: bool = Field(
+        False, description="Reduce words to base forms before matching (developed/developer)"
+    )
+    score_only: bool = Field(
+        False,
+        description="Return only result.overall_score (no ranking, match lists or summary); faster",
+    )
 
     @field_validator("resume_text")
     @classmethod
@@ -78,13 +231,26 @@ class AnalyzeResponse(BaseModel):
     """Response: JSON result + readable summary."""
 
     result: dict = Field(..., description="Structured analysis (top_keywords, matched, missing, score, etc.)")
-    readable_summary: str = Field(..., description="Human-readable summary")
+    readable_summary: str | None = Field(
+        ..., description="Human-readable summary (null when score_only)"
+    )
 
 
 @app.get("/")
 def root() -> dict:
     """Health / info."""
-    return {"service": "resume-analyzer", "version": "1.0.0", "docs": "/docs", "analyze": "POST /analyze"}
+    return {
+        "service": "resume-analyzer",
+        "version": "1.0.0",
+        "docs": "/docs",
+        "analyze": "POST /analyze",
+        "analyze_file": "POST /analyze/file",
+        "analyze_batch": "POST /analyze/batch",
+        "ready": "GET /ready",
+        "lanes": "GET /metrics/lanes",
+        "jobs": "POST /jobs, GET/PUT/DELETE /jobs/{id}, POST /jobs/{id}/analyze",
+        "tables": "GET/PUT/DELETE /admin/tables (X-Admin-Token)",
+    }
 
 
 @app.get("/health")
@@ -93,27 +259,561 @@ def health() -> dict:
     return {"status": "ok"}
 
 
-@app.post("/analyze", response_model=AnalyzeResponse)
-def analyze_endpoint(body: AnalyzeRequest) -> AnalyzeResponse:
-    """Analyze resume against job description or role + keywords."""
-    # Pydantic validates min/max length and empty resume_text; ensure at least one target provided.
+@app.get("/ready", response_model=None)
+def ready() -> dict | JSONResponse:
+    """Readiness: 200 once warm-up has finished, 503 before (unlike /health, which is liveness)."""
+    if not _ready.is_set():
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {"status": "ready"}
+
+
+@app.get("/metrics/lanes")
+def lane_metrics() -> dict:
+    """Per-lane concurrency and queue time of this worker (see api/scheduling.py)."""
+    return scheduler.stats()
+
+
+def _require_target(
+    job_description: str | None, role_title: str | None, keywords: list[str] | None
+) -> None:
+    """400 unless at least one target (JD, role title or keywords) is non-empty."""
     has_target = (
-        (body.job_description is not None and body.job_description.strip())
-        or (body.keywords and len(body.keywords) > 0)
-        or (body.role_title is not None and body.role_title.strip())
+        (job_description is not None and job_description.strip())
+        or (keywords and len(keywords) > 0)
+        or (role_title is not None and role_title.strip())
     )
     if not has_target:
         raise HTTPException(
             status_code=400,
             detail="Provide at least one of: job_description, role_title, or keywords (non-empty)",
         )
+
+
+def _time_budget(
+    x_time_budget_ms: int | None = Header(
+        None, gt=0, description="CPU time budget in ms; can only lower TIME_BUDGET_MS"
+    ),
+) -> float | None:
+    """CPU seconds one analysis may use: TIME_BUDGET_MS, lowered by X-Time-Budget-Ms; or None."""
+    limits = [ms for ms in (int(os.environ.get(TIME_BUDGET_MS_ENV) or 0), x_time_budget_ms) if ms]
+    return min(limits) / 1000 if limits else None
+
+
+def _budgeted(seconds: float | None, fn: Callable[..., T], *args: Any) -> T:
+    """fn(*args) under a CPU time budget. Runs in the worker thread, whose CPU time is counted."""
+    with time_budget(seconds):
+        return fn(*args)
+
+
+def _over_budget(
+    e: BudgetExceeded, endpoint: str, request: dict, document: bytes | None = None
+) -> HTTPException:
+    """Log (and save, see SLOW_INPUT_DIR) an input that exceeded its budget; the 422 for it."""
+    logger.warning("%s: %s", endpoint, e)
+    _record_slow_input(e, endpoint, request, document)
+    return HTTPException(status_code=422, detail=str(e))
+
+
+def _record_slow_input(
+    e: BudgetExceeded, endpoint: str, request: dict, document: bytes | None
+) -> None:
+    """
+    Save the input as SLOW_INPUT_DIR/<hash>.json (plus <hash>.bin for an uploaded document).
+    The name is a hash of the input, so a repeated slow input overwrites its earlier record.
+    """
+    directory = os.environ.get(SLOW_INPUT_DIR_ENV)
+    if not directory:
+        return
+    payload = json.dumps(request, sort_keys=True).encode("utf-8") + (document or b"")
+    name = hashlib.sha256(payload).hexdigest()[:16]
+    record = {
+        "endpoint": endpoint,
+        "budget_ms": round(e.budget * 1000),
+        "used_ms": round(e.used * 1000),
+        "stage": e.stage,
+        "tables_version": current_tables().version,
+        "recorded_at": time.time(),
+        "request": request,
+        "document": f"{name}.bin" if document is not None else None,
+    }
+    try:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        if document is not None:
+            (path / f"{name}.bin").write_bytes(document)
+        (path / f"{name}.json").write_text(json.dumps(record, indent=2), encoding="utf-8")
+    except OSError:
+        logger.exception("could not save slow input to %s", directory)
+
+
+@app.post("/analyze", response_model=AnalyzeResponse)
+async def analyze_endpoint(
+    body: AnalyzeRequest, budget: float | None = Depends(_time_budget)
+) -> AnalyzeResponse:
+    """Analyze resume against job description or role + keywords."""
+    # Pydantic validates min/max length and empty resume_text; ensure at least one target provided.
+    _require_target(body.job_description, body.role_title, body.keywords)
+    cost = _request_cost(body)
+    try:
+        return await scheduler.run(cost, functools.partial(_budgeted, budget, _analyze_body, body))
+    except BudgetExceeded as e:
+        raise _over_budget(e, "/analyze", body.model_dump()) from e
+
+
+def _request_cost(body: AnalyzeRequest) -> int:
+    return estimate_cost(
+        len(body.resume_text), len(body.job_description or ""), len(body.keywords or [])
+    )
+
+
+def _analyze_body(body: AnalyzeRequest) -> AnalyzeResponse:
+    if body.score_only:
+        score = score_only(
+            body.resume_text,
+            job_description=body.job_description,
+            role_title=body.role_title,
+            keywords=body.keywords,
+            fuzzy=body.fuzzy,
+            stem=body.stem,
+        )
+        return AnalyzeResponse(result={"overall_score": score}, readable_summary=None)
     result, readable_summary = analyze_and_summary(
         resume_text=body.resume_text,
         job_description=body.job_description,
         role_title=body.role_title,
         keywords=body.keywords,
+        fuzzy=body.fuzzy,
+        stem=body.stem,
     )
     return AnalyzeResponse(
-        result=result.model_dump(),
+        result=result.to_dict(),
         readable_summary=readable_summary,
     )
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Request body for POST /analyze/batch: independent /analyze bodies."""
+
+    items: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="POST /analyze request bodies, each validated on its own",
+    )
+
+
+class BatchItemResponse(BaseModel):
+    """One item's outcome: status 200 with the /analyze response, or an error status + detail."""
+
+    status: int
+    result: dict | None = None
+    readable_summary: str | None = None
+    detail: Any = None
+
+
+class BatchAnalyzeResponse(BaseModel):
+    """Response: one entry per request item, in order."""
+
+    results: list[BatchItemResponse]
+
+
+def _analyze_item(seconds: float | None, body: AnalyzeRequest) -> AnalyzeResponse | BudgetExceeded:
+    try:
+        return _budgeted(seconds, _analyze_body, body)
+    except BudgetExceeded as e:
+        return e
+
+
+@app.post("/analyze/batch", response_model=BatchAnalyzeResponse)
+async def analyze_batch_endpoint(
+    body: BatchAnalyzeRequest, budget: float | None = Depends(_time_budget)
+) -> BatchAnalyzeResponse:
+    """
+    Analyze several independent requests in one round trip (used by resume_analyzer.client).
+    Each item is validated and answered on its own: an invalid item gets status 422 or 400
+    in its entry and does not fail the batch. Items run concurrently, each in the lane for its
+    own cost (a large item does not push the small ones into the large lane), and the time
+    budget applies to each item. Results keep the order of the items.
+    """
+    results: list[BatchItemResponse | None] = []
+    valid: list[tuple[int, AnalyzeRequest]] = []
+    for i, item in enumerate(body.items):
+        try:
+            request = AnalyzeRequest.model_validate(item)
+            _require_target(request.job_description, request.role_title, request.keywords)
+        except ValidationError as e:
+            detail = e.errors(include_url=False, include_context=False, include_input=False)
+            results.append(BatchItemResponse(status=422, detail=detail))
+        except HTTPException as e:
+            results.append(BatchItemResponse(status=e.status_code, detail=e.detail))
+        else:
+            results.append(None)
+            valid.append((i, request))
+
+    async def run_item(i: int, request: AnalyzeRequest) -> None:
+        work = functools.partial(_analyze_item, budget, request)
+        response = await scheduler.run(_request_cost(request), work)
+        if isinstance(response, BudgetExceeded):
+            error = _over_budget(response, "/analyze/batch", request.model_dump())
+            results[i] = BatchItemResponse(status=error.status_code, detail=error.detail)
+        else:
+            results[i] = BatchItemResponse(status=200, **response.model_dump())
+
+    async with anyio.create_task_group() as tg:
+        for i, request in valid:
+            tg.start_soon(run_item, i, request)
+    return BatchAnalyzeResponse(results=results)
+
+
+def _charset(content_type: str | None) -> str:
+    """charset parameter of a Content-Type header (default utf-8)."""
+    for param in (content_type or "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip('"')
+    return "utf-8"
+
+
+@app.post("/analyze/file", response_model=AnalyzeResponse)
+async def analyze_file_endpoint(
+    resume: UploadFile = File(..., description="Resume as .docx, .html or plain text"),
+    job_description: str | None = Form(None, max_length=MAX_JOB_DESCRIPTION_LENGTH),
+    role_title: str | None = Form(None, max_length=MAX_ROLE_TITLE_LENGTH),
+    keywords: list[str] | None = Form(None, max_length=MAX_KEYWORDS_ITEMS),
+    fuzzy: bool = Form(False),
+    stem: bool = Form(False),
+    score_only: bool = Form(False),
+    budget: float | None = Depends(_time_budget),
+) -> AnalyzeResponse:
+    """Analyze an uploaded resume document; format is taken from its content type or file name."""
+    if resume.size is not None and resume.size > MAX_DOCUMENT_BYTES:
+        raise HTTPException(status_code=413, detail=f"resume exceeds {MAX_DOCUMENT_BYTES} bytes")
+    keywords = [k for k in keywords or [] if k.strip()] or None
+    if keywords and any(len(k) > MAX_KEYWORD_LENGTH for k in keywords):
+        raise HTTPException(
+            status_code=422, detail=f"keywords exceed max length {MAX_KEYWORD_LENGTH}"
+        )
+    _require_target(job_description, role_title, keywords)
+    options = {"job_description": job_description, "role_title": role_title, "keywords": keywords}
+    # Upload size stands in for text length (compressed .docx is underestimated, but ordered).
+    cost = estimate_cost(resume.size or 0, len(job_description or ""), len(keywords or []))
+    analyze_upload = functools.partial(
+        _analyze_upload, resume, options, fuzzy=fuzzy, stem=stem, score_only=score_only
+    )
+    try:
+        return await scheduler.run(cost, functools.partial(_budgeted, budget, analyze_upload))
+    except BudgetExceeded as e:
+        request = {
+            **options,
+            "fuzzy": fuzzy,
+            "stem": stem,
+            "score_only": score_only,
+            "filename": resume.filename,
+            "content_type": resume.content_type,
+        }
+        resume.file.seek(0)
+        raise _over_budget(e, "/analyze/file", request, resume.file.read()) from e
+
+
+def _analyze_upload(
+    resume: UploadFile, options: dict, fuzzy: bool, stem: bool, score_only: bool
+) -> AnalyzeResponse:
+    fmt = detect_format(resume.filename, resume.content_type)
+    try:
+        if fmt == "docx":
+            fragments = iter_docx_fragments(resume.file)
+        else:
+            text_stream = io.TextIOWrapper(
+                resume.file, encoding=_charset(resume.content_type), errors="replace"
+            )
+            chunks = iter_text_chunks(text_stream)
+            fragments = iter_html_fragments(chunks) if fmt == "html" else chunks
+        if score_only:
+            score = score_only_fragments(fragments, **options, fuzzy=fuzzy, stem=stem)
+            return AnalyzeResponse(result={"overall_score": score}, readable_summary=None)
+        result = analyze_fragments(fragments, **options, fuzzy=fuzzy, stem=stem)
+    except (zipfile.BadZipFile, KeyError, ParseError, LookupError) as e:
+        raise HTTPException(status_code=422, detail=f"could not read {fmt} resume: {e}") from e
+    return AnalyzeResponse(
+        result=result.to_dict(),
+        readable_summary=format_readable_summary(result),
+    )
+
+
+class JobSpec(BaseModel):
+    """Request body for POST /jobs and PUT /jobs/{id}: the targets to register."""
+
+    job_description: str | None = Field(
+        None,
+        max_length=MAX_JOB_DESCRIPTION_LENGTH,
+        description="Full job description text",
+    )
+    role_title: str | None = Field(
+        None,
+        max_length=MAX_ROLE_TITLE_LENGTH,
+        description="Role title (optional)",
+    )
+    keywords: list[str] | None = Field(
+        None,
+        max_length=MAX_KEYWORDS_ITEMS,
+        description="Target keywords (optional)",
+    )
+
+    @field_validator("keywords")
+    @classmethod
+    def keywords_item_length(cls, v: list[str] | None) -> list[str] | None:
+        for i, k in enumerate(v or []):
+            if len(k) > MAX_KEYWORD_LENGTH:
+                raise ValueError(f"keywords[{i}] exceeds max length {MAX_KEYWORD_LENGTH}")
+        return v
+
+
+class JobResponse(BaseModel):
+    """A registered job. `version` is also sent as the ETag header."""
+
+    id: str
+    version: int
+    job_description: str | None
+    role_title: str | None
+    keywords: list[str] | None
+    target_count: int = Field(..., description="Number of target keywords (without stemming)")
+    created_at: float = Field(..., description="Unix time")
+    updated_at: float = Field(..., description="Unix time")
+
+
+class JobAnalyzeRequest(BaseModel):
+    """Request body for POST /jobs/{id}/analyze: the resume and analysis options."""
+
+    resume_text: str = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_RESUME_LENGTH,
+        description="Plain text resume (required, non-empty after strip)",
+    )
+    fuzzy: bool = Field(False, description="Also match likely misspellings of target keywords")
+    stem: bool = Field(
+        False, description="Reduce words to base forms before matching (developed/developer)"
+    )
+    score_only: bool = Field(False, description="Return only result.overall_score; faster")
+
+    @field_validator("resume_text")
+    @classmethod
+    def resume_text_not_empty_after_strip(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("resume_text is required and cannot be empty or whitespace")
+        return v
+
+
+def _etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _expected_version(if_match: str | None, current: int) -> int | None:
+    """
+    Version an If-Match header pins the request to (None when absent or "*"); 412 if it names
+    no current ETag.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    if _etag(current) not in {tag.strip() for tag in if_match.split(",")}:
+        raise HTTPException(
+            status_code=412, detail=f"job has changed; current ETag is {_etag(current)}"
+        )
+    return current
+
+
+def _job_response(job: Job, response: Response) -> JobResponse:
+    response.headers["ETag"] = _etag(job.version)
+    return JobResponse(
+        id=job.id,
+        version=job.version,
+        job_description=job.job_description,
+        role_title=job.role_title,
+        keywords=job.keywords,
+        target_count=job.target_count,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+def _spec_cost(spec: JobSpec) -> int:
+    return estimate_cost(0, len(spec.job_description or ""), len(spec.keywords or []))
+
+
+@app.post("/jobs", response_model=JobResponse, status_code=201)
+async def create_job(
+    spec: JobSpec, response: Response, store: JobStore = Depends(get_job_store)
+) -> JobResponse:
+    """Register targets once; analyze resumes against them with POST /jobs/{id}/analyze."""
+    _require_target(spec.job_description, spec.role_title, spec.keywords)
+    job = await scheduler.run(
+        _spec_cost(spec), functools.partial(store.create, **spec.model_dump())
+    )
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return _job_response(job, response)
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    store: JobStore = Depends(get_job_store),
+) -> JobResponse | Response:
+    """A registered job; 304 when If-None-Match names its current ETag."""
+    job = store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    if if_none_match and _etag(job.version) in {t.strip() for t in if_none_match.split(",")}:
+        return Response(status_code=304, headers={"ETag": _etag(job.version)})
+    return _job_response(job, response)
+
+
+@app.put("/jobs/{job_id}", response_model=JobResponse)
+async def update_job(
+    job_id: str,
+    spec: JobSpec,
+    response: Response,
+    if_match: str | None = Header(None),
+    store: JobStore = Depends(get_job_store),
+) -> JobResponse:
+    """Replace a job's targets and bump its version; 412 if If-Match names a stale ETag."""
+    _require_target(spec.job_description, spec.role_title, spec.keywords)
+    job = store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    expected = _expected_version(if_match, job.version)
+    update = functools.partial(
+        store.update, job_id, **spec.model_dump(), expected_version=expected
+    )
+    try:
+        job = await scheduler.run(_spec_cost(spec), update)
+    except VersionConflict as e:
+        raise HTTPException(
+            status_code=412, detail=f"job has changed; current ETag is {_etag(e.current)}"
+        ) from e
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return _job_response(job, response)
+
+
+@app.delete("/jobs/{job_id}", status_code=204)
+def delete_job(job_id: str, store: JobStore = Depends(get_job_store)) -> Response:
+    if not store.delete(job_id):
+        raise HTTPException(status_code=404, detail="job not found")
+    return Response(status_code=204)
+
+
+@app.post("/jobs/{job_id}/analyze", response_model=AnalyzeResponse)
+async def analyze_job(
+    job_id: str,
+    body: JobAnalyzeRequest,
+    response: Response,
+    if_match: str | None = Header(None),
+    store: JobStore = Depends(get_job_store),
+    budget: float | None = Depends(_time_budget),
+) -> AnalyzeResponse:
+    """
+    Analyze a resume against a registered job. The response ETag is the job version used;
+    send If-Match to get 412 instead of results for a job that changed since you read it.
+    """
+    # The job description is already compiled, so the resume dominates the cost.
+    analyze = functools.partial(_analyze_job, store, job_id, body, if_match)
+    cost = estimate_cost(len(body.resume_text))
+    try:
+        version, result = await scheduler.run(cost, functools.partial(_budgeted, budget, analyze))
+    except BudgetExceeded as e:
+        raise _over_budget(e, f"/jobs/{job_id}/analyze", body.model_dump()) from e
+    response.headers["ETag"] = _etag(version)
+    return result
+
+
+def _analyze_job(
+    store: JobStore, job_id: str, body: JobAnalyzeRequest, if_match: str | None
+) -> tuple[int, AnalyzeResponse]:
+    found = store.targets(job_id, stem=body.stem)
+    if found is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    version, targets, compiled = found
+    _expected_version(if_match, version)
+    if body.score_only:
+        score = score_tokens(iter_keywords(body.resume_text, body.stem), compiled, body.fuzzy)
+        return version, AnalyzeResponse(result={"overall_score": score}, readable_summary=None)
+    counts = count_keywords(body.resume_text)
+    resume_surface: dict[str, str] = {}
+    if body.stem:
+        counts, resume_surface = fold_stems(counts)
+    result = analyze_counts(
+        counts,
+        targets,
+        fuzzy=body.fuzzy,
+        resume_surface=resume_surface,
+        target_surface=compiled.surface_forms,
+    )
+    return version, AnalyzeResponse(
+        result=result.to_dict(), readable_summary=format_readable_summary(result)
+    )
+
+
+class TablesUpdate(BaseModel):
+    """Request body for PUT /admin/tables: omitted tables keep their built-in contents."""
+
+    special_tokens: list[str] | None = Field(
+        None, max_length=MAX_TABLE_ITEMS, description="Tokens kept whole (c++, node.js)"
+    )
+    stopwords: list[str] | None = Field(None, max_length=MAX_TABLE_ITEMS)
+    synonyms: dict[str, list[str]] | None = Field(
+        None, max_length=MAX_TABLE_ITEMS, description="Canonical term -> variants"
+    )
+
+
+def _require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """403 while ADMIN_TOKEN is unset, 401 unless X-Admin-Token matches it."""
+    expected = os.environ.get(ADMIN_TOKEN_ENV)
+    if not expected:
+        raise HTTPException(status_code=403, detail="admin endpoints are disabled")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=401, detail="invalid admin token")
+
+
+@app.get("/admin/tables", dependencies=[Depends(_require_admin)])
+def get_tables() -> dict:
+    """Installed tables version of this worker, and the watched file's state."""
+    watcher = _tables_watcher
+    return {
+        **tables_summary(current_tables()),
+        "watching": str(watcher.path) if watcher else None,
+        "last_error": watcher.last_error if watcher else None,
+    }
+
+
+def _publish_tables(tables: Tables) -> dict:
+    """
+    Install tables everywhere: with TABLES_FILE set, write them to it (every worker's watcher
+    loads them) and swap them in here at once; otherwise swap them into this process only.
+    """
+    path = os.environ.get(TABLES_FILE_ENV)
+    if path:
+        write_tables_file(path, tables)
+    return {**tables_summary(swap_tables(tables)), "written_to": path or None}
+
+
+@app.put("/admin/tables", dependencies=[Depends(_require_admin)])
+async def put_tables(body: TablesUpdate) -> dict:
+    """
+    Compile new tables in a background thread and publish them (see _publish_tables). Requests
+    in flight finish on the old tables; new ones never wait for the compile. Compare `digest`
+    with the X-Tables-Digest header to see which tables served a request.
+    """
+    data = body.model_dump(exclude_none=True)
+    try:
+        tables = await anyio.to_thread.run_sync(lambda: tables_from_data(data, source="admin"))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return await anyio.to_thread.run_sync(_publish_tables, tables)
+
+
+@app.delete("/admin/tables", dependencies=[Depends(_require_admin)])
+async def delete_tables() -> dict:
+    """Publish the built-in tables (see _publish_tables)."""
+    return await anyio.to_thread.run_sync(_publish_tables, default_tables())
@@ -0,0 +1,264 @@
+"""Pre-fork launcher: warm up once in the parent, freeze the heap, then fork uvicorn workers.
+
+The parent imports the app, builds every table and cache (api.main.warm_up), collects garbage
+and calls gc.freeze() so those objects move to the permanent generation. The cyclic GC in the
+workers then never touches their headers, so the pages stay shared copy-on-write instead of
+being duplicated per worker. Workers accept on one listening socket bound by the parent; the
+parent restarts workers that die and forwards SIGTERM/SIGINT for a graceful shutdown. Workers
+that die soon after starting are restarted with exponential backoff, and after
+MAX_RAPID_FAILURES of those in a row the parent shuts down and exits with status 1, so a
+supervisor sees the crash loop instead of a parent forking forever.
+SIGUSR1 logs per-worker memory (RSS, PSS, shared and private, from /proc on Linux).
+
+    python -m api.prefork --workers 4 --port 8000
+    WEB_CONCURRENCY=4 PORT=8000 python -m api.prefork
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from types import FrameType
+
+logger = logging.getLogger("api.prefork")
+
+# A worker that exits within this many seconds of starting counts as a rapid failure.
+MIN_WORKER_UPTIME = 10.0
+# Delay before restarting after the first rapid failure; doubles per further one, up to the max.
+RESPAWN_BACKOFF = 0.5
+MAX_RESPAWN_BACKOFF = 30.0
+# Consecutive rapid failures (of any workers) after which the parent gives up.
+MAX_RAPID_FAILURES = 5
+
+# /proc/<pid>/smaps_rollup fields (kB) summed into each report key.
+_SMAPS_FIELDS = {
+    "rss_kb": ("Rss",),
+    "pss_kb": ("Pss",),
+    "shared_kb": ("Shared_Clean", "Shared_Dirty"),
+    "private_kb": ("Private_Clean", "Private_Dirty"),
+}
+
+
+def process_memory(pid: int) -> dict[str, int] | None:
+    """
+    Memory of a process in kB: rss_kb, plus pss_kb/shared_kb/private_kb where the kernel
+    provides smaps_rollup. None when /proc is unavailable (non-Linux) or the process is gone.
+    """
+    proc = Path("/proc") / str(pid)
+    try:
+        text = (proc / "smaps_rollup").read_text()
+    except OSError:
+        text = None
+    if text is not None:
+        fields: dict[str, int] = {}
+        for line in text.splitlines():
+            name, _, rest = line.partition(":")
+            if rest.strip().endswith("kB"):
+                fields[name] = int(rest.split()[0])
+        return {key: sum(fields.get(n, 0) for n in names) for key, names in _SMAPS_FIELDS.items()}
+    try:
+        status = (proc / "status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return {"rss_kb": int(line.split()[1])}
+    return None
+
+
+def respawn_delay(rapid_failures: int) -> float:
+    """Seconds to wait before restarting a worker after this many consecutive rapid failures."""
+    if rapid_failures <= 0:
+        return 0.0
+    return min(MAX_RESPAWN_BACKOFF, RESPAWN_BACKOFF * 2 ** (rapid_failures - 1))
+
+
+def describe_exit(status: int) -> str:
+    """An os.wait() status as "exit code N" or "killed by signal N"."""
+    code = os.waitstatus_to_exitcode(status)
+    return f"killed by signal {-code}" if code < 0 else f"exit code {code}"
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Listening TCP socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkServer:
+    """Parent process: preload and warm up, freeze, fork `workers` uvicorn servers, supervise."""
+
+    def __init__(
+        self,
+        workers: int,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        freeze: bool = True,
+        log_level: str = "info",
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.freeze = freeze
+        self.log_level = log_level
+        # Live workers: pid -> time.monotonic() at fork.
+        self.pids: dict[int, float] = {}
+        self.rapid_failures = 0
+        self._sock: socket.socket | None = None
+        self._stopping = False
+        self._wakeup = threading.Event()
+
+    def preload(self) -> None:
+        """Import the app and warm it up in the parent, then freeze the heap."""
+        from api.main import warm_up
+
+        warm_up()
+        gc.collect()
+        if self.freeze:
+            gc.freeze()
+        logger.info(
+            "preloaded in parent %d (%d objects frozen)", os.getpid(), gc.get_freeze_count()
+        )
+
+    def _run_worker(self) -> None:
+        """Child side of fork(): serve until told to stop, then exit without returning."""
+        import uvicorn
+
+        from api.main import app
+
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1, signal.SIGCHLD):
+            signal.signal(sig, signal.SIG_DFL)
+        code = 0
+        try:
+            config = uvicorn.Config(app, log_level=self.log_level, lifespan="on")
+            uvicorn.Server(config).run(sockets=[self._sock])
+        except BaseException:
+            logger.exception("worker %d crashed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self.pids[pid] = time.monotonic()
+        logger.info("started worker %d", pid)
+        return pid
+
+    def memory_report(self) -> dict[int, dict[str, int] | None]:
+        """Per-worker memory (see process_memory), keyed by pid."""
+        return {pid: process_memory(pid) for pid in sorted(self.pids)}
+
+    def _log_memory(self, *_: object) -> None:
+        parent = process_memory(os.getpid())
+        logger.info("parent %d: %s", os.getpid(), parent)
+        for pid, mem in self.memory_report().items():
+            logger.info("worker %d: %s", pid, mem)
+
+    def _stop(self, signum: int, _frame: FrameType | None) -> None:
+        self._stopping = True
+        self._wakeup.set()
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM if signum == signal.SIGINT else signum)
+            except ProcessLookupError:
+                pass
+
+    def _restart(self, pid: int, status: int, started: float) -> None:
+        """Restart after worker pid exited, backing off (or giving up) if it died young."""
+        if time.monotonic() - started >= MIN_WORKER_UPTIME:
+            self.rapid_failures = 0
+        else:
+            self.rapid_failures += 1
+        if self.rapid_failures >= MAX_RAPID_FAILURES:
+            logger.error(
+                "worker %d exited (%s); %d workers in a row died within %.0fs of "
+                "starting, shutting down",
+                pid,
+                describe_exit(status),
+                self.rapid_failures,
+                MIN_WORKER_UPTIME,
+            )
+            self._stop(signal.SIGTERM, None)
+            return
+        delay = respawn_delay(self.rapid_failures)
+        logger.warning(
+            "worker %d exited (%s); restarting in %.1fs", pid, describe_exit(status), delay
+        )
+        # Returns early when SIGTERM/SIGINT arrives during the backoff.
+        if delay and self._wakeup.wait(delay):
+            return
+        self.spawn()
+
+    def run(self) -> int:
+        """
+        Bind, preload, fork and supervise until SIGTERM/SIGINT; returns after workers exit.
+        Returns the exit status: 0, or 1 when workers kept dying right after starting.
+        """
+        self._sock = bind_socket(self.host, self.port)
+        logger.info("listening on %s:%d with %d workers", self.host, self.port, self.workers)
+        self.preload()
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGUSR1, self._log_memory)
+        for _ in range(self.workers):
+            self.spawn()
+        while self.pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            started = self.pids.pop(pid, None)
+            if started is not None and not self._stopping:
+                self._restart(pid, status, started)
+        self._sock.close()
+        return 1 if self.rapid_failures >= MAX_RAPID_FAILURES else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", "0")) or os.cpu_count() or 1,
+        help="Worker processes (default: $WEB_CONCURRENCY or the CPU count)",
+    )
+    parser.add_argument(
+        "--no-freeze", action="store_true", help="Skip gc.freeze() (for comparison)"
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    if not hasattr(os, "fork"):
+        sys.exit("api.prefork needs os.fork(); use uvicorn directly on this platform")
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(name)s: %(message)s")
+    server = PreforkServer(
+        args.workers, args.host, args.port, freeze=not args.no_freeze, log_level=args.log_level
+    )
+    sys.exit(server.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Size-aware scheduling: route analysis work to lanes with separate concurrency limits.
+
+Request cost varies by orders of magnitude (a 2 KB resume vs 500 KB with 1,000 keywords), so
+one shared FIFO thread pool lets a burst of large requests delay every small one. Each
+request gets a cost estimate from its input sizes and is run in the first lane whose max_cost
+covers it. A lane admits at most `limit` requests at a time (anyio CapacityLimiter) and
+records how long requests waited for a slot, exposed via GET /metrics/lanes.
+
+Stats are per process (each prefork worker has its own) and only touched from the event loop.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import anyio
+import anyio.to_thread
+
+T = TypeVar("T")
+
+# Relative cost of one target keyword vs one character of input (synonym expansion,
+# matching and, with fuzzy, an index lookup per missing target).
+KEYWORD_COST = 50
+# Requests estimated above this go to the large lane.
+DEFAULT_LARGE_REQUEST_COST = 50_000
+DEFAULT_SMALL_LANE_LIMIT = 8
+DEFAULT_LARGE_LANE_LIMIT = 2
+# Queue times kept per lane for percentiles.
+QUEUE_SAMPLE_SIZE = 1024
+
+
+def estimate_cost(resume_chars: int, job_description_chars: int = 0, keyword_count: int = 0) -> int:
+    """Rough relative cost of one analysis: characters to tokenize plus weighted keywords."""
+    return resume_chars + job_description_chars + KEYWORD_COST * keyword_count
+
+
+@dataclass(frozen=True)
+class LaneConfig:
+    """A lane takes requests with cost <= max_cost and runs at most `limit` at once."""
+
+    name: str
+    max_cost: float
+    limit: int
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(p / 100 * len(sorted_values))) - 1]
+
+
+class Lane:
+    """One concurrency-limited lane and its queue-time statistics."""
+
+    def __init__(self, config: LaneConfig) -> None:
+        self.config = config
+        self.limiter = anyio.CapacityLimiter(config.limit)
+        self.waiting = 0
+        self.admitted = 0
+        self.completed = 0
+        self._queue_total = 0.0
+        self._queue_max = 0.0
+        self._queue_recent: deque[float] = deque(maxlen=QUEUE_SAMPLE_SIZE)
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        """Wait for a slot in this lane, then run fn in a worker thread."""
+        enqueued = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self.limiter.acquire()
+        finally:
+            self.waiting -= 1
+        try:
+            waited = time.perf_counter() - enqueued
+            self.admitted += 1
+            self._queue_total += waited
+            self._queue_max = max(self._queue_max, waited)
+            self._queue_recent.append(waited)
+            return await anyio.to_thread.run_sync(fn)
+        finally:
+            self.completed += 1
+            self.limiter.release()
+
+    def stats(self) -> dict[str, float | int | str]:
+        """Slot usage and queue time (ms; percentiles over the last QUEUE_SAMPLE_SIZE)."""
+        recent = sorted(self._queue_recent)
+        admitted = self.admitted
+        return {
+            "max_cost": "inf" if math.isinf(self.config.max_cost) else self.config.max_cost,
+            "limit": self.config.limit,
+            "in_flight": self.limiter.borrowed_tokens,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "queue_ms_mean": round(self._queue_total / admitted * 1000, 3) if admitted else 0.0,
+            "queue_ms_p50": round(_percentile(recent, 50) * 1000, 3),
+            "queue_ms_p95": round(_percentile(recent, 95) * 1000, 3),
+            "queue_ms_max": round(self._queue_max * 1000, 3),
+        }
+
+
+class Scheduler:
+    """Routes work to the first lane whose max_cost covers the estimated cost."""
+
+    def __init__(self, lanes: list[LaneConfig] | tuple[LaneConfig, ...]) -> None:
+        ordered = sorted(lanes, key=lambda c: c.max_cost)
+        if not ordered or not math.isinf(ordered[-1].max_cost):
+            raise ValueError("one lane must accept any cost (max_cost=inf)")
+        self.lanes = [Lane(c) for c in ordered]
+
+    def lane_for(self, cost: float) -> Lane:
+        return next(lane for lane in self.lanes if cost <= lane.config.max_cost)
+
+    async def run(self, cost: float, fn: Callable[[], T]) -> T:
+        return await self.lane_for(cost).run(fn)
+
+    def stats(self) -> dict[str, dict[str, float | int | str]]:
+        return {lane.config.name: lane.stats() for lane in self.lanes}
+
+
+def default_lanes() -> tuple[LaneConfig, ...]:
+    """Lanes from LARGE_REQUEST_COST, SMALL_LANE_LIMIT and LARGE_LANE_LIMIT (env) or defaults."""
+    threshold = int(os.environ.get("LARGE_REQUEST_COST", DEFAULT_LARGE_REQUEST_COST))
+    return (
+        LaneConfig(
+            "small", threshold, int(os.environ.get("SMALL_LANE_LIMIT", DEFAULT_SMALL_LANE_LIMIT))
+        ),
+        LaneConfig(
+            "large", math.inf, int(os.environ.get("LARGE_LANE_LIMIT", DEFAULT_LARGE_LANE_LIMIT))
+        ),
+    )
@@ -0,0 +1 @@
+"""Benchmarks for resume-analyzer. Run from the repo root: python -m benchmarks.<name>."""
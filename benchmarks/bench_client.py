@@ -0,0 +1,57 @@
+"""Per-call cost of the API client: a new connection per call vs pooled vs batched.
+
+Starts uvicorn for api.main:app on a free port in this process and sends --requests small
+/analyze calls three ways: httpx.post() per call (a new connection each time, like ad-hoc
+requests.post), Client.analyze() over pooled keep-alive connections, and
+Client.analyze_many() through POST /analyze/batch.
+
+    python -m benchmarks.bench_client --requests 300 --resume-kb 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import httpx
+
+from api.main import app
+from benchmarks.common import synthetic_resume
+from benchmarks.loadtest import _UvicornThread
+from resume_analyzer.client import Client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--resume-kb", type=int, default=2)
+    args = parser.parse_args()
+
+    body = {
+        "resume_text": synthetic_resume(args.resume_kb * 1024),
+        "keywords": ["python", "kafka", "kubernetes", "postgresql", "terraform"],
+    }
+    bodies = [body] * args.requests
+    with _UvicornThread(app) as base, Client(base) as client:
+        cases: dict[str, Callable[[], object]] = {
+            "new connection per call": lambda: [
+                httpx.post(f"{base}/analyze", json=body).raise_for_status() for _ in bodies
+            ],
+            "Client.analyze (pooled)": lambda: [client.analyze(**body) for _ in bodies],
+            "Client.analyze_many (batched)": lambda: client.analyze_many(bodies),
+        }
+        client.analyze(**body)  # warm up the server and the pool
+        print(f"{args.requests} calls, {args.resume_kb} KB resume")
+        print(f"{'path':<32} {'total s':>9} {'ms/call':>9}")
+        for name, fn in cases.items():
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<32} {elapsed:>9.2f} {elapsed / args.requests * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Corpus access: readlines() vs streaming lines vs the memory-mapped CorpusReader.
+
+Writes a synthetic JSONL corpus to a temporary directory, then measures time and peak Python
+allocations (tracemalloc; mmap'ed pages are page cache, not heap) for a full scan, the cost of
+building vs loading the sidecar index, and random access to single records.
+
+    python -m benchmarks.bench_corpus --records 20000 --resume-kb 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.corpus import CorpusReader
+
+
+def measure(fn: Callable[[], Any]) -> tuple[float, float]:
+    """(seconds, peak traced MB) of one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def readlines_scan(path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    return sum(len(json.loads(line)["resume_text"]) for line in lines if line.strip())
+
+
+def streaming_scan(path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        return sum(len(json.loads(line)["resume_text"]) for line in f if line.strip())
+
+
+def mmap_scan(path: Path) -> int:
+    with CorpusReader(path) as reader:
+        return sum(len(record["resume_text"]) for record in reader)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--resume-kb", type=float, default=4)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corpus.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.records):
+                text = synthetic_resume(int(args.resume_kb * 1024), seed=i % 100)
+                f.write(json.dumps({"id": i, "resume_text": text}) + "\n")
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"corpus: {args.records:,} records, {size_mb:.1f} MB")
+
+        build, _ = measure(lambda: CorpusReader(path).close())
+        load, _ = measure(lambda: CorpusReader(path).close())
+        print(f"index: build {build * 1000:.1f} ms, load {load * 1000:.2f} ms")
+
+        print("{:<22} {:>9} {:>14}".format("full scan", "seconds", "peak heap MB"))
+        for name, scan in (
+            ("readlines()", readlines_scan),
+            ("for line in file", streaming_scan),
+            ("CorpusReader", mmap_scan),
+        ):
+            seconds, peak = measure(lambda scan=scan: scan(path))
+            print(f"{name:<22} {seconds:>9.3f} {peak:>14.1f}")
+
+        rng = random.Random(0)
+        picks = [rng.randrange(args.records) for _ in range(args.lookups)]
+        with CorpusReader(path) as reader:
+            start = time.perf_counter()
+            for i in picks:
+                reader[i]
+            per_lookup = (time.perf_counter() - start) / args.lookups
+        print(f"random access: {per_lookup * 1e6:.1f} us per record")
+
+
+if __name__ == "__main__":
+    main()
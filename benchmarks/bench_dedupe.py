@@ -0,0 +1,99 @@
+"""Near-duplicate skipping on a synthetic corpus with a known duplicate rate.
+
+Each duplicate is an earlier resume with a few words changed. Reports detection
+precision/recall and the analysis time saved by reusing results, net of MinHash cost.
+
+    python -m benchmarks.bench_dedupe --docs 2000 --dup-rate 0.3 --threshold 0.9
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from benchmarks.common import sample_jd, synthetic_resume
+from resume_analyzer.analyzer import analyze_counts, build_target_keywords
+from resume_analyzer.cache import TokenizedText
+from resume_analyzer.dedupe import LSHIndex, MinHasher
+
+
+def build_corpus(
+    docs: int, dup_rate: float, size: int, seed: int
+) -> tuple[list[str], list[int | None]]:
+    """Resumes plus, for each, the index of the original it duplicates (None for originals)."""
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(5_000)]
+    texts: list[str] = []
+    origin: list[int | None] = []
+    for i in range(docs):
+        originals = [j for j, o in enumerate(origin) if o is None]
+        if originals and rng.random() < dup_rate:
+            src = rng.choice(originals)
+            words = texts[src].split()
+            for _ in range(max(1, len(words) // 100)):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            texts.append(" ".join(words))
+            origin.append(src)
+        else:
+            texts.append(synthetic_resume(size, seed=seed * 100_003 + i, vocab=vocab))
+            origin.append(None)
+    return texts, origin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--docs", type=int, default=1_000)
+    parser.add_argument("--dup-rate", type=float, default=0.3)
+    parser.add_argument("--size", type=int, default=6_000, help="Resume size in characters")
+    parser.add_argument("--threshold", type=float, default=0.9)
+    parser.add_argument(
+        "--keywords", type=int, default=0, help="Extra target keywords (analysis cost)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    texts, origin = build_corpus(args.docs, args.dup_rate, args.size, args.seed)
+    tokenized = [TokenizedText.from_text(t) for t in texts]
+    extra = [f"term{i}" for i in range(0, 10 * args.keywords, 10)]
+    target = build_target_keywords(job_description=sample_jd(), keywords=extra)
+
+    start = time.perf_counter()
+    for tok in tokenized:
+        analyze_counts(tok.counts, target, resume_forms=tok.forms)
+    baseline = time.perf_counter() - start
+
+    hasher, index = MinHasher(), LSHIndex(args.threshold)
+    detected: list[int | None] = []
+    start = time.perf_counter()
+    for i, tok in enumerate(tokenized):
+        signature = hasher.signature(tok.counts)
+        match = index.query(signature)
+        if match is None:
+            index.insert(i, signature)
+            analyze_counts(tok.counts, target, resume_forms=tok.forms)
+            detected.append(None)
+        else:
+            detected.append(int(match[0]))  # type: ignore[arg-type]
+    with_dedupe = time.perf_counter() - start
+
+    true_dups = sum(o is not None for o in origin)
+    hits = sum(d is not None for d in detected)
+    correct = sum(d is not None and o is not None for d, o in zip(detected, origin))
+    precision = correct / hits if hits else 1.0
+    recall = correct / true_dups if true_dups else 1.0
+    print(
+        f"corpus: {args.docs} resumes, {true_dups} duplicates ({true_dups / args.docs:.0%}), ",
+        end="",
+    )
+    print(f"{len(target)} target keywords, threshold {args.threshold}")
+    print(f"detected {hits}: precision {precision:.3f}, recall {recall:.3f}")
+    print(f"analysis only:       {baseline * 1000:9.1f} ms")
+    saved = 1 - with_dedupe / baseline
+    print(f"minhash + analysis:  {with_dedupe * 1000:9.1f} ms  ({saved:+.0%} saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Top keywords of adversarial text: full sort vs heap selection vs a heavy-hitter summary.
+
+The resume mixes real skills with random unique tokens (garbage or adversarial input). Reports
+time and tracemalloc peak for counting + ranking, and whether each path's top keywords match
+the exact ranking.
+
+python -m benchmarks.bench_heavy_hitters --size 500000 --garbage 0.8
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+from collections.abc import Callable
+
+from benchmarks.bench_token_ids import measure
+from benchmarks.common import synthetic_resume
+from resume_analyzer.extract import (
+    DEFAULT_TOP_N,
+    MAX_EXACT_KEYWORDS,
+    count_keywords,
+    count_keywords_bounded,
+    rank_keywords,
+)
+
+
+def adversarial_resume(size: int, garbage: float, seed: int = 0) -> str:
+    """synthetic_resume() with a garbage fraction of its words replaced by unique tokens."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase + string.digits
+    words = synthetic_resume(size, seed=seed).split()
+    for i in range(len(words)):
+        if rng.random() < garbage:
+            words[i] = "".join(rng.choices(letters, k=len(words[i]) + 3))
+    return " ".join(words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=500_000, help="Resume size in characters")
+    parser.add_argument("--garbage", type=float, default=0.8, help="Fraction of unique tokens")
+    parser.add_argument("--capacity", type=int, default=MAX_EXACT_KEYWORDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = adversarial_resume(args.size, args.garbage)
+    counts = count_keywords(text)
+    expected = rank_keywords(counts)
+    summary = count_keywords_bounded(text, capacity=args.capacity)
+
+    def full_sort() -> list[tuple[str, int]]:
+        c = count_keywords(text)
+        return sorted(c.items(), key=lambda x: (-x[1], x[0]))[:DEFAULT_TOP_N]
+
+    cases: dict[str, Callable[[], list[tuple[str, int]]]] = {
+        "Counter + full sort (before)": full_sort,
+        "Counter + heap selection": lambda: rank_keywords(count_keywords(text)),
+        f"heavy hitters, capacity {args.capacity:,}": lambda: rank_keywords(
+            count_keywords_bounded(text, capacity=args.capacity)
+        ),
+    }
+    print(
+        f"resume: {len(text):,} chars, {sum(counts.values()):,} keywords, "
+        f"{len(counts):,} distinct; summary error bound {summary.error} "
+        f"(<= N / (capacity + 1) = {summary.total // (args.capacity + 1)})"
+    )
+    print(f"{'path':<34} {'time ms':>10} {'peak KB':>10} {'same terms':>11}")
+    for name, fn in cases.items():
+        ms, kb = measure(fn, args.repeat)
+        same = [t for t, _ in fn()] == [t for t, _ in expected]
+        print(f"{name:<34} {ms:>10.1f} {kb:>10.1f} {same!s:>11}")
+
+
+if __name__ == "__main__":
+    main()
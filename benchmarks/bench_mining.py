@@ -0,0 +1,91 @@
+"""Throughput of the offline synonym mining job (resume_analyzer/mining.py).
+
+Writes a synthetic JSONL corpus in which some documents use a variant ("cicd", "qa",
+"i18n") where others use its canonical form, in the same contexts. Mines it with 1 and N
+workers, and reports documents/s, MB/s and whether the planted pairs were proposed.
+
+    python -m benchmarks.bench_mining --documents 20000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.mining import mine_synonyms
+
+# (canonical, variant, context words)
+PLANTED = (
+    ("ci-cd", "cicd", "pipelines jenkins github actions automated releases"),
+    ("quality assurance", "qa", "testing cypress playwright suites regression"),
+    ("internationalization", "i18n", "localization translations locales unicode"),
+)
+
+
+def planted_document(rng: random.Random, size: int, seed: int) -> str:
+    """Synthetic resume plus one planted term (canonical or variant) in its context."""
+    canonical, variant, context = rng.choice(PLANTED)
+    term = canonical if rng.random() < 0.6 else variant
+    words = context.split()
+    rng.shuffle(words)
+    half = len(words) // 2
+    sentence = f"{' '.join(words[:half])} {term} {' '.join(words[half:])}."
+    return f"{synthetic_resume(size, seed=seed)} {sentence}"
+
+
+def write_corpus(path: Path, documents: int, size: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(documents):
+            text = planted_document(rng, size, seed=i % 200)
+            f.write(json.dumps({"id": i, "resume_text": text}) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--documents", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=2_000, help="Characters per document")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-mb", type=float, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corpus.jsonl"
+        write_corpus(path, args.documents, args.size)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"corpus: {args.documents:,} documents, {size_mb:.1f} MB")
+        header = ("workers", "shards", "seconds", "docs/s", "MB/s", "candidates", "planted found")
+        print("{:>7} {:>7} {:>8} {:>9} {:>7} {:>11} {:>14}".format(*header))
+        for workers in sorted({1, args.workers}):
+            report = mine_synonyms(
+                [path], workers=workers, shard_bytes=int(args.shard_mb * 1024 * 1024)
+            )
+            stats = report["stats"]
+            found = {(c["canonical"], c["variant"]) for c in report["candidates"]}
+            planted = sum((c, v) in found for c, v, _ in PLANTED)
+            row = (
+                workers,
+                stats["shards"],
+                stats["seconds"],
+                stats["documents_per_second"],
+                size_mb / stats["seconds"],
+                len(found),
+                f"{planted}/{len(PLANTED)}",
+            )
+            print("{:>7} {:>7} {:>8.2f} {:>9.0f} {:>7.2f} {:>11} {:>14}".format(*row))
+        for c in report["candidates"][:10]:
+            print(
+                f"  {c['canonical']!r} <- {c['variant']!r} ({c['kind']}): "
+                f"similarity {c['similarity']:.2f}, pmi {c['pmi']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Parallel tokenization of one large document vs serial count_keywords().
+
+For each document size, counts keywords serially and with 2..N worker processes, checks the
+counts are identical and reports the speedup. Worker processes start once per size, and
+their start-up is included in the timing.
+
+    python -m benchmarks.bench_parallel_tokenize --sizes-mb 1,4,16 --max-workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.extract import count_keywords
+from resume_analyzer.parallel import count_keywords_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes-mb", default="1,4,16", help="Comma-separated document sizes")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    worker_counts = [w for w in (2, 4, 8, 16, 32) if w <= args.max_workers]
+    if args.max_workers > 1 and args.max_workers not in worker_counts:
+        worker_counts.append(args.max_workers)
+    print(f"cpus: {os.cpu_count()}")
+    print(
+        "{:>8} {:>8} {:>10} {:>9} {:>10}".format(
+            "size MB", "workers", "seconds", "speedup", "identical"
+        )
+    )
+    base = synthetic_resume(1024 * 1024, seed=0)
+    for size_mb in (float(s) for s in args.sizes_mb.split(",")):
+        text = (base * int(size_mb + 1))[: int(size_mb * 1024 * 1024)]
+        start = time.perf_counter()
+        expected = count_keywords(text)
+        serial = time.perf_counter() - start
+        print(f"{size_mb:>8g} {1:>8} {serial:>10.2f} {1.0:>9.2f} {'-':>10}")
+        for workers in worker_counts:
+            start = time.perf_counter()
+            with ProcessPoolExecutor(workers) as pool:
+                counts = count_keywords_parallel(text, workers, executor=pool)
+            elapsed = time.perf_counter() - start
+            same = counts == expected
+            print(
+                f"{size_mb:>8g} {workers:>8} {elapsed:>10.2f} {serial / elapsed:>9.2f} {same!s:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Per-worker memory of the prefork launcher, with and without gc.freeze() (Linux only).
+
+Starts `python -m api.prefork` on a free port, waits for /ready, sends a burst of /analyze
+requests so every worker has run a few garbage collections, then reads RSS, PSS, shared and
+private memory of each worker from /proc. The sum of PSS is the real footprint of the pool.
+
+    python -m benchmarks.bench_prefork --workers 4 --requests 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from api.prefork import process_memory
+from benchmarks.common import sample_jd, synthetic_resume
+from benchmarks.loadtest import _free_port
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _children(pid: int) -> list[int]:
+    path = Path("/proc") / str(pid) / "task" / str(pid) / "children"
+    return [int(p) for p in path.read_text().split()]
+
+
+def measure(workers: int, requests: int, freeze: bool) -> list[dict[str, int]]:
+    """Start the launcher, load it, and return each worker's process_memory()."""
+    port = _free_port()
+    cmd = [sys.executable, "-m", "api.prefork", "--workers", str(workers), "--port", str(port)]
+    cmd += ["--host", "127.0.0.1", "--log-level", "warning"]
+    if not freeze:
+        cmd.append("--no-freeze")
+    proc = subprocess.Popen(cmd, cwd=ROOT)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                if httpx.get(f"{base}/ready").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("launcher did not become ready")
+            time.sleep(0.05)
+        body = {"resume_text": synthetic_resume(8 * 1024), "job_description": sample_jd()}
+        with httpx.Client(base_url=base, timeout=30) as client, ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda _: client.post("/analyze", json=body), range(requests)))
+        return [m for pid in _children(proc.pid) if (m := process_memory(pid))]
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("needs Linux /proc/<pid>/smaps_rollup")
+
+    header = ("mode", "worker", "RSS MB", "PSS MB", "shared MB", "private MB")
+    print("{:<10} {:>6} {:>8} {:>8} {:>10} {:>11}".format(*header))
+    for freeze in (True, False):
+        mode = "freeze" if freeze else "no-freeze"
+        mems = measure(args.workers, args.requests, freeze)
+        for i, m in enumerate(mems):
+            print(
+                f"{mode:<10} {i:>6} {m['rss_kb'] / 1024:>8.1f} {m['pss_kb'] / 1024:>8.1f} "
+                f"{m['shared_kb'] / 1024:>10.1f} {m['private_kb'] / 1024:>11.1f}"
+            )
+        total_pss = sum(m["pss_kb"] for m in mems) / 1024
+        total_private = sum(m["private_kb"] for m in mems) / 1024
+        print(f"{mode:<10} {'total':>6} {'':>8} {total_pss:>8.1f} {'':>10} {total_private:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Result objects: validated pydantic AnalysisResult vs the slotted Analysis the pipeline builds.
+
+Scores one sample resume once, then rebuilds its result many times from the same fields, as a
+batch run does for every resume. Reports construction and serialization time per result, and
+the memory each retained result holds (tracemalloc, N results kept alive).
+
+    python -m benchmarks.bench_results --results 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.common import sample_jd, sample_resume
+from resume_analyzer.analyzer import analyze_counts, build_target_keywords
+from resume_analyzer.extract import count_keywords
+from resume_analyzer.models import (
+    Analysis,
+    AnalysisResult,
+    FuzzyMatch,
+    FuzzyTerm,
+    KeywordRank,
+    RankedTerm,
+)
+
+
+def build_model(a: Analysis) -> AnalysisResult:
+    """What analyze_counts() built before: validated pydantic models for every nested item."""
+    return AnalysisResult(
+        top_keywords=[KeywordRank(term=t, rank=r) for t, r in a.top_keywords],
+        matched_keywords=list(a.matched_keywords),
+        missing_keywords=list(a.missing_keywords),
+        fuzzy_matched_keywords=[
+            FuzzyMatch(term=t, resume_term=r, distance=d) for t, r, d in a.fuzzy_matched_keywords
+        ],
+        confidence_notes=list(a.confidence_notes),
+        overall_score=a.overall_score,
+        score_breakdown=dict(a.score_breakdown),
+    )
+
+
+def build_slotted(a: Analysis) -> Analysis:
+    """What analyze_counts() builds now."""
+    return Analysis(
+        top_keywords=tuple(RankedTerm(t, r) for t, r in a.top_keywords),
+        matched_keywords=tuple(a.matched_keywords),
+        missing_keywords=tuple(a.missing_keywords),
+        fuzzy_matched_keywords=tuple(FuzzyTerm(*m) for m in a.fuzzy_matched_keywords),
+        confidence_notes=tuple(a.confidence_notes),
+        overall_score=a.overall_score,
+        score_breakdown=dict(a.score_breakdown),
+    )
+
+
+def per_call_us(fn: Callable[[], Any], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def retained_bytes(fn: Callable[[], Any], n: int) -> float:
+    """Traced bytes held per object while n results built by fn are alive."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [fn() for _ in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--results", type=int, default=20_000)
+    args = parser.parse_args()
+
+    targets = build_target_keywords(job_description=sample_jd())
+    source = analyze_counts(count_keywords(sample_resume()), targets, fuzzy=True)
+    n = args.results
+    print(
+        f"result: {len(source.top_keywords)} top keywords, {len(source.matched_keywords)} matched, "
+        f"{len(source.missing_keywords)} missing; {n:,} results"
+    )
+    model = build_model(source)
+    rows = (
+        ("AnalysisResult (validated)", lambda: build_model(source), model.model_dump),
+        ("Analysis (slotted)", lambda: build_slotted(source), source.to_dict),
+        ("Analysis.to_model()", source.to_model, None),
+    )
+    print("{:<28} {:>12} {:>12} {:>14}".format("", "build us", "dict us", "bytes/result"))
+    for name, build, dump in rows:
+        build_us = per_call_us(build, n)
+        dump_us = f"{per_call_us(dump, n):.1f}" if dump else "-"
+        size = retained_bytes(build, n)
+        print(f"{name:<28} {build_us:>12.1f} {dump_us:>12} {size:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Full analyze() vs the score-only fast path (same overall_score, less work).
+
+python -m benchmarks.bench_score_only --size 50000 --keywords 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.common import sample_jd, synthetic_resume
+from resume_analyzer.analyzer import analyze, analyze_and_summary, score_only
+
+
+def best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=50_000, help="Resume size in characters")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    text = synthetic_resume(args.size, seed=1)
+    scenarios = {
+        "JD target": {"job_description": sample_jd()},
+        "5 common keywords (early exit)": {"keywords": ["python", "docker", "sql", "aws", "react"]},
+        "5 keywords, 1 absent": {"keywords": ["python", "docker", "sql", "aws", "cobol"]},
+    }
+    print(f"resume: {len(text):,} chars")
+    print(f"{'target':<32} {'summary ms':>11} {'analyze ms':>11} {'score ms':>9} {'score':>6}")
+    for name, kwargs in scenarios.items():
+        full = analyze(text, **kwargs).overall_score
+        fast = score_only(text, **kwargs)
+        assert full == fast, (name, full, fast)
+        summary_ms = best_ms(functools.partial(analyze_and_summary, text, **kwargs), args.repeat)
+        analyze_ms = best_ms(functools.partial(analyze, text, **kwargs), args.repeat)
+        score_ms = best_ms(functools.partial(score_only, text, **kwargs), args.repeat)
+        print(f"{name:<32} {summary_ms:>11.2f} {analyze_ms:>11.2f} {score_ms:>9.2f} {fast:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
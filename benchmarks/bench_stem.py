@@ -0,0 +1,66 @@
+"""Overhead of the stemming stage: count_keywords() with and without stem=True.
+
+python -m benchmarks.bench_stem --size 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.common import sample_resume, synthetic_resume
+from resume_analyzer.extract import count_keywords
+from resume_analyzer.normalize import iter_tokens
+from resume_analyzer.stem import clear_stem_cache, stem_cache_info
+
+
+def best_ms(fn: Callable[[], Any], repeat: int, before: Callable[[], None] | None = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--size", type=int, default=200_000, help="Synthetic resume size in characters"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = {
+        "sample_resume.txt": sample_resume(),
+        f"synthetic {args.size:,} chars": synthetic_resume(args.size),
+    }
+    header = ("input", "tokens", "plain ms", "cold ms", "warm ms", "warm ns/token")
+    print("{:<26} {:>8} {:>9} {:>9} {:>9} {:>14}".format(*header))
+    for name, text in inputs.items():
+        tokens = sum(1 for _ in iter_tokens(text))
+        plain_fn = functools.partial(count_keywords, text)
+        stem_fn = functools.partial(count_keywords, text, stem=True)
+        plain = best_ms(plain_fn, args.repeat)
+        cold = best_ms(stem_fn, args.repeat, before=clear_stem_cache)
+        stem_fn()
+        warm = best_ms(stem_fn, args.repeat)
+        overhead_ns = (warm - plain) * 1e6 / max(1, tokens)
+        row = (name, tokens, plain, cold, warm, overhead_ns)
+        print("{:<26} {:>8} {:>9.2f} {:>9.2f} {:>9.2f} {:>14.1f}".format(*row))
+    info = stem_cache_info()
+    print(
+        f"stem memo: {info['hits']} hits, {info['misses']} misses, "
+        f"hit rate {info['hit_rate']:.1%}, {info['size']}/{info['maxsize']} entries"
+    )
+
+
+if __name__ == "__main__":
+    main()
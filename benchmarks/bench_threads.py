@@ -0,0 +1,55 @@
+"""Thread-scaling benchmark: analyze() throughput across 1..N threads.
+
+On a GIL build, throughput stays roughly flat; on free-threaded CPython (3.13t+) it should
+scale with cores since the analyzer core shares only immutable tables.
+
+    python -m benchmarks.bench_threads --max-threads 8 --docs 400 --size 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import sample_jd, synthetic_resume
+from resume_analyzer.analyzer import analyze
+
+
+def run(threads: int, resumes: list[str], jd: str) -> float:
+    """Analyze all resumes on `threads` threads; return documents per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(lambda r: analyze(r, job_description=jd), resumes):
+            pass
+    return len(resumes) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--docs", type=int, default=200, help="Resumes analyzed per thread count")
+    parser.add_argument(
+        "--size", type=int, default=8_000, help="Approximate resume size in characters"
+    )
+    args = parser.parse_args()
+
+    jd = sample_jd()
+    resumes = [synthetic_resume(args.size, seed=i) for i in range(args.docs)]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7}  {'docs/s':>10}  {'scaling':>7}")
+    base = 0.0
+    threads = 1
+    while threads <= args.max_threads:
+        rate = run(threads, resumes, jd)
+        base = base or rate
+        print(f"{threads:>7}  {rate:>10.1f}  {rate / base:>6.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Peak memory and time: str/Counter keyword counting vs the integer token-ID path.
+
+python -m benchmarks.bench_token_ids --size 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.extract import (
+    DEFAULT_TOP_N,
+    MIN_TOKEN_LEN,
+    count_keywords,
+    count_keywords_compact,
+    rank_keywords,
+)
+from resume_analyzer.normalize import STOPWORDS, iter_tokens
+from resume_analyzer.vocab import HAS_NUMPY, Vocabulary, count_ids
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """(best wall time in ms, peak traced memory in KB) for fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=500_000, help="Resume size in characters")
+    parser.add_argument(
+        "--unique", type=int, default=20_000, help="Distinct filler terms in the vocabulary"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    filler = [f"term{i}" for i in range(args.unique)]
+    text = synthetic_resume(args.size, seed=1, vocab=filler)
+    warm = Vocabulary()
+    count_keywords_compact(text, warm)
+
+    def pure_ids() -> list[tuple[str, int]]:
+        tokens = (t for t in iter_tokens(text) if len(t) >= MIN_TOKEN_LEN and t not in STOPWORDS)
+        return count_ids(warm.encode(tokens), warm, use_numpy=False).ranked(
+            DEFAULT_TOP_N, use_numpy=False
+        )
+
+    cases: dict[str, Callable[[], Any]] = {
+        "str + Counter (current)": lambda: rank_keywords(count_keywords(text)),
+        "token IDs, cold vocabulary": lambda: rank_keywords(
+            count_keywords_compact(text, Vocabulary())
+        ),
+        "token IDs, warm vocabulary": lambda: rank_keywords(count_keywords_compact(text, warm)),
+        "token IDs, warm, pure Python": pure_ids,
+    }
+    numpy = "yes" if HAS_NUMPY else "no"
+    print(f"resume: {len(text):,} chars, {args.unique:,} distinct filler terms, numpy={numpy}")
+    print(f"{'path':<30} {'time ms':>10} {'peak KB':>10}")
+    for name, fn in cases.items():
+        ms, kb = measure(fn, args.repeat)
+        print(f"{name:<30} {ms:>10.1f} {kb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Shared inputs for benchmarks: example files and synthetic resumes of a given size."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+_VOCAB = (
+    "python java go rust c++ c# .net node.js javascript typescript sql nosql postgresql mongodb "
+    "redis kafka docker kubernetes terraform aws gcp azure react angular vue graphql rest api "
+    "microservices backend frontend distributed systems pipelines latency throughput scalable "
+    "designed developed led migrated reduced improved built deployed mentored engineers teams "
+    "testing pytest ci cd observability monitoring linux networking security performance caching"
+).split()
+
+
+def sample_resume() -> str:
+    return (EXAMPLES / "sample_resume.txt").read_text(encoding="utf-8")
+
+
+def sample_jd() -> str:
+    return (EXAMPLES / "sample_jd.txt").read_text(encoding="utf-8")
+
+
+def synthetic_resume(
+    size_bytes: int, seed: int = 0, vocab: tuple[str, ...] | list[str] = _VOCAB
+) -> str:
+    """Deterministic pseudo-resume of roughly size_bytes characters."""
+    rng = random.Random(seed)
+    words: list[str] = []
+    total = 0
+    while total < size_bytes:
+        w = rng.choice(vocab)
+        words.append(w.capitalize() if rng.random() < 0.2 else w)
+        total += len(w) + 1
+        if rng.random() < 0.08:
+            words[-1] += "."
+    return " ".join(words)
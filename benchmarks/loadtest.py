@@ -0,0 +1,343 @@
+"""In-process load test for api.main:app with latency percentiles and JSON baselines.
+
+Drives the ASGI app through httpx.ASGITransport (default), a locally started uvicorn
+server (--mode uvicorn), or an already running server (--url). Reports throughput and
+p50/p95/p99 latency per endpoint and payload size; --save writes the report as a JSON
+baseline and --compare fails (exit 1) when p95 or throughput regress beyond --tolerance.
+
+    python -m benchmarks.loadtest --concurrency 16 --requests 2000 \\
+        --mix analyze=8,analyze_file=1,health=1 --resume-kb 2,50 --save baseline.json
+    python -m benchmarks.loadtest --concurrency 16 --requests 2000 --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import platform
+import random
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.common import sample_jd, synthetic_resume
+
+ENDPOINTS = ("analyze", "analyze_file", "health")
+
+
+@dataclass
+class LoadTestConfig:
+    """What to send and how hard."""
+
+    concurrency: int = 8
+    requests: int = 500
+    mix: dict[str, int] = field(default_factory=lambda: {"analyze": 1})
+    resume_kb: list[int] = field(default_factory=lambda: [2])
+    keywords: int = 0
+    mode: str = "asgi"
+    url: str | None = None
+    seed: int = 0
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """Parse "analyze=8,health=1" into endpoint weights."""
+    mix: dict[str, int] = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint {name!r}; expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _Workload:
+    """Pre-built payloads so request construction doesn't skew latency."""
+
+    def __init__(self, config: LoadTestConfig) -> None:
+        self.rng = random.Random(config.seed)
+        self.names = list(config.mix)
+        self.weights = [config.mix[n] for n in self.names]
+        self.sizes = list(config.resume_kb)
+        jd = sample_jd()
+        keywords = [f"skill{i}" for i in range(config.keywords)] or None
+        self.bodies = {
+            kb: {
+                "resume_text": synthetic_resume(kb * 1024, seed=kb),
+                "job_description": jd,
+                "keywords": keywords,
+            }
+            for kb in self.sizes
+        }
+        self.html = {
+            kb: ("<html><body><p>" + self.bodies[kb]["resume_text"] + "</p></body></html>").encode(
+                "utf-8"
+            )
+            for kb in self.sizes
+        }
+        self.jd = jd
+
+    def next(self) -> tuple[str, dict[str, Any]]:
+        """Return (report label, httpx request kwargs) for the next request."""
+        name = self.rng.choices(self.names, self.weights)[0]
+        if name == "health":
+            return ("GET /health", {"method": "GET", "url": "/health"})
+        kb = self.rng.choice(self.sizes)
+        if name == "analyze_file":
+            files = {"resume": ("resume.html", self.html[kb], "text/html")}
+            kwargs = {
+                "method": "POST",
+                "url": "/analyze/file",
+                "files": files,
+                "data": {"job_description": self.jd},
+            }
+            return (f"POST /analyze/file {kb}KB", kwargs)
+        return (
+            f"POST /analyze {kb}KB",
+            {"method": "POST", "url": "/analyze", "json": self.bodies[kb]},
+        )
+
+
+async def _drive(
+    client: httpx.AsyncClient, config: LoadTestConfig
+) -> tuple[dict[str, list[float]], dict[str, int], float]:
+    """Send config.requests requests from config.concurrency workers.
+
+    Returns (latencies, errors, duration).
+    """
+    workload = _Workload(config)
+    plan = [workload.next() for _ in range(config.requests)]
+    latencies: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+    for item in plan:
+        queue.put_nowait(item)
+
+    async def worker() -> None:
+        while not queue.empty():
+            label, kwargs = queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                resp = await client.request(**kwargs)
+                ok = resp.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            latencies.setdefault(label, []).append(elapsed)
+            if not ok:
+                errors[label] = errors.get(label, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _UvicornThread:
+    """Run uvicorn for the app in a background thread (no signal handlers)."""
+
+    def __init__(self, app: Any) -> None:
+        import uvicorn
+
+        self.port = _free_port()
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning")
+        )
+        self.server.install_signal_handlers = lambda: None  # type: ignore[method-assign]
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+async def run_load_test(config: LoadTestConfig, app: Any = None) -> dict[str, Any]:
+    """Run one load test and return the report (see module docstring)."""
+    if app is None and not config.url:
+        from api.main import app
+    timeout = httpx.Timeout(60.0)
+    if config.url or config.mode == "uvicorn":
+        limits = httpx.Limits(
+            max_connections=config.concurrency, max_keepalive_connections=config.concurrency
+        )
+        server = contextlib.nullcontext(config.url) if config.url else _UvicornThread(app)
+        with server as base_url:
+            async with httpx.AsyncClient(
+                base_url=base_url, limits=limits, timeout=timeout
+            ) as client:
+                latencies, errors, duration = await _drive(client, config)
+                lanes = await _lane_stats(client)
+    else:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=timeout
+        ) as client:
+            latencies, errors, duration = await _drive(client, config)
+            lanes = await _lane_stats(client)
+    report = build_report(config, latencies, errors, duration)
+    if lanes:
+        report["lanes"] = lanes
+    return report
+
+
+async def _lane_stats(client: httpx.AsyncClient) -> dict[str, Any] | None:
+    """Server-side lane queue times (GET /metrics/lanes), if the target exposes them."""
+    try:
+        resp = await client.get("/metrics/lanes")
+    except httpx.HTTPError:
+        return None
+    return resp.json() if resp.status_code == 200 else None
+
+
+def build_report(
+    config: LoadTestConfig,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+    duration: float,
+) -> dict[str, Any]:
+    endpoints: dict[str, dict[str, float | int]] = {}
+    for label in sorted(latencies):
+        values = sorted(latencies[label])
+        endpoints[label] = {
+            "count": len(values),
+            "errors": errors.get(label, 0),
+            "throughput_rps": round(len(values) / duration, 2) if duration else 0.0,
+            "mean_ms": round(sum(values) / len(values) * 1000, 3),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p95_ms": round(percentile(values, 95) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round(values[-1] * 1000, 3),
+        }
+    total = sum(len(v) for v in latencies.values())
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "mode": "url" if config.url else config.mode,
+            "concurrency": config.concurrency,
+            "requests": config.requests,
+            "mix": config.mix,
+            "resume_kb": config.resume_kb,
+            "keywords": config.keywords,
+        },
+        "total": {
+            "requests": total,
+            "errors": sum(errors.values()),
+            "duration_s": round(duration, 3),
+            "throughput_rps": round(total / duration, 2) if duration else 0.0,
+        },
+        "endpoints": endpoints,
+    }
+
+
+def compare_reports(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2
+) -> list[str]:
+    """Regressions vs baseline: p95 up or throughput down by more than tolerance (fraction)."""
+    problems: list[str] = []
+    for label, cur in report["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(label)
+        if not base:
+            continue
+        if base["p95_ms"] and cur["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            problems.append(f"{label}: p95 {base['p95_ms']:.1f}ms -> {cur['p95_ms']:.1f}ms")
+        base_rps, cur_rps = base["throughput_rps"], cur["throughput_rps"]
+        if base_rps and cur_rps < base_rps * (1 - tolerance):
+            problems.append(f"{label}: throughput {base_rps:.1f} -> {cur_rps:.1f} req/s")
+    return problems
+
+
+def format_report(report: dict[str, Any]) -> str:
+    header = ("endpoint", "count", "err", "req/s", "p50 ms", "p95 ms", "p99 ms")
+    lines = ["{:<28} {:>6} {:>4} {:>8} {:>8} {:>8} {:>8}".format(*header)]
+    for label, e in report["endpoints"].items():
+        lines.append(
+            f"{label:<28} {e['count']:>6} {e['errors']:>4} {e['throughput_rps']:>8.1f} "
+            f"{e['p50_ms']:>8.1f} {e['p95_ms']:>8.1f} {e['p99_ms']:>8.1f}"
+        )
+    for name, lane in report.get("lanes", {}).items():
+        lines.append(
+            f"lane {name}: {lane['completed']} done, queue p50 {lane['queue_ms_p50']:.1f} ms, "
+            f"p95 {lane['queue_ms_p95']:.1f} ms, max {lane['queue_ms_max']:.1f} ms"
+        )
+    t = report["total"]
+    lines.append(
+        f"total: {t['requests']} requests, {t['errors']} errors, {t['throughput_rps']:.1f} req/s"
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--mix", default="analyze=1", help="Endpoint weights, e.g. analyze=8,health=1"
+    )
+    parser.add_argument("--resume-kb", default="2", help="Comma-separated resume sizes in KB")
+    parser.add_argument("--keywords", type=int, default=0, help="Extra target keywords per request")
+    parser.add_argument("--mode", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--url", help="Target an already running server instead")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=Path, help="Write report JSON (baseline)")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        concurrency=args.concurrency,
+        requests=args.requests,
+        mix=parse_mix(args.mix),
+        resume_kb=[int(x) for x in args.resume_kb.split(",") if x.strip()],
+        keywords=args.keywords,
+        mode=args.mode,
+        url=args.url,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_load_test(config))
+    print(format_report(report))
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline to {args.save}")
+    if args.compare:
+        problems = compare_reports(
+            report, json.loads(args.compare.read_text(encoding="utf-8")), args.tolerance
+        )
+        for p in problems:
+            print(f"REGRESSION {p}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,59 @@
-"""Orchestration: run pipeline and return AnalysisResult."""
+"""
+Orchestration: run pipeline and return results. The pipeline builds slotted Analysis results;
+analyze() (the library entry point) converts to the pydantic AnalysisResult.
+"""
 
 from __future__ import annotations
 
-from resume_analyzer.extract import extract_keyword_set, extract_keywords
-from resume_analyzer.match import compute_matched_and_missing
-from resume_analyzer.models import AnalysisResult, KeywordRank, format_readable_summary
+from collections.abc import Iterable, Mapping
+
+from resume_analyzer.extract import (
+    count_keywords,
+    count_keywords_compact,
+    count_keywords_from_fragments,
+    extract_keyword_set,
+    iter_keywords,
+    iter_keywords_from_fragments,
+    rank_keywords,
+)
+from resume_analyzer.fuzzy import find_fuzzy_matches
+from resume_analyzer.match import CompiledTargets, compute_matched_and_missing
+from resume_analyzer.models import (
+    Analysis,
+    AnalysisResult,
+    FuzzyTerm,
+    RankedTerm,
+    format_readable_summary,
+)
 from resume_analyzer.normalize import normalize_text, tokenize_without_stopwords
+from resume_analyzer.parallel import count_keywords_parallel
 from resume_analyzer.score import compute_score
+from resume_analyzer.stem import fold_stems
+from resume_analyzer.stem import stem as stem_token
 
 
-def _target_keywords_from_jd(job_description: str, top_n: int = 50) -> set[str]:
-    """Extract unique keywords from job description."""
-    return extract_keyword_set(job_description)
+def _target_keywords_from_jd(
+    job_description: str, top_n: int = 50, stem: bool = False, workers: int = 1
+) -> tuple[set[str], dict[str, str]]:
+    """Extract unique keywords from job description (and, when stemming, their JD forms)."""
+    if stem:
+        if workers > 1:
+            counts = count_keywords_parallel(job_description, workers)
+        else:
+            counts = count_keywords(job_description)
+        stemmed, surface = fold_stems(counts)
+        return set(stemmed), surface
+    if workers > 1:
+        return set(count_keywords_parallel(job_description, workers)), {}
+    return extract_keyword_set(job_description), {}
 
 
-def _target_keywords_from_list(keywords: list[str]) -> set[str]:
-    """Normalize and dedupe provided keyword list."""
+def _target_keywords_from_list(
+    keywords: list[str], stem: bool = False
+) -> tuple[set[str], dict[str, str]]:
+    """Normalize and dedupe provided keyword list (and, when stemming, each stem's word)."""
     out: set[str] = set()
+    surface: dict[str, str] = {}
     for k in keywords:
         if not k or not isinstance(k, str):
             continue
@@ -24,8 +61,108 @@ def _target_keywords_from_list(keywords: list[str]) -> set[str]:
         tokens = tokenize_without_stopwords(normalized)
         for t in tokens:
             if len(t) >= 2:
-                out.add(t)
-    return out
+                if stem:
+                    s = stem_token(t)
+                    out.add(s)
+                    surface.setdefault(s, t)
+                else:
+                    out.add(t)
+    return out, surface
+
+
+def build_targets(
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    stem: bool = False,
+    workers: int = 1,
+) -> tuple[set[str], dict[str, str]]:
+    """
+    Like build_target_keywords(), plus stem -> the target's own word to show for it (empty
+    unless stem). Listed keywords win over the role title, which wins over the JD's words.
+    """
+    target_keywords: set[str] = set()
+    surface: dict[str, str] = {}
+    if job_description and job_description.strip():
+        target_keywords, surface = _target_keywords_from_jd(
+            job_description, top_n=top_n_keywords * 2, stem=stem, workers=workers
+        )
+    for words in ([role_title] if role_title and role_title.strip() else None, keywords):
+        if words:
+            listed, listed_surface = _target_keywords_from_list(words, stem=stem)
+            target_keywords |= listed
+            surface.update(listed_surface)
+    return target_keywords, surface
+
+
+def build_target_keywords(
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    stem: bool = False,
+    workers: int = 1,
+) -> set[str]:
+    """
+    Target keyword set from job_description and/or role_title + keywords.
+    workers: tokenize a very large job description in that many processes (see parallel.py).
+    """
+    return build_targets(job_description, role_title, keywords, top_n_keywords, stem, workers)[0]
+
+
+def analyze_counts(
+    resume_counts: Mapping[str, int],
+    target_keywords: set[str],
+    top_n_keywords: int = 30,
+    resume_forms: set[str] | frozenset[str] | None = None,
+    fuzzy: bool = False,
+    resume_surface: Mapping[str, str] | None = None,
+    target_surface: Mapping[str, str] | None = None,
+) -> Analysis:
+    """
+    Score already-tokenized resume keyword counts against a target keyword set.
+    Used by analyze() and by batch runs that reuse cached tokenization.
+    fuzzy: also match missing targets that a resume term misspells (see fuzzy.py).
+    resume_surface / target_surface: word to show for a stemmed resume / target keyword (see
+    stem.fold_stems() and build_targets()); keywords without an entry are shown as they are.
+    """
+    top_ranked = rank_keywords(resume_counts, top_n=top_n_keywords)
+    resume_keywords = set(resume_counts)
+    matched, missing = compute_matched_and_missing(
+        resume_keywords, target_keywords, resume_forms=resume_forms
+    )
+    fuzzy_matches: list[FuzzyTerm] = []
+    if fuzzy:
+        fuzzy_matches = [
+            FuzzyTerm(t, r, d) for t, r, d in find_fuzzy_matches(resume_keywords, missing)
+        ]
+        fuzzy_terms = {m.term for m in fuzzy_matches}
+        missing = [t for t in missing if t not in fuzzy_terms]
+    score, breakdown, confidence_notes = compute_score(
+        len(matched),
+        max(1, len(target_keywords)),
+        fuzzy_count=len(fuzzy_matches) if fuzzy else None,
+    )
+
+    top_keywords = tuple(RankedTerm(t, i + 1) for i, (t, _) in enumerate(top_ranked))
+    if resume_surface or target_surface:
+        word = (resume_surface or {}).get
+        target = (target_surface or {}).get
+        top_keywords = tuple(RankedTerm(word(t, t), r) for t, r in top_keywords)
+        matched = sorted(target(t, t) for t in matched)
+        missing = sorted(target(t, t) for t in missing)
+        fuzzy_matches = [FuzzyTerm(target(t, t), word(r, r), d) for t, r, d in fuzzy_matches]
+
+    return Analysis(
+        top_keywords=top_keywords,
+        matched_keywords=tuple(matched),
+        missing_keywords=tuple(missing),
+        fuzzy_matched_keywords=tuple(fuzzy_matches) if fuzzy else None,
+        confidence_notes=tuple(confidence_notes),
+        overall_score=score,
+        score_breakdown=breakdown,
+    )
 
 
 def analyze(
@@ -34,34 +171,149 @@ def analyze(
     role_title: str | None = None,
     keywords: list[str] | None = None,
     top_n_keywords: int = 30,
+    compact: bool = False,
+    fuzzy: bool = False,
+    stem: bool = False,
 ) -> AnalysisResult:
     """
     Analyze resume against target role.
     Target is either job_description (full JD text) or role_title + keywords.
+    compact: count via interned integer token IDs (lower peak memory on large inputs).
+    fuzzy: report likely misspellings of target keywords as fuzzy matches.
+    stem: reduce resume and target tokens to base forms ("developed" == "developer").
+    """
+    result = analyze_text(
+        resume_text,
+        job_description=job_description,
+        role_title=role_title,
+        keywords=keywords,
+        top_n_keywords=top_n_keywords,
+        compact=compact,
+        fuzzy=fuzzy,
+        stem=stem,
+    )
+    return result.to_model()
+
+
+def analyze_text(
+    resume_text: str,
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    compact: bool = False,
+    fuzzy: bool = False,
+    stem: bool = False,
+    workers: int = 1,
+) -> Analysis:
+    """
+    Like analyze(), but returns the slotted Analysis (for batch callers and the API).
+    workers: tokenize very large inputs in that many processes (see parallel.py); same result.
     """
     resume_text = resume_text or ""
-    target_keywords: set[str] = set()
-    if job_description and job_description.strip():
-        target_keywords = _target_keywords_from_jd(job_description, top_n=top_n_keywords * 2)
-    if keywords:
-        target_keywords |= _target_keywords_from_list(keywords)
-    if role_title and role_title.strip():
-        target_keywords |= _target_keywords_from_list([role_title])
+    target_keywords, target_surface = build_targets(
+        job_description, role_title, keywords, top_n_keywords, stem=stem, workers=workers
+    )
+    counts: Mapping[str, int]
+    if workers > 1:
+        counts = count_keywords_parallel(resume_text, workers)
+    elif compact:
+        counts = count_keywords_compact(resume_text)
+    else:
+        counts = count_keywords(resume_text)
+    return _analyze_word_counts(
+        counts, target_keywords, target_surface, top_n_keywords, fuzzy, stem
+    )
 
-    resume_keywords_set = extract_keyword_set(resume_text)
-    top_ranked = extract_keywords(resume_text, top_n=top_n_keywords)
-    matched, missing = compute_matched_and_missing(resume_keywords_set, target_keywords)
-    score, breakdown, confidence_notes = compute_score(len(matched), max(1, len(target_keywords)))
 
-    top_keywords = [KeywordRank(term=t, rank=i + 1) for i, (t, _) in enumerate(top_ranked)]
+def _analyze_word_counts(
+    counts: Mapping[str, int],
+    target_keywords: set[str],
+    target_surface: Mapping[str, str],
+    top_n_keywords: int,
+    fuzzy: bool,
+    stem: bool,
+) -> Analysis:
+    """analyze_counts() on counts keyed by word; with stem, stems them first but shows words."""
+    if not stem:
+        return analyze_counts(counts, target_keywords, top_n_keywords, fuzzy=fuzzy)
+    stemmed, resume_surface = fold_stems(counts)
+    return analyze_counts(
+        stemmed,
+        target_keywords,
+        top_n_keywords,
+        fuzzy=fuzzy,
+        resume_surface=resume_surface,
+        target_surface=target_surface,
+    )
 
-    return AnalysisResult(
-        top_keywords=top_keywords,
-        matched_keywords=matched,
-        missing_keywords=missing,
-        confidence_notes=confidence_notes,
-        overall_score=score,
-        score_breakdown=breakdown,
+
+def analyze_fragments(
+    resume_fragments: Iterable[str],
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    fuzzy: bool = False,
+    stem: bool = False,
+) -> Analysis:
+    """
+    Like analyze_text(), but tokenizes the resume from a stream of fragments (see
+    documents.py).
+    """
+    target_keywords, target_surface = build_targets(
+        job_description, role_title, keywords, top_n_keywords, stem=stem
+    )
+    counts = count_keywords_from_fragments(resume_fragments)
+    return _analyze_word_counts(
+        counts, target_keywords, target_surface, top_n_keywords, fuzzy, stem
+    )
+
+
+def score_tokens(tokens: Iterable[str], targets: CompiledTargets, fuzzy: bool = False) -> float:
+    """
+    overall_score for a keyword stream, without ranking, match lists, notes or rendering.
+    Stops reading tokens once every target is matched; equals analyze_counts().overall_score.
+    """
+    matched, missing, seen = targets.match_stream(tokens, collect=fuzzy)
+    fuzzy_count = None
+    if fuzzy:
+        fuzzy_count = len(find_fuzzy_matches(seen, missing)) if missing else 0
+    score, _, _ = compute_score(len(matched), max(1, targets.target_count), fuzzy_count=fuzzy_count)
+    return score
+
+
+def score_only(
+    resume_text: str,
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    fuzzy: bool = False,
+    stem: bool = False,
+) -> float:
+    """Fast path for callers that only need analyze(...).overall_score (same value)."""
+    targets = CompiledTargets(
+        build_target_keywords(job_description, role_title, keywords, top_n_keywords, stem=stem)
+    )
+    return score_tokens(iter_keywords(resume_text, stem=stem), targets, fuzzy=fuzzy)
+
+
+def score_only_fragments(
+    resume_fragments: Iterable[str],
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: list[str] | None = None,
+    top_n_keywords: int = 30,
+    fuzzy: bool = False,
+    stem: bool = False,
+) -> float:
+    """Like score_only(), but reads the resume from a stream of fragments (see documents.py)."""
+    targets = CompiledTargets(
+        build_target_keywords(job_description, role_title, keywords, top_n_keywords, stem=stem)
+    )
+    return score_tokens(
+        iter_keywords_from_fragments(resume_fragments, stem=stem), targets, fuzzy=fuzzy
     )
 
 
@@ -70,7 +322,18 @@ def analyze_and_summary(
     job_description: str | None = None,
     role_title: str | None = None,
     keywords: list[str] | None = None,
-) -> tuple[AnalysisResult, str]:
-    """Run analyze and return (result, readable_summary)."""
-    result = analyze(resume_text=resume_text, job_description=job_description, role_title=role_title, keywords=keywords)
+    fuzzy: bool = False,
+    stem: bool = False,
+    workers: int = 1,
+) -> tuple[Analysis, str]:
+    """Run analyze_text and return (result, readable_summary)."""
+    result = analyze_text(
+        resume_text=resume_text,
+        job_description=job_description,
+        role_title=role_title,
+        keywords=keywords,
+        fuzzy=fuzzy,
+        stem=stem,
+        workers=workers,
+    )
     return (result, format_readable_summary(result))
@@ -0,0 +1,84 @@
+"""Per-request CPU time budget, checked cooperatively by the tokenizer and the matcher.
+
+time_budget(seconds) is entered in the thread that does the work. The budget sits in a
+ContextVar, so everything called inside the block sees it without extra parameters. It counts
+that thread's CPU time (time.thread_time), so waiting for a lane slot, for I/O or for the GIL
+is not charged. Long loops call Budget.check() at safe points:
+- iter_tokens(): at the start of each tokenizer window (normalize.TOKENIZE_WINDOW characters,
+  cut at whitespace) and every CHECK_EVERY tokens, so a run without whitespace, which is one
+  window however long, is still checked as it is tokenized.
+- iter_tokens_from_fragments(): every CHECK_EVERY fragments.
+- compute_matched_and_missing(): every CHECK_EVERY targets.
+- CompiledTargets(): every CHECK_EVERY targets and candidate tokens (stage "compile").
+- find_fuzzy_matches(): every CHECK_EVERY missing targets, index forms and resume terms
+  (stage "fuzzy").
+An exhausted budget raises BudgetExceeded, which unwinds the analysis without a partial
+result. With no budget active, nothing is checked.
+
+The tokenizer is a Python generator that resumes the regex engine once per match, so the
+longest uninterrupted stretch is one regex search: the gap between two tokens, at most a
+window when the text has whitespace. Text that yields no tokens and has no whitespace (a long
+run of punctuation) is one search, and can overrun the budget by the time it takes.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+# Loop iterations between checks where one iteration is cheap (e.g. one target keyword).
+CHECK_EVERY = 64
+
+
+class BudgetExceeded(Exception):
+    """An analysis used more CPU time than its budget; stage names the loop that noticed."""
+
+    def __init__(self, budget: float, used: float, stage: str) -> None:
+        super().__init__(
+            f"CPU time budget of {budget * 1000:.0f} ms exceeded "
+            f"({used * 1000:.0f} ms used, during {stage})"
+        )
+        self.budget = budget
+        self.used = used
+        self.stage = stage
+
+
+@dataclass(slots=True)
+class Budget:
+    """CPU seconds allowed for the current thread, counted from when the budget was entered."""
+
+    seconds: float
+    started: float = field(default_factory=time.thread_time)
+
+    def used(self) -> float:
+        return time.thread_time() - self.started
+
+    def check(self, stage: str) -> None:
+        """Raise BudgetExceeded once the budget is used up."""
+        used = time.thread_time() - self.started
+        if used > self.seconds:
+            raise BudgetExceeded(self.seconds, used, stage)
+
+
+_budget: ContextVar[Budget | None] = ContextVar("resume_analyzer_budget", default=None)
+
+
+def current_budget() -> Budget | None:
+    """The budget active in this context, or None."""
+    return _budget.get()
+
+
+@contextmanager
+def time_budget(seconds: float | None) -> Iterator[Budget | None]:
+    """Limit the CPU time of work run inside the block (in this thread); None: no limit."""
+    if seconds is None:
+        yield None
+        return
+    token = _budget.set(Budget(seconds))
+    try:
+        yield _budget.get()
+    finally:
+        _budget.reset(token)
@@ -0,0 +1,179 @@
+"""On-disk cache of tokenized resumes for incremental batch runs.
+
+Entries are keyed by the SHA-256 of the resume text and stored under a directory named
+after the tokenizer fingerprint, so any change to the special tokens, stopwords or synonyms
+(built in or swapped in at runtime, see tables.py) or TOKENIZER_VERSION makes old entries
+invisible without manual invalidation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from resume_analyzer.extract import count_keywords, count_keywords_from_fragments
+from resume_analyzer.stem import STEMMER_VERSION, fold_stems
+from resume_analyzer.synonyms import canonical_form_set
+from resume_analyzer.tables import current_tables
+
+# Bump when tokenize()/count_keywords() change behavior in a way the tables don't capture.
+TOKENIZER_VERSION = 1
+
+_FINGERPRINT_RE = re.compile(r"^[0-9a-f]{16}$")
+
+
+def tokenizer_fingerprint(stem: bool = False) -> str:
+    """Short hash of everything that affects tokenization and synonym expansion."""
+    tables = current_tables()
+    payload = json.dumps(
+        {
+            "version": TOKENIZER_VERSION,
+            # Only present when stemming, so existing unstemmed cache directories stay valid.
+            **({"stemmer": STEMMER_VERSION} if stem else {}),
+            "special_tokens": list(tables.special_tokens),
+            "stopwords": sorted(tables.stopwords),
+            "synonyms": {k: sorted(v) for k, v in sorted(tables.synonym_map.items())},
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of text (UTF-8)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: Path, fmt: str) -> str:
+    """SHA-256 hex digest of a document's bytes, salted with its format."""
+    h = hashlib.sha256(fmt.encode("ascii") + b"\0")
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class TokenizedText:
+    """
+    Tokenized form of one document: keyword counts and their synonym-expanded forms. Stemmed
+    entries also keep each stem's most frequent word, for display (see stem.fold_stems).
+    """
+
+    counts: Counter[str]
+    forms: frozenset[str]
+    surface: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_counts(
+        cls, counts: Counter[str], surface: Mapping[str, str] | None = None
+    ) -> TokenizedText:
+        forms = frozenset(canonical_form_set(set(counts)))
+        return cls(counts=counts, forms=forms, surface=surface or {})
+
+    @classmethod
+    def from_words(cls, counts: Counter[str], stem: bool = False) -> TokenizedText:
+        """From counts keyed by word, stemming them when stem is set."""
+        return cls.from_counts(*fold_stems(counts)) if stem else cls.from_counts(counts)
+
+    @classmethod
+    def from_text(cls, text: str, stem: bool = False) -> TokenizedText:
+        return cls.from_words(count_keywords(text), stem)
+
+    @classmethod
+    def from_fragments(cls, fragments: Iterable[str], stem: bool = False) -> TokenizedText:
+        return cls.from_words(count_keywords_from_fragments(fragments), stem)
+
+
+class TokenCache:
+    """
+    Persistent cache of TokenizedText entries under root/<fingerprint>/<hh>/<sha256>.json.
+    Safe to share between threads: writes are atomic renames and counters are locked.
+    stem: entries hold stemmed counts (see stem.py); stemmed and plain entries never mix.
+    """
+
+    def __init__(
+        self, root: Path | str, fingerprint: str | None = None, stem: bool = False
+    ) -> None:
+        self.root = Path(root)
+        self.stem = stem
+        self.fingerprint = fingerprint or tokenizer_fingerprint(stem=stem)
+        self.directory = self.root / self.fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def get(self, digest: str) -> TokenizedText | None:
+        """Cached entry for digest, or None if absent or unreadable."""
+        try:
+            data = json.loads(self._path(digest).read_text(encoding="utf-8"))
+            return TokenizedText(
+                counts=Counter(data["counts"]),
+                forms=frozenset(data["forms"]),
+                surface=data.get("surface", {}),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, digest: str, entry: TokenizedText) -> None:
+        """Write entry atomically (temp file + rename) so readers never see partial files."""
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"counts": dict(entry.counts), "forms": sorted(entry.forms)}
+        if entry.surface:
+            data["surface"] = dict(entry.surface)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def load_or_build(self, digest: str, build: Callable[[], TokenizedText]) -> TokenizedText:
+        """Return the entry for digest, calling build() and storing its result on a miss."""
+        entry = self.get(digest)
+        with self._lock:
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            return entry
+        entry = build()
+        self.put(digest, entry)
+        return entry
+
+    def load_or_tokenize(self, text: str) -> TokenizedText:
+        """Return the cached tokenization of text, tokenizing and storing it on a miss."""
+        return self.load_or_build(
+            content_hash(text), lambda: TokenizedText.from_text(text, stem=self.stem)
+        )
+
+    def prune_stale(self) -> int:
+        """Delete cache directories written under other fingerprints. Returns count removed."""
+        if not self.root.is_dir():
+            return 0
+        removed = 0
+        for child in self.root.iterdir():
+            if (
+                child.is_dir()
+                and child.name != self.fingerprint
+                and _FINGERPRINT_RE.match(child.name)
+            ):
+                shutil.rmtree(child, ignore_errors=True)
+                removed += 1
+        return removed
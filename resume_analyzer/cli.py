@@ -2,14 +2,44 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import typer
 
-from resume_analyzer.analyzer import analyze_and_summary
-from resume_analyzer.models import AnalysisResult
+from resume_analyzer.analyzer import (
+    analyze_and_summary,
+    analyze_counts,
+    analyze_fragments,
+    build_targets,
+    score_only,
+    score_only_fragments,
+    score_tokens,
+)
+from resume_analyzer.cache import TokenCache, TokenizedText, file_hash
+from resume_analyzer.corpus import CORPUS_FORMATS, CorpusReader
+from resume_analyzer.dedupe import LSHIndex, MinHasher
+from resume_analyzer.documents import (
+    DOCX_EXTENSIONS,
+    HTML_EXTENSIONS,
+    detect_format,
+    iter_file_fragments,
+)
+from resume_analyzer.match import CompiledTargets
+from resume_analyzer.mining import (
+    DEFAULT_CONTEXTS,
+    DEFAULT_MAX_TERMS,
+    DEFAULT_MIN_COUNT,
+    DEFAULT_MIN_SIMILARITY,
+    DEFAULT_WINDOW,
+    mine_synonyms,
+    write_candidates,
+)
+from resume_analyzer.models import AnalysisResult, format_readable_summary
 
 app = typer.Typer(help="Resume Analyzer — evaluate resume vs. job description or keyword list.")
 
@@ -22,27 +52,67 @@ def _load_text(path: Path | None, stdin_if_missing: bool = False) -> str:
     if not path.exists():
         typer.echo(f"Error: file not found: {path}", err=True)
         raise typer.Exit(1)
+    if detect_format(path.name) != "text":
+        return "".join(iter_file_fragments(path))
     return path.read_text(encoding="utf-8", errors="replace")
 
 
+def _tokenize_file(path: Path, cache: TokenCache | None, stem: bool = False) -> TokenizedText:
+    """Tokenize a resume file (text, .docx or .html), via the cache when given."""
+    fmt = detect_format(path.name)
+    if fmt == "text":
+        text = _load_text(path)
+        return cache.load_or_tokenize(text) if cache else TokenizedText.from_text(text, stem=stem)
+    if cache is None:
+        return TokenizedText.from_fragments(iter_file_fragments(path, fmt), stem=stem)
+    return cache.load_or_build(
+        file_hash(path, fmt),
+        lambda: TokenizedText.from_fragments(iter_file_fragments(path, fmt), stem=stem),
+    )
+
+
 @app.command()
 def analyze(
-    resume: str = typer.Option(..., "--resume", "-r", help="Path to resume (.txt) or - for stdin"),
+    resume: str = typer.Option(
+        ..., "--resume", "-r", help="Path to resume (.txt, .docx, .html) or - for stdin"
+    ),
     job: Path | None = typer.Option(None, "--job", "-j", help="Path to job description (.txt)"),
     role: str | None = typer.Option(None, "--role", help="Role title (when not using full JD)"),
     keywords: str | None = typer.Option(None, "--keywords", "-k", help="Comma-separated target keywords"),
     format_output: str = typer.Option("both", "--format", "-f", help="Output: json | summary | both"),
     output_path: Path | None = typer.Option(None, "--output", "-o", help="Write result to file (default: stdout)"),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Also match likely misspellings of target keywords"
+    ),
+    stem: bool = typer.Option(
+        False, "--stem", help="Reduce words to base forms (developed/developer -> develop)"
+    ),
+    only_score: bool = typer.Option(
+        False, "--score-only", help="Output only the overall score (skips ranking and the summary)"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Processes for tokenizing very large text resumes and JDs"
+    ),
 ) -> None:
     """Analyze resume against job description or role + keywords."""
     if format_output not in ("json", "summary", "both"):
         typer.echo("Error: --format must be one of: json, summary, both.", err=True)
         raise typer.Exit(1)
-    use_stdin = resume.strip() == "-"
-    resume_text = sys.stdin.read() if use_stdin else _load_text(Path(resume))
-    if not resume_text.strip():
-        typer.echo("Error: no resume text provided.", err=True)
+    if workers < 1:
+        typer.echo("Error: --workers must be >= 1.", err=True)
         raise typer.Exit(1)
+    use_stdin = resume.strip() == "-"
+    resume_path = None if use_stdin else Path(resume)
+    resume_text = ""
+    if resume_path is not None and detect_format(resume_path.name) != "text":
+        if not resume_path.exists():
+            typer.echo(f"Error: file not found: {resume_path}", err=True)
+            raise typer.Exit(1)
+    else:
+        resume_text = sys.stdin.read() if use_stdin else _load_text(resume_path)
+        if not resume_text.strip():
+            typer.echo("Error: no resume text provided.", err=True)
+            raise typer.Exit(1)
 
     job_description: str | None = None
     if job:
@@ -55,22 +125,55 @@ def analyze(
         typer.echo("Error: provide --job, and/or --role and/or --keywords.", err=True)
         raise typer.Exit(1)
 
-    result, summary = analyze_and_summary(
-        resume_text=resume_text,
-        job_description=job_description or None,
-        role_title=role,
-        keywords=keyword_list,
-    )
+    if only_score:
+        options = {
+            "job_description": job_description or None,
+            "role_title": role,
+            "keywords": keyword_list,
+        }
+        if resume_text:
+            score = score_only(resume_text, **options, fuzzy=fuzzy, stem=stem)
+        else:
+            score = score_only_fragments(
+                iter_file_fragments(resume_path), **options, fuzzy=fuzzy, stem=stem
+            )
+        _write_output(f"{score:.1f}", output_path)
+        return
+
+    if resume_text:
+        result, summary = analyze_and_summary(
+            resume_text=resume_text,
+            job_description=job_description or None,
+            role_title=role,
+            keywords=keyword_list,
+            fuzzy=fuzzy,
+            stem=stem,
+            workers=workers,
+        )
+    else:
+        # .docx / .html: stream extracted text straight into the tokenizer.
+        result = analyze_fragments(
+            iter_file_fragments(resume_path),
+            job_description=job_description or None,
+            role_title=role,
+            keywords=keyword_list,
+            fuzzy=fuzzy,
+            stem=stem,
+        )
+        summary = format_readable_summary(result)
 
     out_parts: list[str] = []
     if format_output in ("json", "both"):
-        out_parts.append(result.model_dump_json(indent=2))
+        out_parts.append(result.to_model().model_dump_json(indent=2))
     if format_output in ("summary", "both"):
         if out_parts:
             out_parts.append("")
         out_parts.append(summary)
 
-    output = "\n".join(out_parts)
+    _write_output("\n".join(out_parts), output_path)
+
+
+def _write_output(output: str, output_path: Path | None) -> None:
     if output_path:
         output_path.write_text(output, encoding="utf-8")
         typer.echo(f"Wrote result to {output_path}")
@@ -78,6 +181,356 @@ def analyze(
         typer.echo(output)
 
 
+def _expand_resume_paths(paths: list[Path]) -> list[Path]:
+    """Files as given; directories expand to their .txt, .docx and .html files (sorted)."""
+    suffixes = {".txt", *DOCX_EXTENSIONS, *HTML_EXTENSIONS}
+    out: list[Path] = []
+    for p in paths:
+        if p.is_dir():
+            out.extend(
+                sorted(f for f in p.iterdir() if f.is_file() and f.suffix.lower() in suffixes)
+            )
+        elif p.exists():
+            out.append(p)
+        else:
+            typer.echo(f"Error: file not found: {p}", err=True)
+            raise typer.Exit(1)
+    return out
+
+
+@app.command()
+def batch(
+    resumes: list[Path] = typer.Argument(
+        ..., help="Resume files or directories (.txt, .docx, .html)"
+    ),
+    job: Path | None = typer.Option(None, "--job", "-j", help="Path to job description (.txt)"),
+    role: str | None = typer.Option(None, "--role", help="Role title (when not using full JD)"),
+    keywords: str | None = typer.Option(
+        None, "--keywords", "-k", help="Comma-separated target keywords"
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Persistent tokenization cache; only changed resumes are re-tokenized",
+    ),
+    output_path: Path | None = typer.Option(
+        None, "--output", "-o", help="Write JSON lines to file (default: stdout)"
+    ),
+    dedupe_threshold: float | None = typer.Option(
+        None,
+        "--dedupe-threshold",
+        help="Jaccard similarity (0-1] above which resumes count as near-duplicates",
+    ),
+    dedupe_mode: str = typer.Option(
+        "reuse",
+        "--dedupe-mode",
+        help="reuse: copy the earlier analysis | flag: analyze and mark duplicate_of",
+    ),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Also match likely misspellings of target keywords"
+    ),
+    stem: bool = typer.Option(
+        False, "--stem", help="Reduce words to base forms (developed/developer -> develop)"
+    ),
+    only_score: bool = typer.Option(
+        False, "--score-only", help="Output only the overall score (skips ranking and the summary)"
+    ),
+) -> None:
+    """Analyze many resumes against one target; one JSON line per resume."""
+    if dedupe_mode not in ("reuse", "flag"):
+        typer.echo("Error: --dedupe-mode must be one of: reuse, flag.", err=True)
+        raise typer.Exit(1)
+    if dedupe_threshold is not None and not 0 < dedupe_threshold <= 1:
+        typer.echo("Error: --dedupe-threshold must be in (0, 1].", err=True)
+        raise typer.Exit(1)
+    job_description = _load_text(job) if job else None
+    keyword_list = [k.strip() for k in keywords.split(",") if k.strip()] if keywords else None
+    if not job_description and not keyword_list and not role:
+        typer.echo("Error: provide --job, and/or --role and/or --keywords.", err=True)
+        raise typer.Exit(1)
+    target_keywords, target_surface = build_targets(
+        job_description or None, role, keyword_list, stem=stem
+    )
+    compiled = CompiledTargets(target_keywords) if only_score else None
+
+    cache: TokenCache | None = None
+    if cache_dir is not None:
+        cache = TokenCache(cache_dir, stem=stem)
+        cache.prune_stale()
+
+    hasher = MinHasher() if dedupe_threshold is not None else None
+    index = LSHIndex(dedupe_threshold) if dedupe_threshold is not None else None
+    results: dict[str, dict] = {}
+    flagged = reused = 0
+    analyze_seconds = 0.0
+
+    lines: list[str] = []
+    for path in _expand_resume_paths(resumes):
+        tokenized = _tokenize_file(path, cache, stem=stem)
+        row: dict = {"file": str(path)}
+        match = None
+        if hasher is not None and index is not None:
+            signature = hasher.signature(tokenized.counts)
+            match = index.query(signature)
+            if match is None:
+                index.insert(str(path), signature)
+            else:
+                row["duplicate_of"], row["similarity"] = match[0], round(match[1], 3)
+                flagged += 1
+        if match is not None and dedupe_mode == "reuse":
+            row["result"] = results[match[0]]
+            reused += 1
+        else:
+            start = time.perf_counter()
+            if compiled is not None:
+                row["result"] = {
+                    "overall_score": score_tokens(tokenized.counts, compiled, fuzzy=fuzzy)
+                }
+            else:
+                result = analyze_counts(
+                    tokenized.counts,
+                    target_keywords,
+                    resume_forms=tokenized.forms,
+                    fuzzy=fuzzy,
+                    resume_surface=tokenized.surface,
+                    target_surface=target_surface,
+                )
+                row["result"] = result.to_dict()
+            analyze_seconds += time.perf_counter() - start
+            results[str(path)] = row["result"]
+        lines.append(json.dumps(row))
+
+    output = "\n".join(lines)
+    if output_path:
+        output_path.write_text(output + "\n" if output else "", encoding="utf-8")
+        typer.echo(f"Wrote {len(lines)} results to {output_path}", err=True)
+    elif output:
+        typer.echo(output)
+    if cache is not None:
+        typer.echo(f"Cache: {cache.hits} hits, {cache.misses} misses ({cache.directory})", err=True)
+    if index is not None:
+        analyzed = len(lines) - reused
+        saved = analyze_seconds / analyzed * reused if analyzed else 0.0
+        typer.echo(
+            f"Dedupe: {flagged} of {len(lines)} resumes were near-duplicates; "
+            f"{reused} analyses reused (~{saved * 1000:.1f} ms saved)",
+            err=True,
+        )
+
+
+# Upper bound on a corpus shard, so results are written out as the run progresses.
+CORPUS_SHARD_BYTES = 64 * 1024 * 1024
+
+
+def _analyze_corpus_shard(
+    path: str,
+    fmt: str,
+    text_field: str,
+    id_field: str,
+    target_keywords: set[str],
+    target_surface: dict[str, str],
+    fuzzy: bool,
+    stem: bool,
+    only_score: bool,
+    byte_range: tuple[int, int],
+) -> list[str]:
+    """JSON lines for the corpus records that start in byte_range (runs in worker processes)."""
+    compiled = CompiledTargets(target_keywords) if only_score else None
+    lines: list[str] = []
+    with CorpusReader(path, fmt) as reader:
+        for i in reader.records_in(*byte_range):
+            row: dict = {"record": i}
+            try:
+                record = reader[i]
+            except ValueError as e:
+                row["error"] = f"invalid JSON: {e}"
+                lines.append(json.dumps(row))
+                continue
+            if isinstance(record, dict):
+                if id_field in record:
+                    row["id"] = record[id_field]
+                text = record.get(text_field)
+            else:
+                text = record
+            if not isinstance(text, str) or not text.strip():
+                row["error"] = f"no {text_field!r} text"
+            elif compiled is not None:
+                counts = TokenizedText.from_text(text, stem=stem).counts
+                row["result"] = {"overall_score": score_tokens(counts, compiled, fuzzy=fuzzy)}
+            else:
+                tokenized = TokenizedText.from_text(text, stem=stem)
+                result = analyze_counts(
+                    tokenized.counts,
+                    target_keywords,
+                    resume_forms=tokenized.forms,
+                    fuzzy=fuzzy,
+                    resume_surface=tokenized.surface,
+                    target_surface=target_surface,
+                )
+                row["result"] = result.to_dict()
+            lines.append(json.dumps(row))
+    return lines
+
+
+@app.command()
+def corpus(
+    path: Path = typer.Argument(..., help="Corpus file (.jsonl, or .lp/.lpj length-prefixed)"),
+    job: Path | None = typer.Option(None, "--job", "-j", help="Path to job description (.txt)"),
+    role: str | None = typer.Option(None, "--role", help="Role title (when not using full JD)"),
+    keywords: str | None = typer.Option(
+        None, "--keywords", "-k", help="Comma-separated target keywords"
+    ),
+    corpus_format: str | None = typer.Option(
+        None, "--format", help="jsonl | length-prefixed (default: from the file extension)"
+    ),
+    text_field: str = typer.Option(
+        "resume_text", "--text-field", help="Record field holding the resume text"
+    ),
+    id_field: str = typer.Option("id", "--id-field", help="Record field copied to the output"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes, one shard each"),
+    index_only: bool = typer.Option(
+        False, "--index-only", help="Only build or refresh the sidecar offset index"
+    ),
+    output_path: Path | None = typer.Option(
+        None, "--output", "-o", help="Write JSON lines to file (default: stdout)"
+    ),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Also match likely misspellings of target keywords"
+    ),
+    stem: bool = typer.Option(
+        False, "--stem", help="Reduce words to base forms (developed/developer -> develop)"
+    ),
+    only_score: bool = typer.Option(
+        False, "--score-only", help="Output only the overall score (skips ranking and the summary)"
+    ),
+) -> None:
+    """
+    Analyze every record of a single-file corpus (memory-mapped, see corpus.py); one JSON line
+    per record, in file order. With --workers, byte-range shards are analyzed in parallel.
+    """
+    if corpus_format is not None and corpus_format not in CORPUS_FORMATS:
+        typer.echo("Error: --format must be one of: jsonl, length-prefixed.", err=True)
+        raise typer.Exit(1)
+    if workers < 1:
+        typer.echo("Error: --workers must be >= 1.", err=True)
+        raise typer.Exit(1)
+    if not path.exists():
+        typer.echo(f"Error: file not found: {path}", err=True)
+        raise typer.Exit(1)
+    try:
+        reader = CorpusReader(path, corpus_format)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from e
+    with reader:
+        built = "built" if reader.index_built else "loaded"
+        typer.echo(f"Index: {len(reader)} records ({built} {reader.index_path})", err=True)
+        # A few shards per worker balance uneven records; none larger than CORPUS_SHARD_BYTES.
+        min_shards = workers * 4 if workers > 1 else 1
+        ranges = reader.byte_ranges(max(min_shards, -(-reader.size // CORPUS_SHARD_BYTES)))
+        fmt = reader.format
+    if index_only:
+        return
+
+    job_description = _load_text(job) if job else None
+    keyword_list = [k.strip() for k in keywords.split(",") if k.strip()] if keywords else None
+    if not job_description and not keyword_list and not role:
+        typer.echo("Error: provide --job, and/or --role and/or --keywords.", err=True)
+        raise typer.Exit(1)
+    target_keywords, target_surface = build_targets(
+        job_description or None, role, keyword_list, stem=stem
+    )
+    analyze_shard = functools.partial(
+        _analyze_corpus_shard,
+        str(path),
+        fmt,
+        text_field,
+        id_field,
+        target_keywords,
+        target_surface,
+        fuzzy,
+        stem,
+        only_score,
+    )
+
+    out = output_path.open("w", encoding="utf-8") if output_path else sys.stdout
+    written = 0
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                shards = pool.map(analyze_shard, ranges)
+                for lines in shards:
+                    out.writelines(line + "\n" for line in lines)
+                    written += len(lines)
+        else:
+            for byte_range in ranges:
+                lines = analyze_shard(byte_range)
+                out.writelines(line + "\n" for line in lines)
+                written += len(lines)
+    finally:
+        if output_path:
+            out.close()
+    if output_path:
+        typer.echo(f"Wrote {written} results to {output_path}", err=True)
+
+
+@app.command("mine-synonyms")
+def mine_synonyms_command(
+    inputs: list[Path] = typer.Argument(
+        ..., help="Corpus files (.jsonl, .lp/.lpj), document files or directories"
+    ),
+    output_path: Path = typer.Option(
+        ..., "--output", "-o", help="Candidate file to write (JSON, for review)"
+    ),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for both passes"),
+    text_field: str = typer.Option(
+        "resume_text", "--text-field", help="Record field holding the text (corpus files)"
+    ),
+    min_count: int = typer.Option(
+        DEFAULT_MIN_COUNT, "--min-count", help="Ignore terms seen fewer times"
+    ),
+    max_terms: int = typer.Option(
+        DEFAULT_MAX_TERMS, "--max-terms", help="Bound on distinct terms held in memory"
+    ),
+    contexts: int = typer.Option(
+        DEFAULT_CONTEXTS, "--contexts", help="Most frequent keywords used as context features"
+    ),
+    window: int = typer.Option(DEFAULT_WINDOW, "--window", help="Context window (keywords)"),
+    min_similarity: float = typer.Option(
+        DEFAULT_MIN_SIMILARITY, "--min-similarity", help="Minimum context similarity (0-1)"
+    ),
+) -> None:
+    """
+    Propose synonym/variant candidates from co-occurrence statistics (see mining.py). Review
+    the output, set "accept": true on good rows and load it with SYNONYMS_FILE=<file>.
+    """
+    if workers < 1:
+        typer.echo("Error: --workers must be >= 1.", err=True)
+        raise typer.Exit(1)
+    try:
+        report = mine_synonyms(
+            _expand_resume_paths(inputs),
+            workers=workers,
+            text_field=text_field,
+            min_count=min_count,
+            max_terms=max_terms,
+            contexts=contexts,
+            window=window,
+            min_similarity=min_similarity,
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from e
+    write_candidates(report, output_path)
+    stats = report["stats"]
+    typer.echo(
+        f"Wrote {len(report['candidates'])} candidates to {output_path} "
+        f"({stats['documents']} documents, {stats['tokens']} tokens in {stats['seconds']:.1f} s, "
+        f"{stats['documents_per_second']:.0f} docs/s)",
+        err=True,
+    )
+
+
 @app.command()
 def version() -> None:
     """Show version."""
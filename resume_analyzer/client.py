@@ -0,0 +1,379 @@
+"""Python client for the analyzer API: pooled connections, concurrency limits, retries, batching.
+
+    from resume_analyzer.client import Client
+
+    with Client("http://localhost:8000") as client:
+        response = client.analyze("Senior Python developer...", keywords=["python", "kafka"])
+        response["result"]["overall_score"]
+
+Client (for threads) and AsyncClient (asyncio or trio) hold one httpx connection pool, so calls
+after the first reuse kept-alive connections instead of paying TCP/TLS setup. Each client has
+at most max_concurrency requests in flight; other calls wait for a slot. A 503 (server warming
+up or overloaded) or a failed connection is retried up to `retries` times, with exponential
+backoff and jitter, or after the server's Retry-After.
+
+Batching: analyze_many() sends request bodies to POST /analyze/batch, up to max_batch per
+request. AsyncClient(auto_batch=True) collects analyze() calls made within batch_window seconds
+and sends them as one batch. A server without /analyze/batch (404/405) gets one request per
+call.
+
+Requires httpx: pip install "resume-analyzer[client]".
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Self
+
+import anyio
+
+try:  # Optional: pip install "resume-analyzer[client]"
+    import httpx
+except ImportError:  # pragma: no cover - exercised when httpx is absent
+    httpx = None
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+# First retry delay in seconds; doubles per attempt, up to MAX_BACKOFF.
+DEFAULT_BACKOFF = 0.1
+MAX_BACKOFF = 10.0
+# Items per POST /analyze/batch (the server accepts up to api.main.MAX_BATCH_ITEMS).
+DEFAULT_MAX_BATCH = 64
+DEFAULT_BATCH_WINDOW = 0.005
+
+ANALYZE_PATH = "/analyze"
+BATCH_PATH = "/analyze/batch"
+_RETRY_STATUS = 503
+_NO_BATCH_STATUS = frozenset({404, 405})
+
+Outcome = dict[str, Any] | Exception
+
+
+class APIError(Exception):
+    """A non-success response (or batch item): its HTTP status and the server's detail."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            'resume_analyzer.client requires httpx: pip install "resume-analyzer[client]"'
+        )
+
+
+def _body(
+    resume_text: str,
+    job_description: str | None = None,
+    role_title: str | None = None,
+    keywords: Sequence[str] | None = None,
+    fuzzy: bool = False,
+    stem: bool = False,
+    score_only: bool = False,
+) -> dict[str, Any]:
+    """POST /analyze request body (unset fields left out)."""
+    body: dict[str, Any] = {"resume_text": resume_text}
+    if job_description is not None:
+        body["job_description"] = job_description
+    if role_title is not None:
+        body["role_title"] = role_title
+    if keywords is not None:
+        body["keywords"] = list(keywords)
+    for name, flag in (("fuzzy", fuzzy), ("stem", stem), ("score_only", score_only)):
+        if flag:
+            body[name] = True
+    return body
+
+
+def _check(response: httpx.Response) -> Any:
+    """Decoded JSON of a 2xx response; raises APIError otherwise."""
+    if response.is_success:
+        return response.json()
+    try:
+        data = response.json()
+    except ValueError:
+        data = response.text
+    raise APIError(response.status_code, data.get("detail") if isinstance(data, dict) else data)
+
+
+def _item_outcome(item: Mapping[str, Any]) -> Outcome:
+    """One /analyze/batch entry as an /analyze response, or an APIError."""
+    if item["status"] == 200:
+        return {"result": item["result"], "readable_summary": item["readable_summary"]}
+    return APIError(item["status"], item.get("detail"))
+
+
+def _retry_delay(attempt: int, backoff: float, response: httpx.Response | None) -> float:
+    """Seconds to wait before retry number attempt + 1."""
+    retry_after = response.headers.get("retry-after", "") if response is not None else ""
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_BACKOFF)
+    return min(backoff * 2**attempt, MAX_BACKOFF) * random.uniform(0.5, 1.0)
+
+
+def _chunks(items: list[dict[str, Any]], size: int) -> list[list[dict[str, Any]]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _validate(max_concurrency: int, retries: int, max_batch: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    if retries < 0:
+        raise ValueError("retries must be >= 0")
+    if max_batch < 1:
+        raise ValueError("max_batch must be >= 1")
+
+
+class Client:
+    """
+    Blocking API client; share one per process (it is thread-safe). http: an httpx.Client to
+    use instead of building one (e.g. a Starlette TestClient); it is not closed by close().
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        headers: Mapping[str, str] | None = None,
+        http: httpx.Client | None = None,
+    ) -> None:
+        _require_httpx()
+        _validate(max_concurrency, retries, max_batch)
+        self._owns_http = http is None
+        self._http = http or httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+            ),
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_batch = max_batch
+        # Whether the server has /analyze/batch; None until the first batch is sent.
+        self.batch_supported: bool | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_http:
+            self._http.close()
+
+    def _post(self, path: str, body: Mapping[str, Any]) -> httpx.Response:
+        """POST within a concurrency slot, retrying 503s and failed connections."""
+        attempt = 0
+        while True:
+            response = None
+            try:
+                with self._slots:
+                    response = self._http.post(path, json=body)
+            except httpx.ConnectError:
+                if attempt >= self.retries:
+                    raise
+            else:
+                if response.status_code != _RETRY_STATUS or attempt >= self.retries:
+                    return response
+            time.sleep(_retry_delay(attempt, self.backoff, response))
+            attempt += 1
+
+    def analyze(self, resume_text: str, **options: Any) -> dict[str, Any]:
+        """
+        POST /analyze. options: job_description, role_title, keywords, fuzzy, stem, score_only.
+        Returns {"result": ..., "readable_summary": ...}; raises APIError.
+        """
+        return _check(self._post(ANALYZE_PATH, _body(resume_text, **options)))
+
+    def analyze_many(self, bodies: Iterable[Mapping[str, Any]]) -> list[Outcome]:
+        """
+        Analyze POST /analyze request bodies in batches of max_batch. One entry per body, in
+        order: the response, or the APIError for that body (not raised).
+        """
+        out: list[Outcome] = []
+        for chunk in _chunks([dict(b) for b in bodies], self.max_batch):
+            out.extend(self._send_batch(chunk))
+        return out
+
+    def _send_batch(self, bodies: list[dict[str, Any]]) -> list[Outcome]:
+        if len(bodies) > 1 and self.batch_supported is not False:
+            response = self._post(BATCH_PATH, {"items": bodies})
+            if response.status_code not in _NO_BATCH_STATUS:
+                self.batch_supported = True
+                return [_item_outcome(item) for item in _check(response)["results"]]
+            self.batch_supported = False
+        if len(bodies) == 1:
+            return [self._single(bodies[0])]
+        with ThreadPoolExecutor(min(self.max_concurrency, len(bodies))) as pool:
+            return list(pool.map(self._single, bodies))
+
+    def _single(self, body: dict[str, Any]) -> Outcome:
+        try:
+            return _check(self._post(ANALYZE_PATH, body))
+        except APIError as e:
+            return e
+
+
+class _Pending:
+    """An auto-batched analyze() call waiting for its batch."""
+
+    __slots__ = ("body", "done", "outcome")
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        self.body = body
+        self.done = anyio.Event()
+        self.outcome: Outcome | None = None
+
+
+class AsyncClient:
+    """
+    Async API client (asyncio or trio); use one per event loop. auto_batch: analyze() calls
+    made within batch_window seconds of each other go out as one POST /analyze/batch (up to
+    max_batch calls). http: an httpx.AsyncClient to use (e.g. on an httpx.ASGITransport); it
+    is not closed by aclose().
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        auto_batch: bool = False,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        headers: Mapping[str, str] | None = None,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
+        _require_httpx()
+        _validate(max_concurrency, retries, max_batch)
+        self._owns_http = http is None
+        self._http = http or httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+            ),
+        )
+        self._slots = anyio.Semaphore(max_concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_batch = max_batch
+        self.auto_batch = auto_batch
+        self.batch_window = batch_window
+        self.batch_supported: bool | None = None
+        self._open_batch: list[_Pending] | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def _post(self, path: str, body: Mapping[str, Any]) -> httpx.Response:
+        """POST within a concurrency slot, retrying 503s and failed connections."""
+        attempt = 0
+        while True:
+            response = None
+            try:
+                async with self._slots:
+                    response = await self._http.post(path, json=body)
+            except httpx.ConnectError:
+                if attempt >= self.retries:
+                    raise
+            else:
+                if response.status_code != _RETRY_STATUS or attempt >= self.retries:
+                    return response
+            await anyio.sleep(_retry_delay(attempt, self.backoff, response))
+            attempt += 1
+
+    async def analyze(self, resume_text: str, **options: Any) -> dict[str, Any]:
+        """POST /analyze (or part of an auto-batch); see Client.analyze()."""
+        body = _body(resume_text, **options)
+        if not self.auto_batch or self.batch_supported is False:
+            return _check(await self._post(ANALYZE_PATH, body))
+        pending = _Pending(body)
+        batch = self._open_batch
+        if batch is not None and len(batch) < self.max_batch:
+            batch.append(pending)
+            await pending.done.wait()
+        else:
+            # This call opens a batch and sends it when the window closes. Shielded: the
+            # other calls in the batch wait on it.
+            batch = self._open_batch = [pending]
+            with anyio.CancelScope(shield=True):
+                await anyio.sleep(self.batch_window)
+                if self._open_batch is batch:
+                    self._open_batch = None
+                await self._flush(batch)
+        if isinstance(pending.outcome, Exception):
+            raise pending.outcome
+        return pending.outcome
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        try:
+            outcomes = await self._send_batch([p.body for p in batch])
+        except Exception as e:  # noqa: BLE001 - every call in the batch gets it
+            outcomes = [e] * len(batch)
+        for pending, outcome in zip(batch, outcomes):
+            pending.outcome = outcome
+            pending.done.set()
+
+    async def analyze_many(self, bodies: Iterable[Mapping[str, Any]]) -> list[Outcome]:
+        """Concurrent batches of max_batch; see Client.analyze_many()."""
+        chunks = _chunks([dict(b) for b in bodies], self.max_batch)
+        results: list[list[Outcome]] = [[] for _ in chunks]
+
+        async def send(i: int, chunk: list[dict[str, Any]]) -> None:
+            results[i] = await self._send_batch(chunk)
+
+        async with anyio.create_task_group() as tg:
+            for i, chunk in enumerate(chunks):
+                tg.start_soon(send, i, chunk)
+        return [outcome for chunk in results for outcome in chunk]
+
+    async def _send_batch(self, bodies: list[dict[str, Any]]) -> list[Outcome]:
+        if len(bodies) > 1 and self.batch_supported is not False:
+            response = await self._post(BATCH_PATH, {"items": bodies})
+            if response.status_code not in _NO_BATCH_STATUS:
+                self.batch_supported = True
+                return [_item_outcome(item) for item in _check(response)["results"]]
+            self.batch_supported = False
+        outcomes: list[Outcome] = [{} for _ in bodies]
+
+        async def single(i: int) -> None:
+            try:
+                outcomes[i] = _check(await self._post(ANALYZE_PATH, bodies[i]))
+            except APIError as e:
+                outcomes[i] = e
+
+        async with anyio.create_task_group() as tg:
+            for i in range(len(bodies)):
+                tg.start_soon(single, i)
+        return outcomes
@@ -0,0 +1,208 @@
+"""Memory-mapped reader for single-file resume corpora (JSONL or length-prefixed records).
+
+The file is mmap'ed read-only; a record is decoded only when it is accessed, so opening a
+multi-GB archive costs no more than loading its offset index. The index (start and end byte
+of every record) lives in a sidecar file next to the corpus (`<corpus>.idx`), built on first
+open and rebuilt when the corpus's size or mtime changes. It is mmap'ed too, so lookups by
+index or slice touch only the pages they need.
+
+Formats:
+    jsonl             one JSON value per line; empty lines are skipped
+    length-prefixed   records of a 4-byte little-endian length followed by that many bytes of
+                      UTF-8 JSON (no escaping or line scanning needed)
+
+byte_ranges() splits the file into contiguous byte ranges and records_in() maps a range to
+the records that start in it, so worker processes can each open the corpus and scan their own
+shard (see `resume-analyzer corpus --workers`).
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Self
+
+CORPUS_FORMATS = ("jsonl", "length-prefixed")
+LENGTH_PREFIXED_EXTENSIONS = (".lp", ".lpj")
+INDEX_SUFFIX = ".idx"
+
+# magic, corpus size, corpus mtime_ns, record count; followed by count starts and count ends.
+_INDEX_HEADER = struct.Struct("<8sQqQ")
+_INDEX_MAGIC = b"RAIDX1" + (b"LE" if sys.byteorder == "little" else b"BE")
+_LENGTH = struct.Struct("<I")
+
+
+def detect_corpus_format(path: str | os.PathLike[str]) -> str:
+    """Corpus format from the file extension: length-prefixed for .lp/.lpj, else jsonl."""
+    return "length-prefixed" if Path(path).suffix.lower() in LENGTH_PREFIXED_EXTENSIONS else "jsonl"
+
+
+def write_length_prefixed(records: Iterable[Any], path: str | os.PathLike[str]) -> int:
+    """Write JSON-serializable records as a length-prefixed corpus; returns the count."""
+    count = 0
+    with open(path, "wb") as f:
+        for record in records:
+            payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+            f.write(_LENGTH.pack(len(payload)))
+            f.write(payload)
+            count += 1
+    return count
+
+
+def _scan_jsonl(mm: mmap.mmap, size: int) -> tuple[array, array]:
+    starts, ends = array("Q"), array("Q")
+    pos = 0
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        end = size if nl == -1 else nl
+        stop = end - 1 if end > pos and mm[end - 1] == 0x0D else end  # "\r\n"
+        if stop > pos:
+            starts.append(pos)
+            ends.append(stop)
+        pos = end + 1
+    return starts, ends
+
+
+def _scan_length_prefixed(mm: mmap.mmap, size: int) -> tuple[array, array]:
+    starts, ends = array("Q"), array("Q")
+    pos = 0
+    while pos < size:
+        if pos + _LENGTH.size > size:
+            raise ValueError(f"truncated length prefix at byte {pos}")
+        (length,) = _LENGTH.unpack_from(mm, pos)
+        start = pos + _LENGTH.size
+        if start + length > size:
+            raise ValueError(f"record at byte {pos} runs past the end of the file")
+        starts.append(start)
+        ends.append(start + length)
+        pos = start + length
+    return starts, ends
+
+
+class CorpusReader:
+    """
+    Random access to the records of a JSONL or length-prefixed corpus without reading it
+    into memory. reader[i] and reader[a:b] decode records; raw(i) returns the undecoded bytes.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        fmt: str | None = None,
+        index_path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.format = fmt or detect_corpus_format(self.path)
+        if self.format not in CORPUS_FORMATS:
+            raise ValueError(f"unknown corpus format {self.format!r}")
+        self.index_path = Path(index_path) if index_path else Path(f"{self.path}{INDEX_SUFFIX}")
+        self._file = open(self.path, "rb")  # noqa: SIM115 - held open for the mmap
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.index_built = False
+        self._index_mm: mmap.mmap | None = None
+        if not self._load_index(stat.st_mtime_ns):
+            self._build_index(stat.st_mtime_ns)
+            self._load_index(stat.st_mtime_ns)
+
+    def _load_index(self, mtime_ns: int) -> bool:
+        """Map the sidecar index if it matches this corpus; False if missing or stale."""
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) < _INDEX_HEADER.size:
+                    return False
+                magic, size, mtime, count = _INDEX_HEADER.unpack(header)
+                if (magic, size, mtime) != (_INDEX_MAGIC, self.size, mtime_ns):
+                    return False
+                if os.fstat(f.fileno()).st_size != _INDEX_HEADER.size + 16 * count:
+                    return False
+                if count:
+                    self._index_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return False
+        if count:
+            offsets = memoryview(self._index_mm)[_INDEX_HEADER.size :].cast("Q")
+            self._starts, self._ends = offsets[:count], offsets[count:]
+        else:
+            self._starts = self._ends = memoryview(array("Q"))
+        return True
+
+    def _build_index(self, mtime_ns: int) -> None:
+        """Scan the corpus once and write the sidecar index atomically."""
+        if self._mm is None:
+            starts, ends = array("Q"), array("Q")
+        elif self.format == "jsonl":
+            starts, ends = _scan_jsonl(self._mm, self.size)
+        else:
+            starts, ends = _scan_length_prefixed(self._mm, self.size)
+        header = _INDEX_HEADER.pack(_INDEX_MAGIC, self.size, mtime_ns, len(starts))
+        fd, tmp = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                starts.tofile(f)
+                ends.tofile(f)
+            os.replace(tmp, self.index_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.index_built = True
+
+    def close(self) -> None:
+        # Views into the maps must be released before the maps can close.
+        self._starts = self._ends = memoryview(array("Q"))
+        for mm in (self._index_mm, self._mm):
+            if mm is not None:
+                mm.close()
+        self._index_mm = self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def raw(self, i: int) -> bytes:
+        """Undecoded bytes of record i (copies only that record)."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("corpus record index out of range")
+        return self._mm[self._starts[i] : self._ends[i]]
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return [json.loads(self.raw(i)) for i in range(*key.indices(len(self)))]
+        return json.loads(self.raw(key))
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield json.loads(self.raw(i))
+
+    def byte_ranges(self, n: int) -> list[tuple[int, int]]:
+        """Split the file into n contiguous (start, end) byte ranges of about equal size."""
+        if n < 1:
+            raise ValueError("n must be >= 1")
+        bounds = [self.size * k // n for k in range(n + 1)]
+        return list(itertools.pairwise(bounds))
+
+    def records_in(self, start: int, end: int) -> range:
+        """Indexes of the records that start in [start, end); byte_ranges() cover every record."""
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_left(self._starts, end)
+        return range(lo, hi)
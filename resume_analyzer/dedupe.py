@@ -0,0 +1,117 @@
+"""Near-duplicate detection for batch runs: MinHash signatures over token sets + an LSH index.
+
+A signature's slots agree with another's with probability (approximately) equal to the
+Jaccard similarity of the two token sets. The LSH index splits signatures into bands so
+that only resumes sharing a band are compared; candidates are then checked against the
+threshold.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+
+_MAX_HASH = (1 << 64) - 1
+# Odd 64-bit constant (golden ratio) used to spread seeds into per-hasher salts.
+_MIX_MULTIPLIER = 0x9E3779B97F4A7C15
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_THRESHOLD = 0.9
+
+
+class MinHasher:
+    """
+    One-permutation MinHash: each token is hashed once and the hash space is split into
+    num_perm bins, each keeping its minimum. Empty bins borrow the nearest non-empty bin to
+    the right (rotation densification), so signatures stay comparable slot by slot.
+    Cost is O(tokens) rather than O(tokens * num_perm).
+
+    Token hashes come from the built-in str hash (SipHash, cached on each string, so tokens
+    that are already dict keys cost nothing to hash) XORed with a per-seed salt. str hashes
+    are salted per process, so signatures are only comparable within one process.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1) -> None:
+        if num_perm < 1 or num_perm & (num_perm - 1):
+            raise ValueError("num_perm must be a power of two")
+        self.num_perm = num_perm
+        self._shift = num_perm.bit_length() - 1
+        self._offset = (seed * _MIX_MULTIPLIER) & _MAX_HASH
+
+    def signature(self, tokens: Iterable[str]) -> tuple[int, ...]:
+        """Signature of the token set (duplicates ignored). Empty input gives all-max slots."""
+        k, mask, shift, offset = self.num_perm, self.num_perm - 1, self._shift, self._offset
+        bins = [_MAX_HASH] * k
+        for t in tokens if isinstance(tokens, (set, frozenset, Mapping)) else set(tokens):
+            h = (hash(t) ^ offset) & _MAX_HASH
+            b, v = h & mask, h >> shift
+            if v < bins[b]:
+                bins[b] = v
+        if _MAX_HASH not in bins or all(v == _MAX_HASH for v in bins):
+            return tuple(bins)
+        out = list(bins)
+        for i in range(k):
+            if bins[i] == _MAX_HASH:
+                step = 1
+                while bins[(i + step) % k] == _MAX_HASH:
+                    step += 1
+                # Offset by distance so borrowed values differ from the donor's own slot.
+                out[i] = bins[(i + step) % k] + step * (_MAX_HASH >> shift)
+        return tuple(out)
+
+
+def estimate_jaccard(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """Fraction of agreeing slots: an estimate of the Jaccard similarity of the token sets."""
+    if len(sig_a) != len(sig_b):
+        raise ValueError("signatures must have the same number of permutations")
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def lsh_params(threshold: float, num_perm: int, recall: float = 0.99) -> tuple[int, int]:
+    """
+    (bands, rows) with bands * rows <= num_perm: the most selective banding (fewest candidate
+    comparisons) that still makes a pair at exactly `threshold` a candidate with >= recall.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures; query() returns the most similar key above threshold."""
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self._buckets: list[dict[tuple[int, ...], list[Hashable]]] = [{} for _ in range(self.bands)]
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        r = self.rows
+        return [signature[i * r : (i + 1) * r] for i in range(self.bands)]
+
+    def insert(self, key: Hashable, signature: tuple[int, ...]) -> None:
+        self._signatures[key] = signature
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band, []).append(key)
+
+    def query(self, signature: tuple[int, ...]) -> tuple[Hashable, float] | None:
+        """(key, estimated Jaccard) of the best indexed match at or above threshold, else None."""
+        candidates: set[Hashable] = set()
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band, ()))
+        best: tuple[Hashable, float] | None = None
+        for key in candidates:
+            sim = estimate_jaccard(signature, self._signatures[key])
+            if sim >= self.threshold and (best is None or sim > best[1]):
+                best = (key, sim)
+        return best
@@ -0,0 +1,126 @@
+"""Streaming text extraction from DOCX and HTML (standard library only).
+
+Extractors yield text fragments as they are parsed; feed them to
+extract.count_keywords_from_fragments() so no DOM or full-text string is built.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Iterable, Iterator
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import BinaryIO, TextIO
+from xml.etree.ElementTree import iterparse
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+DOCX_EXTENSIONS = (".docx",)
+HTML_EXTENSIONS = (".html", ".htm", ".xhtml")
+
+# Characters read per step when streaming HTML.
+READ_CHUNK_SIZE = 64 * 1024
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_TEXT = _W + "t"
+_DOCX_BREAKS = frozenset({_W + "tab", _W + "br", _W + "cr"})
+_DOCX_PARAGRAPH = _W + "p"
+
+
+def detect_format(filename: str | None = None, content_type: str | None = None) -> str:
+    """Return "docx", "html" or "text" from a content type (preferred) or file extension."""
+    if content_type:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type == DOCX_CONTENT_TYPE:
+            return "docx"
+        if media_type in HTML_CONTENT_TYPES:
+            return "html"
+        if media_type.startswith("text/"):
+            return "text"
+    suffix = Path(filename).suffix.lower() if filename else ""
+    if suffix in DOCX_EXTENSIONS:
+        return "docx"
+    if suffix in HTML_EXTENSIONS:
+        return "html"
+    return "text"
+
+
+def iter_docx_fragments(source: str | Path | BinaryIO) -> Iterator[str]:
+    """
+    Yield text from word/document.xml with incremental XML parsing.
+    Runs (<w:t>) are yielded as-is since Word splits words across runs; paragraphs,
+    tabs and line breaks yield whitespace. Finished paragraphs are cleared to bound memory.
+    """
+    with zipfile.ZipFile(source) as zf, zf.open("word/document.xml") as xml:
+        for _, elem in iterparse(xml, events=("end",)):
+            tag = elem.tag
+            if tag == _DOCX_TEXT:
+                if elem.text:
+                    yield elem.text
+            elif tag in _DOCX_BREAKS:
+                yield " "
+            elif tag == _DOCX_PARAGRAPH:
+                yield "\n"
+                elem.clear()
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collects visible text fragments; block-level tags become whitespace."""
+
+    _SKIP = frozenset({"script", "style", "template"})
+    _BLOCK = frozenset({
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset",
+        "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+        "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+    })
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.fragments: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self._SKIP:
+            self._skip_depth += 1
+        elif tag in self._BLOCK:
+            self.fragments.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self._BLOCK:
+            self.fragments.append(" ")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.fragments.append(data)
+
+
+def iter_html_fragments(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield visible text fragments from HTML supplied in chunks (script/style skipped)."""
+    parser = _HTMLTextParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.fragments
+        parser.fragments.clear()
+    parser.close()
+    yield from parser.fragments
+
+
+def iter_text_chunks(stream: TextIO, size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Read a text stream in fixed-size chunks."""
+    while chunk := stream.read(size):
+        yield chunk
+
+
+def iter_file_fragments(path: Path, fmt: str | None = None) -> Iterator[str]:
+    """Yield text fragments from a .docx, .html or plain-text file."""
+    fmt = fmt or detect_format(path.name)
+    if fmt == "docx":
+        yield from iter_docx_fragments(path)
+        return
+    with path.open(encoding="utf-8", errors="replace") as f:
+        if fmt == "html":
+            yield from iter_html_fragments(iter_text_chunks(f))
+        else:
+            yield from iter_text_chunks(f)
@@ -2,34 +2,109 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
 
-from resume_analyzer.normalize import tokenize_without_stopwords
+from resume_analyzer.heavy import HeavyHitters
+from resume_analyzer.normalize import (
+    iter_tokens,
+    iter_tokens_from_fragments,
+    tokenize_without_stopwords,
+)
+from resume_analyzer.stem import stem_tokens
+from resume_analyzer.tables import current_tables
+from resume_analyzer.vocab import CompactCounts, Vocabulary, count_ids
 
 DEFAULT_TOP_N = 30
 MIN_TOKEN_LEN = 2
+# Distinct keywords extract_keywords() counts exactly; beyond it, a heavy-hitter summary.
+MAX_EXACT_KEYWORDS = 10_000
 
 
-def extract_keywords(text: str, top_n: int = DEFAULT_TOP_N) -> list[tuple[str, int]]:
+def _keywords(tokens: Iterable[str], stem: bool) -> Iterator[str]:
+    """Drop stopwords and short tokens; optionally reduce the rest to base forms (see stem.py)."""
+    stopwords = current_tables().stopwords
+    kept = (t for t in tokens if len(t) >= MIN_TOKEN_LEN and t not in stopwords)
+    return stem_tokens(kept) if stem else kept
+
+
+def iter_keywords(text: str, stem: bool = False) -> Iterator[str]:
+    """Keyword stream of text, in order (what count_keywords() counts)."""
+    return _keywords(iter_tokens(text or ""), stem)
+
+
+def iter_keywords_from_fragments(fragments: Iterable[str], stem: bool = False) -> Iterator[str]:
+    """Keyword stream of a sequence of text fragments (see documents.py)."""
+    return _keywords(iter_tokens_from_fragments(fragments), stem)
+
+
+def count_keywords(text: str, stem: bool = False) -> Counter[str]:
+    """Keyword frequencies from text (stopwords and short tokens dropped)."""
+    if not text:
+        return Counter()
+    return Counter(iter_keywords(text, stem))
+
+
+def count_keywords_compact(
+    text: str, vocab: Vocabulary | None = None, stem: bool = False
+) -> CompactCounts:
+    """
+    Like count_keywords(), but via integer token IDs and array-backed counts (see vocab.py).
+    vocab: intern into a caller-owned Vocabulary (which grows with every distinct term it
+    sees); default: a new one per call, freed with the result.
+    """
+    if vocab is None:
+        vocab = Vocabulary()
+    return count_ids(vocab.encode(iter_keywords(text, stem)), vocab)
+
+
+def count_keywords_from_fragments(fragments: Iterable[str], stem: bool = False) -> Counter[str]:
+    """Like count_keywords(), but consumes a stream of text fragments (see documents.py)."""
+    return Counter(iter_keywords_from_fragments(fragments, stem))
+
+
+def rank_keywords(counts: Mapping[str, int], top_n: int = DEFAULT_TOP_N) -> list[tuple[str, int]]:
+    """Rank (term, count) pairs by count descending, then alphabetically; keep top_n."""
+    if isinstance(counts, (CompactCounts, HeavyHitters)):
+        return counts.ranked(top_n)
+    # Partial selection: count desc, then term asc for stability.
+    return heapq.nsmallest(top_n, counts.items(), key=lambda x: (-x[1], x[0]))
+
+
+def count_keywords_bounded(
+    text: str, stem: bool = False, capacity: int = MAX_EXACT_KEYWORDS
+) -> HeavyHitters:
+    """
+    Like count_keywords(), in bounded memory: exact up to capacity distinct keywords, then a
+    heavy-hitter summary with error bounds (see heavy.py).
+    """
+    return HeavyHitters(capacity).update(iter_keywords(text, stem))
+
+
+def extract_keywords(
+    text: str,
+    top_n: int = DEFAULT_TOP_N,
+    stem: bool = False,
+    max_exact: int | None = MAX_EXACT_KEYWORDS,
+) -> list[tuple[str, int]]:
     """
     Extract ranked keywords from text: tokenize, count, return top_n by frequency.
     Returns list of (term, count) sorted by count descending, then alphabetically.
+    Counting is exact up to max_exact distinct keywords; above it, memory stays bounded and
+    counts are heavy-hitter estimates (count_keywords_bounded()). None: always exact.
     """
-    if not text:
-        return []
-    tokens = tokenize_without_stopwords(text)
-    tokens = [t for t in tokens if len(t) >= MIN_TOKEN_LEN]
-    if not tokens:
+    if max_exact is None:
+        counts: Mapping[str, int] = count_keywords(text, stem=stem)
+    else:
+        counts = count_keywords_bounded(text, stem=stem, capacity=max_exact)
+    if not counts:
         return []
-    counts = Counter(tokens)
-    # Sort by count desc, then term asc for stability.
-    ranked = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
-    return ranked[:top_n]
+    return rank_keywords(counts, top_n)
 
 
-def extract_keyword_set(text: str) -> set[str]:
+def extract_keyword_set(text: str, stem: bool = False) -> set[str]:
     """All unique keywords (normalized) from text. Used for matching."""
     if not text:
         return set()
-    tokens = tokenize_without_stopwords(text)
-    return {t for t in tokens if len(t) >= MIN_TOKEN_LEN}
+    return set(_keywords(tokenize_without_stopwords(text), stem))
@@ -0,0 +1,160 @@
+"""Typo-tolerant matching with a SymSpell-style deletion index.
+
+Every vocabulary term is indexed under all strings reachable by deleting up to
+max_distance characters. A query generates its own deletes and looks them up, so finding
+all terms within edit distance 1-2 costs a few dozen dict lookups instead of comparing
+against every term. Candidates are verified with optimal string alignment distance
+(Levenshtein plus adjacent transpositions, so "dokcer" -> "docker" is 1 edit).
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterable
+
+from resume_analyzer.budget import CHECK_EVERY, current_budget
+from resume_analyzer.synonyms import all_canonical_forms
+from resume_analyzer.tables import current_tables
+
+MAX_EDIT_DISTANCE = 2
+# Shorter terms are too easy to confuse ("react" / "reach"), so they only match exactly.
+MIN_FUZZY_LENGTH = 6
+# Terms at least this long may be 2 edits away; shorter fuzzy terms allow 1.
+MIN_LENGTH_FOR_TWO_EDITS = 10
+
+
+def allowed_distance(term: str) -> int:
+    """Edit distance tolerated for a term of this length (0 = exact only)."""
+    if len(term) < MIN_FUZZY_LENGTH:
+        return 0
+    return 2 if len(term) >= MIN_LENGTH_FOR_TWO_EDITS else 1
+
+
+def osa_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is known to exceed it."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _deletes(term: str, max_distance: int) -> set[str]:
+    """term plus every string reachable by deleting up to max_distance characters."""
+    out = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))} - out
+        out |= frontier
+    return out
+
+
+class DeletionIndex:
+    """Deletion-neighborhood index over a vocabulary; optionally layered on a parent index."""
+
+    def __init__(
+        self,
+        terms: Iterable[str] = (),
+        max_distance: int = MAX_EDIT_DISTANCE,
+        parent: DeletionIndex | None = None,
+    ) -> None:
+        self.max_distance = max_distance
+        self.parent = parent
+        self._terms: set[str] = set()
+        self._deletes: dict[str, set[str]] = {}
+        for t in terms:
+            self.add(t)
+
+    def add(self, term: str) -> None:
+        if term in self._terms or len(term) < MIN_FUZZY_LENGTH - self.max_distance:
+            return
+        self._terms.add(term)
+        for d in _deletes(term, self.max_distance):
+            self._deletes.setdefault(d, set()).add(term)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms or (self.parent is not None and term in self.parent)
+
+    def _candidates(self, deletes: set[str]) -> set[str]:
+        found: set[str] = set()
+        for d in deletes:
+            found |= self._deletes.get(d, set())
+        if self.parent is not None:
+            found |= self.parent._candidates(deletes)
+        return found
+
+    def lookup(self, term: str, max_distance: int | None = None) -> list[tuple[str, int]]:
+        """Indexed terms within max_distance (default: allowed_distance(term)), nearest first."""
+        limit = allowed_distance(term) if max_distance is None else max_distance
+        limit = min(limit, self.max_distance)
+        if limit <= 0:
+            return [(term, 0)] if term in self else []
+        hits = []
+        for candidate in self._candidates(_deletes(term, limit)):
+            d = osa_distance(term, candidate, limit)
+            if d <= limit:
+                hits.append((candidate, d))
+        return sorted(hits, key=lambda x: (x[1], x[0]))
+
+
+# The current and previous tables' indexes (a swap builds the new one before installing it).
+@functools.lru_cache(maxsize=2)
+def vocabulary_index(known_terms: frozenset[str]) -> DeletionIndex:
+    """Index of a tables' known terms, built once per process and table version."""
+    return DeletionIndex(known_terms)
+
+
+def known_vocabulary_index() -> DeletionIndex:
+    """Index of the special tokens and single-word synonym variants of the current tables."""
+    return vocabulary_index(current_tables().known_terms)
+
+
+def find_fuzzy_matches(
+    resume_keywords: Iterable[str], missing_keywords: Iterable[str]
+) -> list[tuple[str, str, int]]:
+    """
+    (missing target, resume term, distance) for targets that a resume term misspells.
+    The lookup index is the known vocabulary plus the missing targets' forms; a resume term
+    that is itself a known term is never treated as a typo. Nearest resume term wins.
+    """
+    budget = current_budget()
+    form_to_targets: dict[str, set[str]] = {}
+    for i, target in enumerate(missing_keywords):
+        if budget is not None and i % CHECK_EVERY == 0:
+            budget.check("fuzzy")
+        for f in all_canonical_forms(target):
+            form_to_targets.setdefault(f, set()).add(target)
+    if not form_to_targets:
+        return []
+    known = known_vocabulary_index()
+    index = DeletionIndex(parent=known)
+    for i, f in enumerate(form_to_targets):
+        if budget is not None and i % CHECK_EVERY == 0:
+            budget.check("fuzzy")
+        if " " not in f:
+            index.add(f)
+
+    best: dict[str, tuple[str, int]] = {}
+    for i, term in enumerate(resume_keywords):
+        if budget is not None and i % CHECK_EVERY == 0:
+            budget.check("fuzzy")
+        if allowed_distance(term) == 0 or term in known or term in form_to_targets:
+            continue
+        for candidate, distance in index.lookup(term):
+            if distance == 0:
+                continue
+            for f in all_canonical_forms(candidate):
+                for target in form_to_targets.get(f, ()):
+                    if target not in best or (distance, term) < (best[target][1], best[target][0]):
+                        best[target] = (term, distance)
+    return sorted((target, term, d) for target, (term, d) in best.items())
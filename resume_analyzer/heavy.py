@@ -0,0 +1,90 @@
+"""Bounded-memory heavy-hitter counts for ranking keywords of garbage or adversarial text.
+
+HeavyHitters is a Misra-Gries summary (the mergeable variant): the token stream is counted in
+chunks, each chunk is merged into at most `capacity` counters, and when more than `capacity`
+distinct terms are held, the (capacity + 1)-th largest count is subtracted from every counter
+and counters that reach zero are dropped. Memory never exceeds about 2 * capacity counters,
+however many distinct tokens the text contains.
+
+Error bounds (N = total tokens counted):
+- While no more than `capacity` distinct terms have been seen, nothing is subtracted and the
+  counts are exact (`exact` is True).
+- Otherwise `error` is the total subtracted so far, and error <= N / (capacity + 1). A held
+  term's true count is between its count and count + error. A term that is not held occurs
+  at most `error` times, so every term occurring more than N / (capacity + 1) times is held.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import islice
+
+DEFAULT_CAPACITY = 10_000
+
+
+class HeavyHitters(Mapping[str, int]):
+    """Misra-Gries summary of a term stream: term -> count (a lower bound once not exact)."""
+
+    __slots__ = ("capacity", "counts", "error", "total")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.error = 0
+        self.total = 0
+
+    def __getitem__(self, term: str) -> int:
+        return self.counts[term]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.counts)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def exact(self) -> bool:
+        """True while every count is exact (no more than capacity distinct terms seen)."""
+        return self.error == 0
+
+    def update(self, terms: Iterable[str]) -> HeavyHitters:
+        """Count a stream of terms, one chunk of at most capacity tokens at a time."""
+        it = iter(terms)
+        while chunk := Counter(islice(it, self.capacity)):
+            self.merge(chunk)
+        return self
+
+    def merge(self, counts: Mapping[str, int]) -> HeavyHitters:
+        """Add exact counts (or another summary's), then shrink back to capacity."""
+        held = self.counts
+        get = held.get
+        for term, c in counts.items():
+            held[term] = get(term, 0) + c
+        if isinstance(counts, HeavyHitters):
+            self.total += counts.total
+            self.error += counts.error
+        else:
+            self.total += sum(counts.values())
+        if len(held) > self.capacity:
+            self._shrink()
+        return self
+
+    def _shrink(self) -> None:
+        cut = heapq.nlargest(self.capacity + 1, self.counts.values())[-1]
+        self.counts = {t: c - cut for t, c in self.counts.items() if c > cut}
+        self.error += cut
+
+    def bounds(self, term: str) -> tuple[int, int]:
+        """Lower and upper bound of term's true count."""
+        c = self.counts.get(term, 0)
+        return c, c + self.error
+
+    def ranked(self, top_n: int) -> list[tuple[str, int]]:
+        """Top top_n (term, count) by count desc, then term asc (a bounded heap)."""
+        if top_n <= 0:
+            return []
+        return heapq.nsmallest(top_n, self.counts.items(), key=lambda x: (-x[1], x[0]))
@@ -2,33 +2,114 @@
 
 from __future__ import annotations
 
-from resume_analyzer.synonyms import all_canonical_forms, normalize_for_match
+from collections.abc import Iterable, Mapping
+
+from resume_analyzer.budget import CHECK_EVERY, current_budget
+from resume_analyzer.synonyms import (
+    all_canonical_forms,
+    canonical_form_set,
+    normalize_for_match,
+)
+from resume_analyzer.tables import current_tables
 
 
 def compute_matched_and_missing(
     resume_keywords: set[str],
     target_keywords: set[str],
+    resume_forms: set[str] | frozenset[str] | None = None,
 ) -> tuple[list[str], list[str]]:
     """
     Returns (matched_keywords, missing_keywords).
     Matched: target terms that have at least one synonym/variant in resume.
     Missing: target terms that have no match in resume.
+    resume_forms: precomputed canonical_form_set(resume_keywords), e.g. from the token cache.
     """
+    tables = current_tables()
+    if resume_forms is None:
+        resume_forms = canonical_form_set(resume_keywords, tables)
+    budget = current_budget()
     matched: list[str] = []
     missing: list[str] = []
-    for t in target_keywords:
-        forms = all_canonical_forms(t)
-        if any(f in resume_keywords or _resume_has_form(resume_keywords, forms) for f in forms):
-            matched.append(normalize_for_match(t))
+    for i, t in enumerate(target_keywords):
+        if budget is not None and i % CHECK_EVERY == 0:
+            budget.check("match")
+        # A resume term r matches t when forms(r) & forms(t); r is in forms(r), so checking
+        # against the union of all resume forms covers direct and synonym hits in one lookup.
+        if not all_canonical_forms(t, tables).isdisjoint(resume_forms):
+            matched.append(normalize_for_match(t, tables))
         else:
-            missing.append(normalize_for_match(t))
+            missing.append(normalize_for_match(t, tables))
     return (sorted(set(matched)), sorted(set(missing)))
 
 
-def _resume_has_form(resume_keywords: set[str], target_forms: set[str]) -> bool:
-    """True if any resume keyword is a synonym of any target form."""
-    for r in resume_keywords:
-        r_forms = all_canonical_forms(r)
-        if r_forms & target_forms:
-            return True
-    return False
+class CompiledTargets:
+    """
+    Target keywords compiled for streaming: every resume token that can satisfy a target maps
+    to the targets it satisfies, so matching a token is one dict lookup. Equivalent to
+    compute_matched_and_missing(): a token r satisfies t when forms(r) & forms(t).
+    Compiled against the current tables (see tables.py); tables_version records which.
+    surface_forms: stemmed targets' own words, for analyze_counts(target_surface=...).
+    """
+
+    __slots__ = (
+        "_display",
+        "_targets_by_token",
+        "surface_forms",
+        "tables_version",
+        "target_count",
+    )
+
+    def __init__(
+        self, target_keywords: Iterable[str], surface_forms: Mapping[str, str] | None = None
+    ) -> None:
+        tables = current_tables()
+        budget = current_budget()
+        self.tables_version = tables.version
+        self.surface_forms = surface_forms or {}
+        targets = set(target_keywords)
+        self.target_count = len(targets)
+        self._display = {t: normalize_for_match(t, tables) for t in targets}
+        by_form: dict[str, set[str]] = {}
+        for i, t in enumerate(targets):
+            if budget is not None and i % CHECK_EVERY == 0:
+                budget.check("compile")
+            for f in all_canonical_forms(t, tables):
+                by_form.setdefault(f, set()).add(t)
+        # A token outside the synonym table has forms {token}; variants expand to their group.
+        candidates = set(by_form)
+        for variants in tables.synonym_map.values():
+            candidates.update(variants)
+        by_token: dict[str, frozenset[str]] = {}
+        for i, r in enumerate(candidates):
+            if budget is not None and i % CHECK_EVERY == 0:
+                budget.check("compile")
+            hit: set[str] = set()
+            for f in all_canonical_forms(r, tables):
+                hit |= by_form.get(f, set())
+            if hit:
+                by_token[r] = frozenset(hit)
+        self._targets_by_token = by_token
+
+    def match_stream(
+        self, tokens: Iterable[str], collect: bool = False
+    ) -> tuple[set[str], list[str], set[str]]:
+        """
+        (matched display names, sorted missing display names, tokens seen) for a keyword stream.
+        Stops reading as soon as every target is matched. Seen tokens are only collected when
+        collect is true (e.g. for fuzzy matching, which only runs when something is missing).
+        """
+        remaining = set(self._display)
+        seen: set[str] = set()
+        by_token = self._targets_by_token
+        if remaining:
+            for token in tokens:
+                if collect:
+                    seen.add(token)
+                hit = by_token.get(token)
+                if hit is not None:
+                    remaining -= hit
+                    if not remaining:
+                        break
+        matched = {d for t, d in self._display.items() if t not in remaining}
+        missing = sorted({self._display[t] for t in remaining})
+        return matched, missing, seen
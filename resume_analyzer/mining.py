@@ -0,0 +1,369 @@
+"""Offline synonym mining: propose SYNONYM_MAP variants from a corpus of resumes and JDs.
+
+Two map-reduce passes over the corpus, each shard counted in a worker process:
+
+1. Term frequencies of keywords and adjacent keyword pairs ("machine learning"). Shard and
+   merged counters are pruned to max_terms entries, so memory stays bounded on any corpus.
+2. Context counts, within a +-window of keywords, for candidate terms only. The contexts are
+   the top-N keywords plus the candidates themselves. Memory is bounded by
+   candidates x contexts.
+
+Candidate pairs come from surface-form rules over terms seen at least min_count times:
+punctuation variants ("ci-cd"/"cicd", "e-commerce"/"ecommerce"), abbreviations of multiword
+terms ("continuous integration"/"ci") and numeronyms ("kubernetes"/"k8s"). Each pair is
+scored by the PMI of the two terms within the window and by the cosine similarity of their
+positive-PMI context vectors (synonyms appear in similar contexts even when they never
+co-occur). Pairs already in SYNONYM_MAP are skipped.
+
+The output is a JSON file for review. Set "accept": true on the good rows and point
+SYNONYMS_FILE at it to merge them into the synonym tables (see synonyms.load_synonym_file).
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import math
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from resume_analyzer.corpus import LENGTH_PREFIXED_EXTENSIONS, CorpusReader
+from resume_analyzer.documents import iter_file_fragments
+from resume_analyzer.extract import iter_keywords
+from resume_analyzer.synonyms import all_canonical_forms
+
+T = TypeVar("T")
+
+DEFAULT_MIN_COUNT = 5
+DEFAULT_MAX_TERMS = 200_000
+DEFAULT_CONTEXTS = 2_000
+DEFAULT_WINDOW = 5
+DEFAULT_MIN_SIMILARITY = 0.1
+DEFAULT_MIN_PMI = 1.0
+CORPUS_EXTENSIONS = (".jsonl", ".ndjson", *LENGTH_PREFIXED_EXTENSIONS)
+CORPUS_SHARD_BYTES = 16 * 1024 * 1024
+FILES_PER_SHARD = 200
+MIN_NUMERONYM_LEN = 6
+# A multiword term must be a collocation (PMI of its words) before its initials count as an
+# abbreviation; otherwise every frequent word pair would "expand" some two-letter token.
+MIN_COLLOCATION_PMI = 2.0
+
+_PUNCTUATION_RE = re.compile(r"[.\-/_ ]")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A unit of map work: a byte range of a corpus file, or a batch of document files."""
+
+    path: str = ""
+    fmt: str = "jsonl"
+    start: int = 0
+    end: int = 0
+    files: tuple[str, ...] = ()
+    text_field: str = "resume_text"
+
+
+def plan_shards(
+    inputs: Iterable[Path],
+    text_field: str = "resume_text",
+    shard_bytes: int = CORPUS_SHARD_BYTES,
+    files_per_shard: int = FILES_PER_SHARD,
+) -> list[Shard]:
+    """
+    Shards for corpus files (.jsonl, .lp/.lpj: byte ranges of about shard_bytes) and document
+    files (.txt, .docx, .html: one document each, in batches of files_per_shard).
+    """
+    shards: list[Shard] = []
+    files: list[str] = []
+    for path in inputs:
+        if path.suffix.lower() in CORPUS_EXTENSIONS:
+            with CorpusReader(path) as reader:
+                ranges = reader.byte_ranges(max(1, -(-reader.size // shard_bytes)))
+                fmt = reader.format
+            shards.extend(Shard(str(path), fmt, a, b, text_field=text_field) for a, b in ranges)
+        else:
+            files.append(str(path))
+    for i in range(0, len(files), files_per_shard):
+        shards.append(Shard(files=tuple(files[i : i + files_per_shard])))
+    return shards
+
+
+def iter_shard_keywords(
+    shard: Shard, prefilter: re.Pattern[str] | None = None
+) -> Iterator[list[str]]:
+    """
+    Keyword list of every document in a shard (records without text are skipped). With a
+    prefilter, documents whose lowercased text it does not match are skipped untokenized.
+    """
+    for name in shard.files:
+        text = "".join(iter_file_fragments(Path(name)))
+        if prefilter is None or prefilter.search(text.lower()):
+            yield list(iter_keywords(text))
+    if not shard.path:
+        return
+    with CorpusReader(shard.path, shard.fmt) as reader:
+        for i in reader.records_in(shard.start, shard.end):
+            try:
+                record = reader[i]
+            except ValueError:
+                continue
+            text = record.get(shard.text_field) if isinstance(record, dict) else record
+            if isinstance(text, str) and (prefilter is None or prefilter.search(text.lower())):
+                yield list(iter_keywords(text))
+
+
+def _prune(counts: Counter[str], max_terms: int) -> None:
+    """Keep the most frequent half of max_terms once counts grows past max_terms."""
+    if len(counts) > max_terms:
+        kept = counts.most_common(max_terms // 2)
+        counts.clear()
+        counts.update(dict(kept))
+
+
+def count_terms(shard: Shard, max_terms: int = DEFAULT_MAX_TERMS) -> tuple[int, int, Counter]:
+    """Map step of pass 1: (documents, keyword tokens, counts of keywords and keyword pairs)."""
+    docs = tokens = 0
+    counts: Counter[str] = Counter()
+    for words in iter_shard_keywords(shard):
+        docs += 1
+        tokens += len(words)
+        counts.update(words)
+        counts.update(f"{a} {b}" for a, b in itertools.pairwise(words))
+        _prune(counts, max_terms)
+    return docs, tokens, counts
+
+
+def _occurrences(words: list[str], terms: frozenset[str]) -> Iterator[tuple[str, int, int]]:
+    """(term, first position, last position) of every unigram or bigram in terms."""
+    for i, word in enumerate(words):
+        if word in terms:
+            yield word, i, i
+        if i + 1 < len(words):
+            pair = f"{word} {words[i + 1]}"
+            if pair in terms:
+                yield pair, i, i + 1
+
+
+def count_contexts(
+    shard: Shard, candidates: frozenset[str], contexts: frozenset[str], window: int
+) -> Counter[tuple[str, str]]:
+    """Map step of pass 2: (candidate, context) -> co-occurrences within +-window keywords."""
+    counts: Counter[tuple[str, str]] = Counter()
+    # Only documents mentioning a candidate matter; a substring test is far cheaper than
+    # tokenizing (a superset: "cicd" also matches inside "cicdx").
+    words_in_candidates = {w for term in candidates for w in term.split()}
+    prefilter = re.compile(
+        "|".join(re.escape(w) for w in sorted(words_in_candidates, key=len, reverse=True))
+    )
+    for words in iter_shard_keywords(shard, prefilter):
+        spans = list(_occurrences(words, candidates))
+        if not spans:
+            continue
+        # Contexts at each position: the keyword itself and candidate bigrams starting there.
+        at: dict[int, list[str]] = {}
+        for i, word in enumerate(words):
+            if word in contexts:
+                at.setdefault(i, []).append(word)
+        for term, first, last in spans:
+            if first != last:
+                at.setdefault(first, []).append(term)
+        for term, first, last in spans:
+            for k in range(max(0, first - window), min(len(words), last + window + 1)):
+                if first <= k <= last:
+                    continue
+                for context in at.get(k, ()):
+                    # A bigram context must not overlap the term's own span.
+                    if " " in context and first <= k + 1 <= last:
+                        continue
+                    if context != term:
+                        counts[term, context] += 1
+    return counts
+
+
+def _collocation_pmi(term: str, counts: Mapping[str, int], tokens: int) -> float:
+    """PMI of a two-word term's words (inf for other terms, which need no check)."""
+    words = term.split()
+    if len(words) != 2 or not all(counts.get(w) for w in words):
+        return math.inf
+    return math.log(counts[term] * tokens / (counts[words[0]] * counts[words[1]]))
+
+
+def propose_pairs(
+    counts: Mapping[str, int], min_count: int, tokens: int
+) -> dict[tuple[str, str], str]:
+    """
+    (canonical, variant) -> rule for surface-form variants among frequent terms; tokens is
+    the number of keyword tokens the counts come from.
+    """
+    vocab = {t for t, n in counts.items() if n >= min_count}
+    pairs: dict[tuple[str, str], str] = {}
+
+    def add(a: str, b: str, kind: str) -> None:
+        """Record a pair; the expansion of a short form is canonical, else the more frequent."""
+        if a == b or b in all_canonical_forms(a):
+            return
+        # "github ci-cd" / "github cicd" only restate the unigram pair.
+        if " " in a and " " in b and set(a.split()) & set(b.split()):
+            return
+        if kind == "punctuation" and (-counts[b], b) < (-counts[a], a):
+            a, b = b, a
+        pairs.setdefault((a, b), kind)
+
+    by_key: dict[str, list[str]] = {}
+    for term in vocab:
+        by_key.setdefault(_PUNCTUATION_RE.sub("", term), []).append(term)
+    for group in by_key.values():
+        group.sort(key=lambda t: (-counts[t], t))
+        for variant in group[1:]:
+            add(group[0], variant, "punctuation")
+    for term in vocab:
+        words = term.split()
+        if len(words) == 1 and "-" in term:
+            words = term.split("-")
+        if 2 <= len(words) <= 4 and all(words):
+            initials = "".join(w[0] for w in words)
+            if initials in vocab and _collocation_pmi(term, counts, tokens) >= MIN_COLLOCATION_PMI:
+                add(term, initials, "abbreviation")
+        if term.isalpha() and len(term) >= MIN_NUMERONYM_LEN:
+            numeronym = f"{term[0]}{len(term) - 2}{term[-1]}"
+            if numeronym in vocab:
+                add(term, numeronym, "numeronym")
+    return pairs
+
+
+def _row_totals(cooc: Mapping[tuple[str, str], int]) -> Counter[str]:
+    rows: Counter[str] = Counter()
+    for (term, _), n in cooc.items():
+        rows[term] += n
+    return rows
+
+
+def _ppmi_vectors(
+    cooc: Mapping[tuple[str, str], int],
+    rows: Mapping[str, int],
+    counts: Mapping[str, int],
+    total: int,
+) -> dict[str, dict[str, float]]:
+    """Positive PMI of each (candidate, context): log(P(context | candidate) / P(context))."""
+    vectors: dict[str, dict[str, float]] = {}
+    for (term, context), n in cooc.items():
+        pmi = math.log(n * total / (rows[term] * max(1, counts.get(context, 0))))
+        if pmi > 0:
+            vectors.setdefault(term, {})[context] = pmi
+    return vectors
+
+
+def _cosine(a: Mapping[str, float], b: Mapping[str, float], skip: set[str]) -> float:
+    dot = sum(v * b[k] for k, v in a.items() if k in b and k not in skip)
+    norm_a = math.sqrt(sum(v * v for k, v in a.items() if k not in skip))
+    norm_b = math.sqrt(sum(v * v for k, v in b.items() if k not in skip))
+    return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+
+
+def _map_reduce(fn: Callable[[Shard], T], shards: list[Shard], workers: int) -> Iterator[T]:
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            yield from pool.map(fn, shards)
+    else:
+        yield from map(fn, shards)
+
+
+def mine_synonyms(
+    inputs: Iterable[Path],
+    workers: int = 1,
+    text_field: str = "resume_text",
+    min_count: int = DEFAULT_MIN_COUNT,
+    max_terms: int = DEFAULT_MAX_TERMS,
+    contexts: int = DEFAULT_CONTEXTS,
+    window: int = DEFAULT_WINDOW,
+    min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    min_pmi: float = DEFAULT_MIN_PMI,
+    shard_bytes: int = CORPUS_SHARD_BYTES,
+) -> dict[str, Any]:
+    """
+    Run both passes and return the report written by write_candidates(): parameters, corpus
+    and timing stats, and candidates sorted by evidence (none accepted yet).
+    """
+    start = time.perf_counter()
+    shards = plan_shards(inputs, text_field, shard_bytes=shard_bytes)
+    docs = tokens = 0
+    counts: Counter[str] = Counter()
+    for shard_docs, shard_tokens, shard_counts in _map_reduce(
+        functools.partial(count_terms, max_terms=max_terms), shards, workers
+    ):
+        docs += shard_docs
+        tokens += shard_tokens
+        counts.update(shard_counts)
+        _prune(counts, max_terms)
+
+    pairs = propose_pairs(counts, min_count, max(1, tokens))
+    candidates = frozenset(t for pair in pairs for t in pair)
+    unigrams = (t for t, _ in counts.most_common() if " " not in t)
+    context_terms = frozenset(itertools.islice(unigrams, contexts)) | candidates
+    cooc: Counter[tuple[str, str]] = Counter()
+    if pairs:
+        count_shard = functools.partial(
+            count_contexts, candidates=candidates, contexts=context_terms, window=window
+        )
+        for shard_cooc in _map_reduce(count_shard, shards, workers):
+            cooc.update(shard_cooc)
+
+    rows = _row_totals(cooc)
+    vectors = _ppmi_vectors(cooc, rows, counts, max(1, tokens))
+    found: list[dict[str, Any]] = []
+    for (canonical, variant), kind in pairs.items():
+        together = cooc.get((canonical, variant), 0)
+        pmi = (
+            math.log(together * tokens / (rows[canonical] * counts[variant])) if together else None
+        )
+        similarity = _cosine(
+            vectors.get(canonical, {}), vectors.get(variant, {}), {canonical, variant}
+        )
+        if similarity < min_similarity and (pmi is None or pmi < min_pmi):
+            continue
+        found.append(
+            {
+                "canonical": canonical,
+                "variant": variant,
+                "kind": kind,
+                "similarity": round(similarity, 4),
+                "pmi": None if pmi is None else round(pmi, 4),
+                "co_occurrences": together,
+                "canonical_count": counts[canonical],
+                "variant_count": counts[variant],
+                "accept": False,
+            }
+        )
+    found.sort(key=lambda c: (-c["similarity"], -(c["pmi"] or 0), c["canonical"], c["variant"]))
+    seconds = time.perf_counter() - start
+    return {
+        "params": {
+            "min_count": min_count,
+            "max_terms": max_terms,
+            "contexts": contexts,
+            "window": window,
+            "min_similarity": min_similarity,
+            "min_pmi": min_pmi,
+        },
+        "stats": {
+            "documents": docs,
+            "tokens": tokens,
+            "shards": len(shards),
+            "workers": workers,
+            "seconds": round(seconds, 3),
+            "documents_per_second": round(docs / seconds, 1) if seconds else 0.0,
+        },
+        "candidates": found,
+    }
+
+
+def write_candidates(report: Mapping[str, Any], path: Path) -> None:
+    """Write a mining report as indented JSON for review."""
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
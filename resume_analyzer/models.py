@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
 
 
 class KeywordRank(BaseModel):
@@ -12,6 +15,14 @@ class KeywordRank(BaseModel):
     rank: int
 
 
+class FuzzyMatch(BaseModel):
+    """A target keyword matched only approximately (likely misspelled in the resume)."""
+
+    term: str
+    resume_term: str
+    distance: int
+
+
 class AnalyzeInput(BaseModel):
     """API/CLI input: resume + job description or role + keywords."""
 
@@ -27,6 +38,10 @@ class AnalysisResult(BaseModel):
     top_keywords: list[KeywordRank] = Field(..., description="Top extracted keywords from resume (ranked)")
     matched_keywords: list[str] = Field(..., description="Keywords in both resume and target")
     missing_keywords: list[str] = Field(..., description="Target keywords not found in resume")
+    fuzzy_matched_keywords: list[FuzzyMatch] | None = Field(
+        None,
+        description="Target keywords matched within a small edit distance (fuzzy matching only)",
+    )
     confidence_notes: list[str] = Field(..., description="Human-readable confidence/context notes")
     overall_score: float = Field(..., ge=0, le=100, description="Deterministic score 0–100")
     score_breakdown: dict[str, float | int | str] = Field(
@@ -34,8 +49,69 @@ class AnalysisResult(BaseModel):
         description="Explainable breakdown: matched_count, target_count, formula inputs",
     )
 
+    @model_serializer(mode="wrap")
+    def _omit_fuzzy_when_off(self, handler: SerializerFunctionWrapHandler) -> dict:
+        """Leave fuzzy_matched_keywords out unless fuzzy matching ran."""
+        data = handler(self)
+        if self.fuzzy_matched_keywords is None:
+            data.pop("fuzzy_matched_keywords", None)
+        return data
+
+
+class RankedTerm(NamedTuple):
+    """Lightweight KeywordRank."""
+
+    term: str
+    rank: int
+
+
+class FuzzyTerm(NamedTuple):
+    """Lightweight FuzzyMatch."""
+
+    term: str
+    resume_term: str
+    distance: int
+
+
+@dataclass(frozen=True, slots=True)
+class Analysis:
+    """
+    What the pipeline produces: the fields of AnalysisResult in tuples and a slotted dataclass,
+    without pydantic construction or validation. Batch runs keep and serialize these directly
+    (to_dict()); to_model() builds the pydantic AnalysisResult where callers need one.
+    """
+
+    top_keywords: tuple[RankedTerm, ...]
+    matched_keywords: tuple[str, ...]
+    missing_keywords: tuple[str, ...]
+    fuzzy_matched_keywords: tuple[FuzzyTerm, ...] | None  # None: fuzzy matching was off
+    confidence_notes: tuple[str, ...]
+    overall_score: float
+    score_breakdown: dict[str, float | int | str]
+
+    def to_dict(self) -> dict:
+        """Same as self.to_model().model_dump(), without building the model."""
+        data = {
+            "top_keywords": [{"term": t, "rank": r} for t, r in self.top_keywords],
+            "matched_keywords": list(self.matched_keywords),
+            "missing_keywords": list(self.missing_keywords),
+        }
+        if self.fuzzy_matched_keywords is not None:
+            data["fuzzy_matched_keywords"] = [
+                {"term": t, "resume_term": r, "distance": d}
+                for t, r, d in self.fuzzy_matched_keywords
+            ]
+        data["confidence_notes"] = list(self.confidence_notes)
+        data["overall_score"] = self.overall_score
+        data["score_breakdown"] = dict(self.score_breakdown)
+        return data
+
+    def to_model(self) -> AnalysisResult:
+        """The pydantic AnalysisResult (validating the dict is faster than model_construct)."""
+        return AnalysisResult.model_validate(self.to_dict())
+
 
-def format_readable_summary(result: AnalysisResult) -> str:
+def format_readable_summary(result: AnalysisResult | Analysis) -> str:
     """Produce a human-readable summary from the result."""
     lines = [
         "=== Resume Analysis Summary ===",
@@ -54,8 +130,12 @@ def format_readable_summary(result: AnalysisResult) -> str:
         "",
         f"Missing ({len(result.missing_keywords)}): " + (missing_preview or "(none)"),
         "",
-        "Confidence notes:",
     ])
+    if result.fuzzy_matched_keywords:
+        fuzzy = result.fuzzy_matched_keywords
+        fuzzy_preview = ", ".join(f"{m.term} (~{m.resume_term})" for m in fuzzy[:20])
+        lines.extend([f"Fuzzy matches ({len(fuzzy)}): " + fuzzy_preview, ""])
+    lines.append("Confidence notes:")
     for note in result.confidence_notes:
         lines.append(f"  • {note}")
     lines.append("")
@@ -1,6 +1,12 @@
 """Text normalization and tokenization with special handling for tech terms (C++, Node.js, .NET, etc.)."""
 
 import re
+from collections.abc import Iterable, Iterator
+
+from resume_analyzer.budget import CHECK_EVERY, Budget, current_budget
+from resume_analyzer.tables import Tables, current_tables
+
+# Built-in tables; replaceable at runtime (see tables.py), so read them via current_tables().
 # Tokens that must be preserved as single units (lowercase for matching).
 # Order matters: longer patterns first (e.g. "node.js" before "node").
 SPECIAL_TOKENS = (
@@ -39,17 +45,13 @@ SPECIAL_TOKENS = (
     "machinelearning",
 )
 
-# Regex to find special tokens in text (case-insensitive).
-# Escape dots and plus for regex.
-def _special_pattern() -> re.Pattern[str]:
-    parts = []
-    for t in SPECIAL_TOKENS:
-        escaped = re.escape(t).replace(r"\.", r"\.").replace(r"\+", r"\+")
-        parts.append(escaped)
-    return re.compile("|".join(f"({p})" for p in parts), re.IGNORECASE)
-
+# Compiled patterns are immutable and safe to share across threads.
+_WORD_RE = re.compile(r"[a-z0-9.+#\-]+")
+_SPACE_RE = re.compile(r"\s")
 
-_SPECIAL_RE = _special_pattern()
+# iter_tokens() scans text in windows of about this many characters, cut at whitespace, and
+# checks the request's CPU time budget (see budget.py) per window and every CHECK_EVERY tokens.
+TOKENIZE_WINDOW = 64 * 1024
 
 # Minimum token length (after normalization) to keep. Single chars are usually noise.
 MIN_TOKEN_LEN = 2
@@ -74,55 +76,124 @@ def normalize_text(text: str) -> str:
     return " ".join(text.lower().strip().split())
 
 
+def _iter_words(text: str, start: int, end: int, stopwords: frozenset[str]) -> Iterator[str]:
+    """Plain (non-special) words in text[start:end], without slicing or splitting into a list."""
+    for m in _WORD_RE.finditer(text, start, end):
+        w = m.group().strip(".-")
+        if w and len(w) >= MIN_TOKEN_LEN and w not in stopwords:
+            yield w
+
+
+def iter_tokens(text: str) -> Iterator[str]:
+    """Generator form of tokenize(): yields tokens without building a list."""
+    if not text or not isinstance(text, str):
+        return
+    # Whitespace only separates words (neither pattern matches it), so lowercasing is all the
+    # normalization needed; skipping normalize_text() avoids a list of every word on large inputs.
+    normalized = text.lower()
+    budget = current_budget()
+    tokens = _scan(normalized, current_tables(), budget)
+    if budget is None:
+        yield from tokens
+        return
+    # A window without whitespace can be the whole text; also check as its tokens come out.
+    for i, token in enumerate(tokens, 1):
+        if i % CHECK_EVERY == 0:
+            budget.check("tokenize")
+        yield token
+
+
+def _scan(normalized: str, tables: Tables, budget: Budget | None) -> Iterator[str]:
+    stopwords = tables.stopwords
+    for start, end in whitespace_spans(normalized, TOKENIZE_WINDOW):
+        if budget is not None:
+            budget.check("tokenize")
+        last_end = start
+        for m in tables.special_re.finditer(normalized, start, end):
+            if m.start() > last_end:
+                yield from _iter_words(normalized, last_end, m.start(), stopwords)
+            special = m.group(0).lower().strip()
+            if special == "nodejs":
+                special = "node.js"
+            elif special == "python3":
+                special = "python"
+            yield special
+            last_end = m.end()
+
+        if last_end < end:
+            yield from _iter_words(normalized, last_end, end, stopwords)
+
+
+def whitespace_spans(text: str, min_chars: int) -> Iterator[tuple[int, int]]:
+    """
+    (start, end) spans covering text, each at least min_chars long except the last. Each cut
+    is at a whitespace character, which starts the next span. No token contains whitespace, so
+    the spans tokenize exactly like the whole text.
+    """
+    if min_chars < 1:
+        raise ValueError("min_chars must be >= 1")
+    start = 0
+    while len(text) - start > min_chars:
+        m = _SPACE_RE.search(text, start + min_chars)
+        if m is None:
+            break
+        yield start, m.start()
+        start = m.start()
+    yield start, len(text)
+
+
 def tokenize(text: str) -> list[str]:
     """
     Tokenize text, preserving special tech tokens (C++, Node.js, .NET, SQL, NoSQL, etc.).
     Returns lowercase tokens; filters by MIN_TOKEN_LEN and stopwords in a separate step.
     """
-    if not text:
-        return []
-    normalized = normalize_text(text)
-    if not normalized:
-        return []
-
-    tokens: list[str] = []
-    last_end = 0
-    found_any = False
-
-    for m in _SPECIAL_RE.finditer(normalized):
-        found_any = True
-        if m.start() > last_end:
-            chunk = normalized[last_end : m.start()]
-            for word in re.split(r"[^a-z0-9.+#\-]+", chunk):
-                w = word.strip(".-")
-                if w and len(w) >= MIN_TOKEN_LEN and w not in STOPWORDS:
-                    tokens.append(w)
-        special = m.group(0).lower().strip()
-        if special == "nodejs":
-            special = "node.js"
-        elif special == "python3":
-            special = "python"
-        tokens.append(special)
-        last_end = m.end()
-
-    if found_any and last_end < len(normalized):
-        chunk = normalized[last_end:]
-        for word in re.split(r"[^a-z0-9.+#\-]+", chunk):
-            w = word.strip(".-")
-            if w and len(w) >= MIN_TOKEN_LEN and w not in STOPWORDS:
-                tokens.append(w)
-
-    if not found_any:
-        # No special tokens: tokenize whole string.
-        for word in re.split(r"[^a-z0-9.+#\-]+", normalized):
-            w = word.strip(".-")
-            if w and len(w) >= MIN_TOKEN_LEN and w not in STOPWORDS:
-                tokens.append(w)
-
-    return tokens
+    return list(iter_tokens(text))
 
 
 def tokenize_without_stopwords(text: str) -> list[str]:
     """Tokenize and drop stopwords. Does not drop short tokens here (extract does filtering)."""
     raw = tokenize(text)
-    return [t for t in raw if t not in STOPWORDS]
+    stopwords = current_tables().stopwords
+    return [t for t in raw if t not in stopwords]
+
+
+# Last whitespace character of a fragment and the text after it.
+_LAST_SPACE_RE = re.compile(r"\s\S*\Z")
+
+# Longest run without whitespace held back while waiting for the end of a word. A longer run
+# is tokenized on its own, which may split the word at the cut (real documents never do this).
+MAX_PENDING_CHARS = 64 * 1024
+
+
+def iter_tokens_from_fragments(fragments: Iterable[str]) -> Iterator[str]:
+    """
+    Tokenize a stream of text fragments (e.g. from a document parser) without joining them.
+    Fragments may split words; text after the last whitespace is held back until the next
+    whitespace arrives. Each fragment is searched once and held text is joined once, so the
+    cost is linear in the input. No special token contains whitespace, so output equals
+    tokenize("".join(fragments)) unless a run exceeds MAX_PENDING_CHARS.
+    """
+    pending: list[str] = []
+    pending_len = 0
+    budget = current_budget()
+    for i, fragment in enumerate(fragments, 1):
+        if budget is not None and i % CHECK_EVERY == 0:
+            budget.check("tokenize")
+        if not fragment:
+            continue
+        m = _LAST_SPACE_RE.search(fragment)
+        if m is None:
+            pending.append(fragment)
+            pending_len += len(fragment)
+            if pending_len > MAX_PENDING_CHARS:
+                yield from iter_tokens("".join(pending))
+                pending.clear()
+                pending_len = 0
+            continue
+        pending.append(fragment[: m.start()])
+        yield from iter_tokens("".join(pending))
+        tail = fragment[m.start() + 1 :]
+        pending = [tail]
+        pending_len = len(tail)
+    if pending:
+        yield from iter_tokens("".join(pending))
@@ -0,0 +1,101 @@
+"""Parallel tokenization of one very large document (offline use: portfolios, JD dumps).
+
+The text is cut into segments at whitespace and each segment is tokenized in a worker
+process. No special token ("node.js", "c++") or plain word contains whitespace, and lowercasing
+is per character, so each token comes from exactly one segment and every segment tokenizes
+as it would in place. Per-segment results are merged in segment order: token lists are
+concatenated, and Counters are added in an order that keeps first-occurrence order. The
+output is identical to tokenize() / count_keywords() on the whole text.
+
+Sending segments to worker processes costs a copy of the text, so small inputs and
+workers=1 run serially.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TypeVar
+
+from resume_analyzer.extract import count_keywords
+from resume_analyzer.normalize import tokenize, whitespace_spans
+
+T = TypeVar("T")
+
+# Segments per worker, so one slow segment does not hold up the merge.
+SEGMENTS_PER_WORKER = 4
+# Smaller segments cost more in pickling and scheduling than they save.
+MIN_SEGMENT_CHARS = 256 * 1024
+
+
+def split_at_whitespace(text: str, segment_chars: int) -> list[str]:
+    """
+    Split text into segments of at least segment_chars characters. Each cut is at a whitespace
+    character, which starts the next segment. "".join(segments) == text.
+    """
+    if segment_chars < 1:
+        raise ValueError("segment_chars must be >= 1")
+    return [text[start:end] for start, end in whitespace_spans(text, segment_chars)]
+
+
+def _segment_chars(length: int, workers: int) -> int:
+    return max(MIN_SEGMENT_CHARS, -(-length // (workers * SEGMENTS_PER_WORKER)))
+
+
+def _map_segments(
+    fn: Callable[[str], T],
+    text: str,
+    workers: int | None,
+    segment_chars: int | None,
+    executor: Executor | None,
+) -> Iterator[T]:
+    """fn over the segments of text, in order; serial when there is only one segment."""
+    workers = workers or os.cpu_count() or 1
+    size = segment_chars or _segment_chars(len(text), workers)
+    segments = split_at_whitespace(text, size) if workers > 1 or executor else [text]
+    if len(segments) == 1:
+        yield fn(segments[0])
+    elif executor is not None:
+        yield from executor.map(fn, segments)
+    else:
+        with ProcessPoolExecutor(min(workers, len(segments))) as pool:
+            yield from pool.map(fn, segments)
+
+
+def tokenize_parallel(
+    text: str,
+    workers: int | None = None,
+    segment_chars: int | None = None,
+    executor: Executor | None = None,
+) -> list[str]:
+    """
+    tokenize(text), computed in a process pool. workers defaults to the CPU count.
+    segment_chars defaults to a few segments per worker (at least MIN_SEGMENT_CHARS).
+    executor: reuse an existing pool instead of starting one per call.
+    """
+    if not text or not isinstance(text, str):
+        return []
+    tokens: list[str] = []
+    for part in _map_segments(tokenize, text, workers, segment_chars, executor):
+        tokens.extend(part)
+    return tokens
+
+
+def count_keywords_parallel(
+    text: str,
+    workers: int | None = None,
+    stem: bool = False,
+    segment_chars: int | None = None,
+    executor: Executor | None = None,
+) -> Counter[str]:
+    """count_keywords(text, stem), computed in a process pool (see tokenize_parallel())."""
+    if not text:
+        return Counter()
+    counts: Counter[str] = Counter()
+    count = functools.partial(count_keywords, stem=stem)
+    for part in _map_segments(count, text, workers, segment_chars, executor):
+        counts.update(part)
+    return counts
@@ -0,0 +1,161 @@
+"""Morphological normalization: reduce tokens to a base form so inflections count as one term.
+
+A small rule-based suffix stripper in the spirit of Porter's algorithm ("developers",
+"developed", "developing" -> "develop"; "microservices" -> "microservic"), plus an exception
+table for irregular forms. Like Porter's steps, each step strips at most one suffix, so
+"engineering" -> "engineer" stays apart from "engine". Stems are match keys, not dictionary
+words; fold_stems() keeps the most frequent surface form of each stem for display. Tech terms
+(special tokens, synonym variants, anything with digits or punctuation) are never stemmed, so
+synonym matching is unaffected. Which terms are protected follows the current tables
+(tables.py).
+
+Resume vocabularies are highly repetitive, so stems are memoized in a bounded per-process LRU;
+a warm lookup costs about as much as a dict hit. The memo is keyed by (token, the tables'
+known terms), so a request pinned to older tables never sees stems computed for newer ones
+(or the reverse); entries for replaced tables simply age out. stem_cache_info() reports the
+hit rate.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import repeat
+
+from resume_analyzer.tables import current_tables
+
+# Bump when the rules or exception table change (part of the token cache fingerprint).
+STEMMER_VERSION = 2
+STEM_CACHE_SIZE = 65_536
+# Shortest token the rules touch; shorter words are left as-is.
+MIN_STEM_INPUT_LEN = 4
+# Stems shorter than this, or without a vowel, are rejected ("spring" is not "spr" + "ing").
+MIN_STEM_LEN = 3
+
+# Irregular forms and words the rules would mangle. Values are final (not stemmed again).
+_EXCEPTIONS: dict[str, str] = {
+    "built": "build",
+    "led": "lead",
+    "ran": "run",
+    "wrote": "write",
+    "written": "write",
+    "taught": "teach",
+    "bought": "buy",
+    "spoke": "speak",
+    "spoken": "speak",
+    "analyses": "analysis",
+    "data": "data",
+    "series": "series",
+    "species": "species",
+    "news": "news",
+}
+
+# Endings that look plural but are not ("status", "analysis", "access").
+_NON_PLURAL_ENDINGS = ("ss", "us", "is")
+# Inflectional/derivational suffixes, longest first; at most one is stripped per word.
+_SUFFIXES = ("ment", "ing", "ed", "er")
+# Endings that contain a suffix but belong to the word ("need", "engineer", "career").
+_KEEP_ENDINGS = ("eed", "eer")
+_VOWEL_RE = re.compile(r"[aeiouy]")
+_DOUBLE_CONSONANT_KEEP = frozenset("lsz")
+
+
+def _valid_stem(stem: str) -> bool:
+    return len(stem) >= MIN_STEM_LEN and _VOWEL_RE.search(stem) is not None
+
+
+def _strip_plural(word: str) -> str:
+    if word.endswith("sses"):
+        return word[:-2]
+    if word.endswith("ies") and len(word) > MIN_STEM_INPUT_LEN:
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith(_NON_PLURAL_ENDINGS) and _valid_stem(word[:-1]):
+        return word[:-1]
+    return word
+
+
+def _undoubles(stem: str) -> bool:
+    """Whether a stem ends in a doubled consonant to drop ("mapp" -> "map", not "install")."""
+    return (
+        len(stem) > 2
+        and stem[-1] == stem[-2]
+        and stem[-1] not in _DOUBLE_CONSONANT_KEEP
+        and _valid_stem(stem[:-1])
+    )
+
+
+def _strip_suffix(word: str) -> str:
+    if word.endswith(_KEEP_ENDINGS):
+        return word
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix):
+            stem = word[: -len(suffix)]
+            if suffix == "ed" and stem.endswith("i"):
+                stem = stem[:-1] + "y"  # "applied" -> "apply"
+            if _valid_stem(stem):
+                if suffix != "ment" and _undoubles(stem):
+                    stem = stem[:-1]  # "mapped" -> "map"
+                return stem
+    return word
+
+
+@functools.lru_cache(maxsize=STEM_CACHE_SIZE)
+def _stem(token: str, known_terms: frozenset[str]) -> str:
+    exception = _EXCEPTIONS.get(token)
+    if exception is not None:
+        return exception
+    if len(token) < MIN_STEM_INPUT_LEN or not token.isalpha() or token in known_terms:
+        return token
+    word = _strip_suffix(_strip_plural(token))
+    # Drop a final "e" so "manage", "managed" and "managing" agree on "manag".
+    if word.endswith("e") and _valid_stem(word[:-1]):
+        word = word[:-1]
+    return word
+
+
+def stem(token: str) -> str:
+    """Base form of a lowercase token; tech terms, short and non-alphabetic tokens pass through."""
+    return _stem(token, current_tables().known_terms)
+
+
+def stem_tokens(tokens: Iterable[str]) -> Iterator[str]:
+    """stem() applied to a token stream (against the tables current when called)."""
+    return map(_stem, tokens, repeat(current_tables().known_terms))
+
+
+def fold_stems(counts: Mapping[str, int]) -> tuple[Counter[str], dict[str, str]]:
+    """
+    Counts keyed by surface form -> (the same counts keyed by stem, stem -> its most frequent
+    surface form, the earliest on ties). Each distinct form is stemmed once.
+    """
+    stemmed: Counter[str] = Counter()
+    surface: dict[str, str] = {}
+    best: dict[str, int] = {}
+    known = current_tables().known_terms
+    for form, count in counts.items():
+        key = _stem(form, known)
+        stemmed[key] += count
+        if count > best.get(key, 0):
+            best[key] = count
+            surface[key] = form
+    return stemmed, surface
+
+
+def clear_stem_cache() -> None:
+    """Empty the memo (for cold-start benchmarks and tests)."""
+    _stem.cache_clear()
+
+
+def stem_cache_info() -> dict[str, float | int]:
+    """Memo statistics for this process: hits, misses, current size, capacity and hit rate."""
+    info = _stem.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize or 0,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
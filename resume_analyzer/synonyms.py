@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+from resume_analyzer.tables import Tables, current_tables, term_index
+
 # Canonical term -> set of variants (including canonical). Order matters for normalize_for_match (first wins).
-SYNONYM_MAP: dict[str, set[str]] = {
+# Tables are read-only (mapping proxies of frozensets), so concurrent analyze() calls can
+# share them safely. These are the built-in tables; the functions below read the current
+# snapshot (see tables.py), which can be replaced at runtime.
+_SYNONYMS: dict[str, set[str]] = {
     "python": {"python", "python3", "python 3"},
     "node.js": {"node.js", "nodejs", "javascript", "js"},
     "javascript": {"javascript", "js", "node.js", "nodejs"},
@@ -21,18 +32,47 @@ SYNONYM_MAP: dict[str, set[str]] = {
     "gcp": {"gcp", "google cloud", "google cloud platform"},
 }
 
+# A mined synonym file (resume_analyzer/mining.py) whose accepted rows extend the table.
+SYNONYMS_FILE_ENV = "SYNONYMS_FILE"
 
-def _build_term_to_canonical() -> dict[str, str]:
-    """Map every variant to a canonical term (first in SYNONYM_MAP)."""
-    out: dict[str, str] = {}
-    for canonical, variants in SYNONYM_MAP.items():
-        for v in variants:
-            if v not in out:
-                out[v] = canonical
-    return out
 
+def load_synonym_file(path: str | os.PathLike[str]) -> dict[str, set[str]]:
+    """Accepted rows ("accept": true) of a mined synonym file, as canonical -> variants."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    groups: dict[str, set[str]] = {}
+    for row in data.get("candidates", []):
+        if row.get("accept") is True:
+            canonical = row["canonical"].lower().strip()
+            groups.setdefault(canonical, {canonical}).add(row["variant"].lower().strip())
+    return groups
+
+
+def merge_synonyms(
+    base: Mapping[str, Iterable[str]], extra: Mapping[str, Iterable[str]]
+) -> dict[str, set[str]]:
+    """base plus extra; a new group joins the first existing group it shares a term with."""
+    merged = {canonical: set(variants) for canonical, variants in base.items()}
+    for canonical, variants in extra.items():
+        group = {canonical, *variants}
+        key = next((k for k, v in merged.items() if v & group), canonical)
+        merged.setdefault(key, {key}).update(group)
+    return merged
+
+
+if os.environ.get(SYNONYMS_FILE_ENV):
+    _SYNONYMS = merge_synonyms(_SYNONYMS, load_synonym_file(os.environ[SYNONYMS_FILE_ENV]))
+
+SYNONYM_MAP: Mapping[str, frozenset[str]] = MappingProxyType(
+    {canonical: frozenset(variants) for canonical, variants in _SYNONYMS.items()}
+)
 
-_TERM_TO_CANONICAL = _build_term_to_canonical()
+
+_TERM_TO_CANONICAL = term_index(SYNONYM_MAP)
+
+
+def _forms(tables: Tables, term_lower: str) -> set[str]:
+    canonical = tables.term_to_canonical.get(term_lower, term_lower)
+    return {term_lower, *tables.synonym_map.get(canonical, (canonical,))}
 
 
 def expand_to_canonical(term: str) -> set[str]:
@@ -41,31 +81,39 @@ def expand_to_canonical(term: str) -> set[str]:
     If term is a known variant, returns {canonical}. Otherwise returns {term}.
     """
     term_lower = term.lower().strip()
-    canonical = _TERM_TO_CANONICAL.get(term_lower)
-    if canonical is not None:
-        return SYNONYM_MAP.get(canonical, {canonical}) | {term_lower}
+    tables = current_tables()
+    if term_lower in tables.term_to_canonical:
+        return _forms(tables, term_lower)
     return {term_lower}
 
 
-def all_canonical_forms(term: str) -> set[str]:
+def all_canonical_forms(term: str, tables: Tables | None = None) -> set[str]:
     """All forms that should count as a match for this term (term + synonyms)."""
-    term_lower = term.lower().strip()
-    canonical = _TERM_TO_CANONICAL.get(term_lower, term_lower)
-    return SYNONYM_MAP.get(canonical, {canonical}) | {term_lower}
+    return _forms(tables or current_tables(), term.lower().strip())
+
+
+def canonical_form_set(terms: set[str], tables: Tables | None = None) -> set[str]:
+    """Union of all_canonical_forms over terms; a target matches if its forms intersect this set."""
+    tables = tables or current_tables()
+    out: set[str] = set()
+    for t in terms:
+        out |= _forms(tables, t.lower().strip())
+    return out
 
 
 def sets_overlap(a: set[str], b: set[str]) -> bool:
     """True if any form of a matches any form of b (synonym-aware)."""
+    tables = current_tables()
     for t in a:
-        forms_a = all_canonical_forms(t)
+        forms_a = _forms(tables, t.lower().strip())
         for s in b:
-            forms_b = all_canonical_forms(s)
+            forms_b = _forms(tables, s.lower().strip())
             if forms_a & forms_b:
                 return True
     return False
 
 
-def normalize_for_match(term: str) -> str:
+def normalize_for_match(term: str, tables: Tables | None = None) -> str:
     """Canonical form for display (e.g. 'nodejs' -> 'node.js')."""
     term_lower = term.lower().strip()
-    return _TERM_TO_CANONICAL.get(term_lower, term_lower)
+    return (tables or current_tables()).term_to_canonical.get(term_lower, term_lower)
@@ -0,0 +1,325 @@
+"""Versioned tokenizer and synonym tables, replaced at runtime without restarts.
+
+Tokenization and matching read one immutable snapshot (Tables): the special tokens and their
+compiled regex, stopwords, the synonym map and its variant -> canonical index. The built-in
+tables (normalize.SPECIAL_TOKENS, normalize.STOPWORDS, synonyms.SYNONYM_MAP) are version 1.
+Replacement tables come from a JSON file (TablesWatcher polls TABLES_FILE; the API's admin
+endpoint writes it with write_tables_file(), so every worker process picks them up), or are
+installed directly in one process. They are compiled by the caller, off the request path,
+and installed by swap_tables(), which is one reference assignment. Readers fetch the snapshot
+once per call with current_tables(). pin_tables() fixes it for a whole request, so in-flight
+work finishes on the tables it started with.
+
+Caches derived from the tables follow the version:
+- fuzzy.known_vocabulary_index() is memoized per snapshot and built before the swap.
+- The stem memo is keyed by the snapshot's known terms.
+- The token cache fingerprint is computed from the current tables.
+- The job store keys compiled targets by tables version.
+
+Tables file format (every key optional; a missing key keeps the built-in table):
+
+    {"special_tokens": ["c++", "node.js", ...], "stopwords": ["the", ...],
+     "synonyms": {"kubernetes": ["k8s"], ...}}
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+TABLES_FILE_ENV = "TABLES_FILE"
+TABLES_POLL_SECONDS_ENV = "TABLES_POLL_SECONDS"
+DEFAULT_POLL_SECONDS = 2.0
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Tables:
+    """One immutable version of every table the tokenizer and matcher read."""
+
+    version: int
+    special_tokens: tuple[str, ...]
+    stopwords: frozenset[str]
+    synonym_map: Mapping[str, frozenset[str]]
+    term_to_canonical: Mapping[str, str]
+    special_re: re.Pattern[str]
+    # Special tokens and single-word synonym variants: the fuzzy vocabulary, never stemmed.
+    known_terms: frozenset[str]
+    # Hash of the table contents (not the version), stable across processes.
+    digest: str
+    source: str
+
+
+def special_pattern(special_tokens: Iterable[str]) -> re.Pattern[str]:
+    """Regex finding special tokens in text (case-insensitive); earlier tokens win ties."""
+    return re.compile("|".join(f"({re.escape(t)})" for t in special_tokens), re.IGNORECASE)
+
+
+def term_index(synonym_map: Mapping[str, Iterable[str]]) -> Mapping[str, str]:
+    """Map every variant to a canonical term (first in synonym_map)."""
+    out: dict[str, str] = {}
+    for canonical, variants in synonym_map.items():
+        for v in variants:
+            if v not in out:
+                out[v] = canonical
+    return MappingProxyType(out)
+
+
+def _table_data(
+    special_tokens: Iterable[str],
+    stopwords: Iterable[str],
+    synonym_map: Mapping[str, Iterable[str]],
+) -> dict[str, object]:
+    return {
+        "special_tokens": list(special_tokens),
+        "stopwords": sorted(stopwords),
+        "synonyms": {k: sorted(v) for k, v in sorted(synonym_map.items())},
+    }
+
+
+def _strings(name: str, values: object) -> list[str]:
+    if isinstance(values, str) or not isinstance(values, Iterable):
+        raise ValueError(f"{name} must be a list of strings")
+    out = []
+    for v in values:
+        if not isinstance(v, str) or not v.strip():
+            raise ValueError(f"{name} must be a list of non-empty strings")
+        out.append(v.lower().strip())
+    return out
+
+
+def compile_tables(
+    special_tokens: Iterable[str],
+    stopwords: Iterable[str],
+    synonyms: Mapping[str, Iterable[str]],
+    version: int = 0,
+    source: str = "built-in",
+) -> Tables:
+    """
+    Validate and compile tables. Raises ValueError on malformed input. Special tokens must not
+    contain whitespace: tokenizing fragments and parallel segments relies on it.
+    """
+    tokens = tuple(dict.fromkeys(_strings("special_tokens", special_tokens)))
+    if any(any(c.isspace() for c in t) for t in tokens):
+        raise ValueError("special_tokens must not contain whitespace")
+    if not tokens:
+        raise ValueError("special_tokens must not be empty")
+    if not isinstance(synonyms, Mapping):
+        raise ValueError("synonyms must map terms to lists of variants")
+    synonym_map: dict[str, frozenset[str]] = {}
+    for canonical, variants in synonyms.items():
+        (key,) = _strings("synonyms", [canonical])
+        synonym_map[key] = frozenset({key, *_strings(f"synonyms[{canonical!r}]", variants)})
+    stop = frozenset(_strings("stopwords", stopwords))
+    known = set(tokens)
+    for variants in synonym_map.values():
+        known.update(v for v in variants if " " not in v)
+    payload = json.dumps(_table_data(tokens, stop, synonym_map), sort_keys=True)
+    return Tables(
+        version=version,
+        special_tokens=tokens,
+        stopwords=stop,
+        synonym_map=MappingProxyType(synonym_map),
+        term_to_canonical=term_index(synonym_map),
+        special_re=special_pattern(tokens),
+        known_terms=frozenset(known),
+        digest=hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        source=source,
+    )
+
+
+@functools.cache
+def default_tables() -> Tables:
+    """The built-in tables (version 1)."""
+    # Imported here: normalize and synonyms import this module.
+    from resume_analyzer.normalize import SPECIAL_TOKENS, STOPWORDS
+    from resume_analyzer.synonyms import SYNONYM_MAP
+
+    return compile_tables(SPECIAL_TOKENS, STOPWORDS, SYNONYM_MAP, version=1)
+
+
+def tables_from_data(data: object, source: str) -> Tables:
+    """Compile tables from a decoded tables file; missing keys keep the built-in tables."""
+    if not isinstance(data, dict):
+        raise ValueError("tables must be a JSON object")
+    unknown = set(data) - {"special_tokens", "stopwords", "synonyms"}
+    if unknown:
+        raise ValueError(f"unknown table(s): {', '.join(sorted(unknown))}")
+    base = default_tables()
+    return compile_tables(
+        data.get("special_tokens", base.special_tokens),
+        data.get("stopwords", base.stopwords),
+        data.get("synonyms", base.synonym_map),
+        source=source,
+    )
+
+
+def load_tables_file(path: str | os.PathLike[str]) -> Tables:
+    """Compile a tables file. Raises OSError or ValueError."""
+    return tables_from_data(json.loads(Path(path).read_text(encoding="utf-8")), str(path))
+
+
+def tables_data(tables: Tables) -> dict[str, object]:
+    """The tables in tables file format (loading it gives tables with the same digest)."""
+    return _table_data(tables.special_tokens, tables.stopwords, tables.synonym_map)
+
+
+def write_tables_file(path: str | os.PathLike[str], tables: Tables) -> None:
+    """
+    Write tables to a tables file atomically (temporary file, then rename), so a watcher never
+    reads a partial file.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(tables_data(tables), indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def tables_summary(tables: Tables) -> dict[str, int | str]:
+    """Version, digest, source and table sizes (for the admin endpoint)."""
+    return {
+        "version": tables.version,
+        "digest": tables.digest,
+        "source": tables.source,
+        "special_tokens": len(tables.special_tokens),
+        "stopwords": len(tables.stopwords),
+        "synonyms": len(tables.synonym_map),
+    }
+
+
+_current: Tables | None = None
+_swap_lock = threading.Lock()
+_pinned: ContextVar[Tables | None] = ContextVar("resume_analyzer_tables", default=None)
+
+
+def current_tables() -> Tables:
+    """The snapshot pinned for this context, else the installed one."""
+    pinned = _pinned.get()
+    if pinned is not None:
+        return pinned
+    tables = _current
+    return tables if tables is not None else _install_defaults()
+
+
+def _install_defaults() -> Tables:
+    global _current
+    with _swap_lock:
+        if _current is None:
+            _current = default_tables()
+        return _current
+
+
+@contextmanager
+def pin_tables(tables: Tables | None = None) -> Iterator[Tables]:
+    """Use one snapshot (default: the current one) for everything run inside the block."""
+    token = _pinned.set(tables or current_tables())
+    try:
+        yield _pinned.get()
+    finally:
+        _pinned.reset(token)
+
+
+def _prepare(tables: Tables) -> None:
+    """Build the caches derived from tables before they are installed."""
+    from resume_analyzer.fuzzy import vocabulary_index
+
+    vocabulary_index(tables.known_terms)
+
+
+def swap_tables(tables: Tables) -> Tables:
+    """
+    Install compiled tables as the next version and return them. Tables with the same contents
+    as the installed ones are not reinstalled (the installed tables are returned).
+    """
+    global _current
+    _prepare(tables)
+    with _swap_lock:
+        previous = _current or default_tables()
+        if tables.digest == previous.digest:
+            return previous
+        _current = dataclasses.replace(tables, version=previous.version + 1)
+        return _current
+
+
+def reset_tables() -> Tables:
+    """Reinstall the built-in tables (as a new version)."""
+    return swap_tables(default_tables())
+
+
+class TablesWatcher:
+    """
+    Polls a tables file and swaps in its tables when it changes (mtime or size), from a
+    daemon thread. A file that fails to load leaves the installed tables in place; the error
+    is kept in last_error until a later load succeeds.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], interval: float = DEFAULT_POLL_SECONDS
+    ) -> None:
+        self.path = Path(path)
+        self.interval = interval
+        self.last_error: str | None = None
+        self._stamp: tuple[int, int] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> Tables | None:
+        """Load the file if it changed since the last check; the installed tables, or None."""
+        try:
+            st = self.path.stat()
+        except OSError as e:
+            self.last_error = f"{self.path}: {e}"
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return None
+        self._stamp = stamp
+        try:
+            tables = load_tables_file(self.path)
+        except (OSError, ValueError) as e:
+            self.last_error = f"{self.path}: {e}"
+            return None
+        self.last_error = None
+        return swap_tables(tables)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="tables-watcher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def watch_tables_file() -> TablesWatcher | None:
+    """
+    Load TABLES_FILE now and watch it (every TABLES_POLL_SECONDS), or None when unset.
+    Raises OSError or ValueError if the file cannot be loaded at startup.
+    """
+    path = os.environ.get(TABLES_FILE_ENV)
+    if not path:
+        return None
+    swap_tables(load_tables_file(path))
+    interval = float(os.environ.get(TABLES_POLL_SECONDS_ENV, DEFAULT_POLL_SECONDS))
+    watcher = TablesWatcher(path, interval)
+    watcher.check()
+    watcher.start()
+    return watcher
@@ -0,0 +1,130 @@
+"""Compact token representation: interned vocabulary, integer token IDs and array-backed counts.
+
+Optional path for large inputs: tokens are mapped to IDs in a Vocabulary, the token stream is
+stored as array("I"), and counting is a bincount-style pass (NumPy when installed).
+CompactCounts is a read-only Mapping[str, int], so it drops into analyze_counts() unchanged.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+
+try:  # Optional: pip install "resume-analyzer[fast]"
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class Vocabulary:
+    """Interned term <-> ID mapping. Lookups are lock-free; inserts take a lock."""
+
+    def __init__(self, terms: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._terms: list[str] = []
+        self._lock = threading.Lock()
+        for t in terms:
+            self.id_for(t)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def get(self, term: str) -> int | None:
+        """ID for term, or None if it was never interned."""
+        return self._ids.get(term)
+
+    def id_for(self, term: str) -> int:
+        """ID for term, interning it on first sight."""
+        i = self._ids.get(term)
+        if i is not None:
+            return i
+        with self._lock:
+            i = self._ids.get(term)
+            if i is None:
+                i = len(self._terms)
+                self._terms.append(term)
+                self._ids[term] = i
+            return i
+
+    def term(self, i: int) -> str:
+        return self._terms[i]
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        """Token stream as array("I") of IDs."""
+        known = self._ids
+        out = array("I")
+        append = out.append
+        for t in tokens:
+            i = known.get(t)
+            append(self.id_for(t) if i is None else i)
+        return out
+
+
+class CompactCounts(Mapping[str, int]):
+    """Term counts as parallel arrays (ascending IDs, counts) over a Vocabulary."""
+
+    __slots__ = ("counts", "ids", "vocab")
+
+    def __init__(self, vocab: Vocabulary, ids: array, counts: array) -> None:
+        self.vocab = vocab
+        self.ids = ids
+        self.counts = counts
+
+    def __getitem__(self, term: str) -> int:
+        i = self.vocab.get(term)
+        if i is not None:
+            pos = bisect_left(self.ids, i)
+            if pos < len(self.ids) and self.ids[pos] == i:
+                return self.counts[pos]
+        raise KeyError(term)
+
+    def __iter__(self) -> Iterator[str]:
+        term = self.vocab.term
+        return (term(i) for i in self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def ranked(self, top_n: int, use_numpy: bool | None = None) -> list[tuple[str, int]]:
+        """
+        Top top_n (term, count) by count desc, then term asc, via partial selection:
+        NumPy partitions on counts to find the cutoff; otherwise a bounded heap.
+        """
+        if top_n <= 0 or not self.ids:
+            return []
+        term = self.vocab.term
+        if (HAS_NUMPY if use_numpy is None else use_numpy) and len(self.counts) > top_n:
+            counts = np.frombuffer(self.counts, dtype=np.uint32)
+            cutoff = np.partition(counts, len(counts) - top_n)[len(counts) - top_n]
+            # Everything at or above the cutoff; ties on the cutoff are resolved by term below.
+            picked = np.flatnonzero(counts >= cutoff)
+            candidates = [(term(self.ids[p]), self.counts[p]) for p in picked.tolist()]
+            return sorted(candidates, key=lambda x: (-x[1], x[0]))[:top_n]
+        pairs = ((term(i), c) for i, c in zip(self.ids, self.counts))
+        return heapq.nsmallest(top_n, pairs, key=lambda x: (-x[1], x[0]))
+
+
+def count_ids(ids: array, vocab: Vocabulary, use_numpy: bool | None = None) -> CompactCounts:
+    """
+    Bincount-style count of a token-ID stream into CompactCounts. Without NumPy, counts go
+    into a dict keyed by ID, so memory follows the distinct IDs in the stream, not the
+    largest ID in the vocabulary.
+    """
+    if not ids:
+        return CompactCounts(vocab, array("I"), array("I"))
+    if HAS_NUMPY if use_numpy is None else use_numpy:
+        binned = np.bincount(np.frombuffer(ids, dtype=np.uint32))
+        nonzero = np.flatnonzero(binned)
+        out_ids = array("I", nonzero.astype(np.uint32).tobytes())
+        out_counts = array("I", binned[nonzero].astype(np.uint32).tobytes())
+        return CompactCounts(vocab, out_ids, out_counts)
+    counted = Counter(ids)
+    out_ids = array("I", sorted(counted))
+    out_counts = array("I", (counted[i] for i in out_ids))
+    return CompactCounts(vocab, out_ids, out_counts)
@@ -2,8 +2,8 @@
 
 import pytest
 
-from resume_analyzer.analyzer import analyze
-from resume_analyzer.models import AnalysisResult
+from resume_analyzer.analyzer import analyze, analyze_text
+from resume_analyzer.models import AnalysisResult, format_readable_summary
 
 
 def test_analyze_job_description() -> None:
@@ -55,3 +55,16 @@ def test_analyze_synonym_python3_in_jd() -> None:
     result = analyze(resume_text=resume, job_description=jd)
     assert "python" in result.matched_keywords or any(k.term == "python" for k in result.top_keywords)
     assert result.overall_score > 0
+
+
+def test_slotted_result_converts_like_validated_model() -> None:
+    resume = "Pyhton and Kubernets developer. PostgreSQL, Docker, REST APIs."
+    keywords = ["python", "kubernetes", "postgresql", "terraform"]
+    lite = analyze_text(resume, keywords=keywords, fuzzy=True)
+    assert not hasattr(lite, "__dict__")
+    assert lite.fuzzy_matched_keywords
+    validated = AnalysisResult.model_validate(lite.to_dict())
+    assert lite.to_model() == validated == analyze(resume, keywords=keywords, fuzzy=True)
+    assert lite.to_dict() == validated.model_dump()
+    assert lite.to_model().model_dump_json() == validated.model_dump_json()
+    assert format_readable_summary(lite) == format_readable_summary(validated)
@@ -0,0 +1,142 @@
+"""Tests for per-request CPU time budgets (resume_analyzer/budget.py) and their API handling."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.jobs import JobStore, get_job_store
+from api.main import app
+from benchmarks.common import synthetic_resume
+from resume_analyzer.analyzer import analyze_text
+from resume_analyzer.budget import BudgetExceeded, current_budget, time_budget
+from resume_analyzer.fuzzy import find_fuzzy_matches
+from resume_analyzer.match import CompiledTargets, compute_matched_and_missing
+from resume_analyzer.normalize import iter_tokens, iter_tokens_from_fragments, tokenize
+
+LARGE = synthetic_resume(400_000, seed=5)
+SMALL = {"resume_text": "Python developer with Kafka", "keywords": ["python", "go"]}
+
+
+def _large(**extra: object) -> dict:
+    return {"resume_text": LARGE, "keywords": ["python", "kafka"], **extra}
+
+
+def test_tokenize_windows_match_the_whole_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    text = "Senior NodeJS/Node.js dev; C++, C#, .NET\tPython3 " * 40 + synthetic_resume(3_000)
+    expected = tokenize(text)
+    for window in (1, 17, 250):
+        monkeypatch.setattr("resume_analyzer.normalize.TOKENIZE_WINDOW", window)
+        assert tokenize(text) == expected
+
+
+def test_budget_stops_runs_without_whitespace() -> None:
+    run = "ab1," * 50_000  # one tokenizer window, 50,000 tokens
+    consumed = 0
+    with time_budget(0.001), pytest.raises(BudgetExceeded) as err:
+        for _ in iter_tokens(run):
+            consumed += 1
+            sum(range(200))  # enough work per token to spend the budget well inside the run
+    assert err.value.stage == "tokenize" and consumed < 50_000
+
+    with time_budget(0.001), pytest.raises(BudgetExceeded):
+        for _ in iter_tokens_from_fragments(["ab1,"] * 50_000):
+            sum(range(200))
+
+
+def test_budget_aborts_tokenizing_and_matching() -> None:
+    with time_budget(0.001) as budget:
+        assert current_budget() is budget
+        with pytest.raises(BudgetExceeded) as err:
+            analyze_text(LARGE, keywords=["python"])
+    assert err.value.stage == "tokenize" and err.value.used > err.value.budget
+    assert current_budget() is None
+
+    targets = {f"skill{i}" for i in range(20_000)}
+    with time_budget(0.001), pytest.raises(BudgetExceeded) as err:
+        compute_matched_and_missing({"python"}, targets)
+    assert err.value.stage == "match"
+
+
+def test_budget_aborts_fuzzy_matching_and_target_compiling() -> None:
+    resume_terms = [f"resumeterm{i}" for i in range(20_000)]
+    targets = [f"targetskill{i}" for i in range(5_000)]
+    with time_budget(0.001), pytest.raises(BudgetExceeded) as err:
+        find_fuzzy_matches(resume_terms, targets)
+    assert err.value.stage == "fuzzy"
+    with time_budget(0.001), pytest.raises(BudgetExceeded) as err:
+        CompiledTargets([f"skill{i}" for i in range(50_000)])
+    assert err.value.stage == "compile"
+
+
+def test_many_fuzzy_keywords_over_budget_return_422() -> None:
+    body = {
+        "resume_text": " ".join(f"experienced{i} engineerring{i}" for i in range(5_000)),
+        "keywords": [f"engineering{i}" for i in range(1_000)],
+        "fuzzy": True,
+    }
+    client = TestClient(app)
+    response = client.post("/analyze", json=body, headers={"X-Time-Budget-Ms": "1"})
+    assert response.status_code == 422 and "budget of 1 ms exceeded" in response.json()["detail"]
+
+
+def test_no_budget_and_generous_budget_do_not_change_results() -> None:
+    with time_budget(None) as budget:
+        assert budget is None and current_budget() is None
+        expected = analyze_text(LARGE, keywords=["python", "kafka"])
+    with time_budget(60):
+        assert analyze_text(LARGE, keywords=["python", "kafka"]) == expected
+
+
+def test_header_budget_returns_422_and_records_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SLOW_INPUT_DIR", str(tmp_path))
+    client = TestClient(app)
+    response = client.post("/analyze", json=_large(), headers={"X-Time-Budget-Ms": "1"})
+    assert response.status_code == 422
+    assert "budget of 1 ms exceeded" in response.json()["detail"]
+    (record_path,) = tmp_path.glob("*.json")
+    record = json.loads(record_path.read_text(encoding="utf-8"))
+    assert record["endpoint"] == "/analyze" and record["stage"] == "tokenize"
+    assert record["budget_ms"] == 1 and record["request"]["resume_text"] == LARGE
+
+    again = client.post("/analyze", json=_large(), headers={"X-Time-Budget-Ms": "1"})
+    assert again.status_code == 422 and len(list(tmp_path.glob("*.json"))) == 1  # same input
+
+    ok = client.post("/analyze", json=SMALL, headers={"X-Time-Budget-Ms": "10000"})
+    assert ok.status_code == 200
+    assert client.post("/analyze", json=SMALL, headers={"X-Time-Budget-Ms": "0"}).status_code == 422
+
+
+def test_configured_budget_caps_header_and_applies_per_batch_item(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("SLOW_INPUT_DIR", raising=False)
+    monkeypatch.setenv("TIME_BUDGET_MS", "1")
+    client = TestClient(app)
+    capped = client.post("/analyze", json=_large(), headers={"X-Time-Budget-Ms": "60000"})
+    assert capped.status_code == 422
+
+    batch = client.post("/analyze/batch", json={"items": [SMALL, _large(), SMALL]})
+    assert [r["status"] for r in batch.json()["results"]] == [200, 422, 200]
+
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    app.dependency_overrides[get_job_store] = lambda: store
+    try:
+        job = client.post("/jobs", json={"keywords": ["python"]}).json()
+        analyzed = client.post(f"/jobs/{job['id']}/analyze", json={"resume_text": LARGE})
+        assert analyzed.status_code == 422
+    finally:
+        app.dependency_overrides.pop(get_job_store, None)
+        store.close()
+
+    upload = client.post(
+        "/analyze/file",
+        files={"resume": ("resume.txt", LARGE.encode(), "text/plain")},
+        data={"keywords": ["python"]},
+    )
+    assert upload.status_code == 422
@@ -0,0 +1,67 @@
+"""Tests for the on-disk tokenization cache and incremental batch runs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from resume_analyzer import cache as cache_mod
+from resume_analyzer.analyzer import analyze, analyze_counts, build_target_keywords
+from resume_analyzer.cache import TokenCache, TokenizedText, content_hash
+from resume_analyzer.cli import app
+
+RESUME = "Python developer. Node.js, C++ and SQL. REST APIs with Docker."
+JD = "We need Python, JavaScript, SQL and Kubernetes."
+
+
+def test_cached_result_matches_direct_analyze(tmp_path: Path) -> None:
+    cache = TokenCache(tmp_path)
+    target = build_target_keywords(job_description=JD)
+    first = cache.load_or_tokenize(RESUME)
+    second = cache.load_or_tokenize(RESUME)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second == first
+    via_cache = analyze_counts(second.counts, target, resume_forms=second.forms)
+    assert via_cache.to_model() == analyze(resume_text=RESUME, job_description=JD)
+
+
+def test_entry_roundtrip(tmp_path: Path) -> None:
+    cache = TokenCache(tmp_path)
+    entry = TokenizedText.from_text(RESUME)
+    cache.put(content_hash(RESUME), entry)
+    assert cache.get(content_hash(RESUME)) == entry
+    assert cache.get(content_hash("other")) is None
+
+
+def test_fingerprint_change_invalidates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    old = TokenCache(tmp_path)
+    old.load_or_tokenize(RESUME)
+    monkeypatch.setattr(cache_mod, "TOKENIZER_VERSION", cache_mod.TOKENIZER_VERSION + 1)
+    new = TokenCache(tmp_path)
+    assert new.fingerprint != old.fingerprint
+    new.load_or_tokenize(RESUME)
+    assert new.misses == 1
+    assert new.prune_stale() == 1
+    assert not old.directory.exists()
+
+
+def test_batch_cli_reuses_cache(tmp_path: Path) -> None:
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "a.txt").write_text(RESUME, encoding="utf-8")
+    (resumes / "b.txt").write_text("Java and Go engineer.", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    args = ["batch", str(resumes), "--keywords", "python,sql,go", "--cache-dir", str(cache_dir)]
+    runner = CliRunner()
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0, first.output
+    assert "0 hits, 2 misses" in first.output
+    (resumes / "b.txt").write_text("Go engineer with SQL.", encoding="utf-8")
+    second = runner.invoke(app, args)
+    assert "1 hits, 1 misses" in second.output
+    rows = [json.loads(line) for line in second.stdout.splitlines() if line.startswith("{")]
+    assert [Path(r["file"]).name for r in rows] == ["a.txt", "b.txt"]
+    assert rows[1]["result"]["matched_keywords"] == ["go", "sql"]
@@ -0,0 +1,154 @@
+"""Tests for the API client (resume_analyzer/client.py) and POST /analyze/batch, in-process."""
+
+from __future__ import annotations
+
+import json
+
+import anyio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import MAX_BATCH_ITEMS, app
+from resume_analyzer.client import APIError, AsyncClient, Client
+
+RESUME = "Senior Python developer: Kafka, Docker and PostgreSQL on AWS."
+GOOD = {"resume_text": RESUME, "keywords": ["python", "kubernetes"]}
+NO_TARGET = {"resume_text": RESUME}
+EMPTY = {"resume_text": "   ", "keywords": ["python"]}
+
+
+def _json(status: int, body: object, **headers: str) -> httpx.Response:
+    return httpx.Response(status, content=json.dumps(body), headers=headers)
+
+
+def test_batch_endpoint_answers_items_independently() -> None:
+    client = TestClient(app)
+    single = client.post("/analyze", json=GOOD).json()
+    response = client.post("/analyze/batch", json={"items": [GOOD, NO_TARGET, EMPTY, GOOD]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 400, 422, 200]
+    assert {k: results[0][k] for k in single} == single
+    assert "job_description" in results[1]["detail"] and results[2]["detail"][0]["loc"]
+    too_many = {"items": [GOOD] * (MAX_BATCH_ITEMS + 1)}
+    assert client.post("/analyze/batch", json=too_many).status_code == 422
+
+
+def test_sync_client_analyze_and_batches() -> None:
+    http = TestClient(app)
+    paths: list[str] = []
+    http.event_hooks = {"request": [lambda request: paths.append(request.url.path)]}
+    expected = http.post("/analyze", json=GOOD).json()
+    paths.clear()
+    with Client(http=http, max_batch=2) as client:
+        assert client.analyze(RESUME, keywords=["python", "kubernetes"]) == expected
+        with pytest.raises(APIError) as err:
+            client.analyze(RESUME)
+        assert err.value.status_code == 400
+        paths.clear()
+        outcomes = client.analyze_many([GOOD, NO_TARGET, GOOD, GOOD, EMPTY])
+    assert paths == ["/analyze/batch", "/analyze/batch", "/analyze"]
+    assert outcomes[0] == outcomes[2] == outcomes[3] == expected
+    assert [o.status_code for o in outcomes if isinstance(o, APIError)] == [400, 422]
+    assert client.batch_supported is True
+
+
+def test_retries_503_with_backoff() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) <= 2:
+            return _json(503, {"detail": "busy"}, **{"Retry-After": "0"})
+        return _json(200, {"result": {"overall_score": 80}, "readable_summary": None})
+
+    http = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://test")
+    client = Client(http=http, backoff=0)
+    assert client.analyze(RESUME, keywords=["python"], score_only=True)["result"] == {
+        "overall_score": 80
+    }
+    assert len(calls) == 3
+    calls.clear()
+    with pytest.raises(APIError) as err:
+        Client(http=http, retries=1, backoff=0).analyze(RESUME, keywords=["python"])
+    assert err.value.status_code == 503 and err.value.detail == "busy" and len(calls) == 2
+
+
+def test_falls_back_to_single_requests_without_batch_endpoint() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/analyze/batch":
+            return _json(404, {"detail": "Not Found"})
+        body = json.loads(request.content)
+        return _json(200, {"result": {"echo": body["resume_text"]}, "readable_summary": "ok"})
+
+    http = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://test")
+    client = Client(http=http)
+    bodies = [{"resume_text": f"resume {i}", "keywords": ["go"]} for i in range(3)]
+    outcomes = client.analyze_many(bodies)
+    assert [o["result"]["echo"] for o in outcomes] == ["resume 0", "resume 1", "resume 2"]
+    assert client.batch_supported is False
+
+
+def test_async_auto_batching_against_asgi_app() -> None:
+    paths: list[str] = []
+
+    async def record(request: httpx.Request) -> None:
+        paths.append(request.url.path)
+
+    async def main() -> None:
+        http = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app),
+            base_url="http://test",
+            event_hooks={"request": [record]},
+        )
+        async with http, AsyncClient(http=http, auto_batch=True, batch_window=0.05) as client:
+            expected = (await http.post("/analyze", json=GOOD)).json()
+            paths.clear()
+            outcomes: dict[int, object] = {}
+
+            async def call(i: int) -> None:
+                try:
+                    if i == 3:
+                        outcomes[i] = await client.analyze(RESUME)
+                    else:
+                        outcomes[i] = await client.analyze(RESUME, keywords=GOOD["keywords"])
+                except APIError as e:
+                    outcomes[i] = e
+
+            async with anyio.create_task_group() as tg:
+                for i in range(6):
+                    tg.start_soon(call, i)
+            assert paths == ["/analyze/batch"]
+            assert all(outcomes[i] == expected for i in (0, 1, 2, 4, 5))
+            assert isinstance(outcomes[3], APIError) and outcomes[3].status_code == 400
+
+            paths.clear()
+            many = await client.analyze_many([GOOD] * 5)
+            assert many == [expected] * 5 and paths == ["/analyze/batch"]
+
+    anyio.run(main)
+
+
+def test_async_concurrency_limit() -> None:
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await anyio.sleep(0.01)
+        in_flight -= 1
+        return _json(200, {"result": {}, "readable_summary": None})
+
+    async def main() -> None:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test")
+        client = AsyncClient(http=http, max_concurrency=2)
+        async with http, anyio.create_task_group() as tg:
+            for _ in range(8):
+                tg.start_soon(lambda: client.analyze(RESUME, keywords=["go"]))
+
+    anyio.run(main)
+    assert peak == 2
+    with pytest.raises(ValueError):
+        Client(max_concurrency=0)
@@ -0,0 +1,125 @@
+"""Tests for the memory-mapped corpus reader and the `corpus` CLI command."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from resume_analyzer.analyzer import analyze, score_only
+from resume_analyzer.cli import app
+from resume_analyzer.corpus import CorpusReader, detect_corpus_format, write_length_prefixed
+
+RECORDS = [
+    {"id": "a", "resume_text": "Python developer, Kubernetes and AWS."},
+    {"id": "b", "resume_text": "Java engineer; Spring, Kafka, PostgreSQL."},
+    {"id": "c", "resume_text": "Data scientist: pandas, SQL, machine learning."},
+    {"id": "d", "resume_text": "React/TypeScript frontend developer."},
+]
+
+runner = CliRunner()
+
+
+def _write_jsonl(path: Path, records: list, blank_lines: bool = False) -> Path:
+    lines = [json.dumps(r) for r in records]
+    sep = "\n\n" if blank_lines else "\r\n"
+    path.write_text(sep.join(lines), encoding="utf-8")  # no trailing newline
+    return path
+
+
+@pytest.fixture(params=["jsonl", "length-prefixed"])
+def corpus_path(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    if request.param == "jsonl":
+        return _write_jsonl(tmp_path / "corpus.jsonl", RECORDS, blank_lines=True)
+    path = tmp_path / "corpus.lp"
+    write_length_prefixed(RECORDS, path)
+    return path
+
+
+def test_detect_format() -> None:
+    assert detect_corpus_format("x.jsonl") == "jsonl"
+    assert detect_corpus_format("x.LPJ") == "length-prefixed"
+
+
+def test_index_and_slice_access(corpus_path: Path) -> None:
+    with CorpusReader(corpus_path) as reader:
+        assert reader.index_built
+        assert len(reader) == len(RECORDS)
+        assert reader[0] == RECORDS[0]
+        assert reader[-1] == RECORDS[-1]
+        assert reader[1:3] == RECORDS[1:3]
+        assert reader[::2] == RECORDS[::2]
+        assert list(reader) == RECORDS
+        assert json.loads(reader.raw(2)) == RECORDS[2]
+        with pytest.raises(IndexError):
+            reader.raw(len(RECORDS))
+
+
+def test_sidecar_index_reused_until_corpus_changes(tmp_path: Path) -> None:
+    path = _write_jsonl(tmp_path / "corpus.jsonl", RECORDS)
+    CorpusReader(path).close()
+    assert Path(f"{path}.idx").exists()
+    with CorpusReader(path) as reader:
+        assert not reader.index_built
+        assert reader[3] == RECORDS[3]
+    _write_jsonl(path, RECORDS[:2])
+    os.utime(path, ns=(1, 1))
+    with CorpusReader(path) as reader:
+        assert reader.index_built
+        assert len(reader) == 2
+
+
+def test_byte_ranges_cover_every_record_once(corpus_path: Path) -> None:
+    with CorpusReader(corpus_path) as reader:
+        for n in (1, 2, 3, 7, 50):
+            ranges = reader.byte_ranges(n)
+            assert ranges[0][0] == 0 and ranges[-1][1] == reader.size
+            indexes = [i for start, end in ranges for i in reader.records_in(start, end)]
+            assert indexes == list(range(len(RECORDS)))
+
+
+def test_empty_and_truncated_corpora(tmp_path: Path) -> None:
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    with CorpusReader(empty) as reader:
+        assert len(reader) == 0 and reader[:] == []
+    truncated = tmp_path / "bad.lp"
+    write_length_prefixed(RECORDS, truncated)
+    truncated.write_bytes(truncated.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        CorpusReader(truncated)
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_cli_corpus_matches_per_record_analysis(corpus_path: Path, workers: str) -> None:
+    args = ["corpus", str(corpus_path), "--keywords", "python,sql,kafka", "--workers", workers]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["id"] for r in rows] == [r["id"] for r in RECORDS]
+    assert [r["record"] for r in rows] == list(range(len(RECORDS)))
+    for row, record in zip(rows, RECORDS, strict=True):
+        expected = analyze(record["resume_text"], keywords=["python", "sql", "kafka"])
+        assert row["result"] == expected.model_dump()
+
+    result = runner.invoke(app, [*args, "--score-only"])
+    scores = [json.loads(line)["result"]["overall_score"] for line in result.stdout.splitlines()]
+    expected = [score_only(r["resume_text"], keywords=["python", "sql", "kafka"]) for r in RECORDS]
+    assert scores == expected
+
+
+def test_cli_corpus_reports_bad_records_and_index_only(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.jsonl"
+    path.write_text('{"id": 1}\nnot json\n"plain resume text with python"\n', encoding="utf-8")
+    result = runner.invoke(app, ["corpus", str(path), "--index-only"])
+    assert result.exit_code == 0 and result.stdout == ""
+    result = runner.invoke(app, ["corpus", str(path), "--keywords", "python"])
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert "error" in rows[0] and rows[0]["id"] == 1
+    assert rows[1]["error"].startswith("invalid JSON")
+    assert rows[2]["result"]["matched_keywords"] == ["python"]
+    result = runner.invoke(app, ["corpus", str(path), "--format", "csv", "--keywords", "x"])
+    assert result.exit_code == 1
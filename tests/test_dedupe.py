@@ -0,0 +1,72 @@
+"""Tests for MinHash/LSH near-duplicate detection and batch reuse."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from resume_analyzer.cli import app
+from resume_analyzer.dedupe import LSHIndex, MinHasher, estimate_jaccard, lsh_params
+
+
+def _tokens(seed: int, n: int = 200) -> set[str]:
+    rng = random.Random(seed)
+    return {f"t{rng.randrange(100_000)}" for _ in range(n)}
+
+
+def test_signature_estimates_jaccard() -> None:
+    hasher = MinHasher(num_perm=256)
+    a = _tokens(1)
+    b = set(list(a)[:150]) | _tokens(2, 50)  # Jaccard = 150 / 250 = 0.6
+    true = len(a & b) / len(a | b)
+    assert abs(estimate_jaccard(hasher.signature(a), hasher.signature(b)) - true) < 0.1
+    assert estimate_jaccard(hasher.signature(a), hasher.signature(set(a))) == 1.0
+
+
+def test_signature_is_deterministic_across_instances() -> None:
+    assert MinHasher(seed=3).signature({"python", "sql"}) == MinHasher(seed=3).signature(
+        ["sql", "python"]
+    )
+
+
+def test_lsh_params_fit_num_perm() -> None:
+    for threshold in (0.5, 0.8, 0.9, 0.95):
+        bands, rows = lsh_params(threshold, 128)
+        assert bands * rows <= 128
+        assert 1 - (1 - threshold**rows) ** bands >= 0.99
+
+
+def test_lsh_index_finds_near_duplicate_only() -> None:
+    hasher = MinHasher()
+    index = LSHIndex(threshold=0.8)
+    base = _tokens(10)
+    index.insert("base", hasher.signature(base))
+    index.insert("other", hasher.signature(_tokens(11)))
+    near = set(list(base)[:195]) | {"extra1", "extra2"}
+    match = index.query(hasher.signature(near))
+    assert match is not None and match[0] == "base" and match[1] >= 0.8
+    assert index.query(hasher.signature(_tokens(12))) is None
+    with pytest.raises(ValueError):
+        LSHIndex(threshold=0)
+
+
+def test_batch_reuses_near_duplicate_analysis(tmp_path: Path) -> None:
+    body = " ".join(f"skill{i}" for i in range(80))
+    (tmp_path / "a.txt").write_text("Python SQL " + body, encoding="utf-8")
+    (tmp_path / "b.txt").write_text("Python SQL " + body + " extra", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("Go and Rust engineer", encoding="utf-8")
+    args = ["batch", str(tmp_path), "-k", "python,sql,go", "--dedupe-threshold", "0.9"]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    assert "duplicate_of" not in rows[0] and "duplicate_of" not in rows[2]
+    assert Path(rows[1]["duplicate_of"]).name == "a.txt"
+    assert rows[1]["result"] == rows[0]["result"]
+    assert "1 analyses reused" in result.output
+
+    flagged = CliRunner().invoke(app, [*args, "--dedupe-mode", "flag"])
+    assert "0 analyses reused" in flagged.output
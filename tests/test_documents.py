@@ -0,0 +1,148 @@
+"""Tests for streaming DOCX/HTML extraction and fragment tokenization."""
+
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from typer.testing import CliRunner
+
+from api.main import app as api_app
+from resume_analyzer.analyzer import analyze, analyze_fragments
+from resume_analyzer.cli import app as cli_app
+from resume_analyzer.documents import (
+    DOCX_CONTENT_TYPE,
+    detect_format,
+    iter_docx_fragments,
+    iter_html_fragments,
+)
+from resume_analyzer.extract import count_keywords, count_keywords_from_fragments
+from resume_analyzer.normalize import MAX_PENDING_CHARS, iter_tokens_from_fragments, tokenize
+
+RESUME = Path(__file__).parent.parent / "examples" / "sample_resume.txt"
+
+
+def _docx_bytes(paragraphs: list[list[str]]) -> bytes:
+    """Minimal .docx: each paragraph is a list of runs."""
+    body = "".join(
+        "<w:p>" + "".join(f"<w:r><w:t>{run}</w:t></w:r>" for run in runs) + "</w:p>"
+        for runs in paragraphs
+    )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", xml)
+    return buf.getvalue()
+
+
+def test_fragment_tokens_match_tokenize() -> None:
+    text = RESUME.read_text(encoding="utf-8")
+    rng = random.Random(7)
+    for _ in range(20):
+        cuts = sorted(rng.sample(range(1, len(text)), 40))
+        parts = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+        assert list(iter_tokens_from_fragments(parts)) == tokenize(text)
+    assert count_keywords_from_fragments(iter(text)) == count_keywords(text)
+
+
+def test_fragments_without_whitespace_stay_linear(monkeypatch: pytest.MonkeyPatch) -> None:
+    parts = ["ab1"] * 40_000  # 120k characters without whitespace, 3 at a time
+    tokens = list(iter_tokens_from_fragments(parts))
+    assert "".join(tokens) == "".join(parts)
+    assert max(map(len, tokens)) <= MAX_PENDING_CHARS + 3
+
+    monkeypatch.setattr("resume_analyzer.normalize.MAX_PENDING_CHARS", 10)
+    assert list(iter_tokens_from_fragments(["Pyth", "on ", "Kaf", "ka"])) == ["python", "kafka"]
+    assert list(iter_tokens_from_fragments(["abcdef", "ghijkl", "mn op"])) == [
+        "abcdefghijkl",
+        "mn",
+        "op",
+    ]
+
+
+def test_docx_runs_joined_and_paragraphs_split() -> None:
+    data = _docx_bytes([["Pyth", "on and Node", ".js"], ["C++"]])
+    text = "".join(iter_docx_fragments(io.BytesIO(data)))
+    assert tokenize(text) == ["python", "node.js", "c++"]
+
+
+def test_html_skips_script_and_splits_blocks() -> None:
+    html = "<html><head><style>.x{}</style><script>var java=1</script></head>"
+    html += "<body><p>Py<b>thon</b></p><li>SQL</li><li>Docker</li></body></html>"
+    chunks = [html[i : i + 5] for i in range(0, len(html), 5)]
+    assert list(iter_tokens_from_fragments(iter_html_fragments(chunks))) == [
+        "python",
+        "sql",
+        "docker",
+    ]
+
+
+@pytest.mark.parametrize(
+    "filename,content_type,expected",
+    [
+        ("cv.docx", None, "docx"),
+        ("cv.HTML", None, "html"),
+        ("cv.txt", None, "text"),
+        (None, DOCX_CONTENT_TYPE, "docx"),
+        ("upload", "text/html; charset=utf-8", "html"),
+        ("cv.docx", "text/plain", "text"),
+    ],
+)
+def test_detect_format(filename: str | None, content_type: str | None, expected: str) -> None:
+    assert detect_format(filename, content_type) == expected
+
+
+def test_cli_analyze_docx(tmp_path: Path) -> None:
+    path = tmp_path / "cv.docx"
+    path.write_bytes(_docx_bytes([["Python developer"], ["Kubernetes and SQL"]]))
+    result = CliRunner().invoke(
+        cli_app, ["analyze", "-r", str(path), "-k", "python,sql,go", "-f", "json"]
+    )
+    assert result.exit_code == 0, result.output
+    assert '"go"' in result.stdout
+    assert "python" in result.stdout
+
+
+def test_api_analyze_file_docx_and_html() -> None:
+    client = TestClient(api_app)
+    expected = analyze("Python developer Kubernetes", keywords=["python", "kubernetes", "go"])
+    docx = _docx_bytes([["Python developer"], ["Kubernetes"]])
+    resp = client.post(
+        "/analyze/file",
+        files={"resume": ("cv.docx", docx, DOCX_CONTENT_TYPE)},
+        data={"keywords": ["python", "kubernetes", "go"]},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["result"] == expected.model_dump()
+    html = b"<p>Python developer</p><p>Kubernetes</p>"
+    resp = client.post(
+        "/analyze/file",
+        files={"resume": ("cv.html", html, "text/html")},
+        data={"keywords": ["python", "kubernetes", "go"]},
+    )
+    assert resp.json()["result"] == expected.model_dump()
+
+
+def test_api_analyze_file_rejects_bad_docx() -> None:
+    client = TestClient(api_app)
+    resp = client.post(
+        "/analyze/file",
+        files={"resume": ("cv.docx", b"not a zip", DOCX_CONTENT_TYPE)},
+        data={"role_title": "Engineer"},
+    )
+    assert resp.status_code == 422
+
+
+def test_analyze_fragments_matches_analyze() -> None:
+    text = RESUME.read_text(encoding="utf-8")
+    assert analyze_fragments(iter(text), keywords=["python", "go"]).to_model() == analyze(
+        text, keywords=["python", "go"]
+    )
@@ -0,0 +1,97 @@
+"""Tests for typo-tolerant matching (deletion index + OSA distance)."""
+
+from __future__ import annotations
+
+import json
+
+from fastapi.testclient import TestClient
+from typer.testing import CliRunner
+
+from api.main import app as api_app
+from resume_analyzer.analyzer import analyze
+from resume_analyzer.cli import app
+from resume_analyzer.fuzzy import DeletionIndex, allowed_distance, find_fuzzy_matches, osa_distance
+
+TYPO_RESUME = "Ran kubernets clusters on postgress; built dashboards and pipelines."
+
+
+def test_osa_distance_counts_transpositions_as_one_edit() -> None:
+    assert osa_distance("docker", "dokcer", 2) == 1
+    assert osa_distance("kubernetes", "kubernets", 2) == 1
+    assert osa_distance("terraform", "terafrom", 2) == 2
+    assert osa_distance("python", "pascal", 1) == 2  # capped at max_distance + 1
+
+
+def test_allowed_distance_scales_with_length() -> None:
+    assert allowed_distance("react") == 0
+    assert allowed_distance("docker") == 1
+    assert allowed_distance("kubernetes") == 2
+
+
+def test_deletion_index_lookup_matches_brute_force() -> None:
+    terms = ["kubernetes", "terraform", "postgresql", "postgres", "docker", "ansible", "jenkins"]
+    index = DeletionIndex(terms)
+    for query in ("kubernets", "teraform", "postgress", "dockr", "jenkinz", "ansibel", "nothing"):
+        limit = allowed_distance(query)
+        expected = sorted(
+            (
+                (t, osa_distance(query, t, limit))
+                for t in terms
+                if osa_distance(query, t, limit) <= limit
+            ),
+            key=lambda x: (x[1], x[0]),
+        )
+        assert index.lookup(query) == expected
+
+
+def test_find_fuzzy_matches_pairs_target_with_misspelling() -> None:
+    hits = find_fuzzy_matches(
+        {"kubernets", "postgress", "reach"}, ["kubernetes", "postgresql", "react"]
+    )
+    assert hits == [("kubernetes", "kubernets", 1), ("postgresql", "postgress", 1)]
+
+
+def test_known_terms_are_not_typos() -> None:
+    # "postgres" is a real variant; "react" is too short to match "reach" fuzzily.
+    assert find_fuzzy_matches({"postgres", "reach"}, ["react", "mongodb"]) == []
+
+
+def test_analyze_reports_fuzzy_matches_separately() -> None:
+    result = analyze(TYPO_RESUME, keywords=["kubernetes", "postgresql", "terraform"], fuzzy=True)
+    assert result.matched_keywords == []
+    assert [(m.term, m.resume_term) for m in result.fuzzy_matched_keywords] == [
+        ("kubernetes", "kubernets"),
+        ("postgresql", "postgress"),
+    ]
+    assert result.missing_keywords == ["terraform"]
+    assert result.score_breakdown["fuzzy_matched_count"] == 2
+    assert result.overall_score == round(2 / 3 * 100, 1)
+    assert any("approximately" in n for n in result.confidence_notes)
+
+
+def test_fuzzy_is_off_by_default() -> None:
+    result = analyze(TYPO_RESUME, keywords=["kubernetes", "postgresql", "terraform"])
+    assert result.fuzzy_matched_keywords is None
+    assert "fuzzy_matched_keywords" not in result.model_dump()
+    assert "fuzzy_matched_count" not in result.score_breakdown
+    assert result.overall_score == 0.0
+
+
+def test_api_fuzzy_flag() -> None:
+    client = TestClient(api_app)
+    body = {"resume_text": TYPO_RESUME, "keywords": ["kubernetes"], "fuzzy": True}
+    data = client.post("/analyze", json=body).json()
+    assert data["result"]["fuzzy_matched_keywords"][0]["resume_term"] == "kubernets"
+    assert "Fuzzy matches (1)" in data["readable_summary"]
+    plain = client.post("/analyze", json={**body, "fuzzy": False}).json()
+    assert "fuzzy_matched_keywords" not in plain["result"]
+
+
+def test_cli_fuzzy_flag(tmp_path) -> None:
+    resume = tmp_path / "r.txt"
+    resume.write_text(TYPO_RESUME, encoding="utf-8")
+    result = CliRunner().invoke(
+        app, ["analyze", "-r", str(resume), "-k", "kubernetes", "-f", "json", "--fuzzy"]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["fuzzy_matched_keywords"][0]["term"] == "kubernetes"
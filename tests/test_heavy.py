@@ -0,0 +1,79 @@
+"""Tests for bounded-memory heavy-hitter counts (resume_analyzer/heavy.py) and top-K ranking."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.extract import (
+    count_keywords,
+    count_keywords_bounded,
+    extract_keywords,
+    rank_keywords,
+)
+from resume_analyzer.heavy import HeavyHitters
+
+
+def _adversarial_stream(n_unique: int, seed: int = 0) -> list[str]:
+    """A few heavy terms among n_unique terms that occur once, shuffled."""
+    heavy = ["python"] * 400 + ["kafka"] * 300 + ["docker"] * 200 + ["go"] * 100
+    stream = heavy + [f"junk{i}" for i in range(n_unique)]
+    random.Random(seed).shuffle(stream)
+    return stream
+
+
+def test_rank_keywords_heap_matches_full_sort() -> None:
+    counts = count_keywords(synthetic_resume(20_000, seed=4) + " zeta alpha beta")
+    full = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+    for top_n in (0, 1, 5, 30, len(counts) + 10):
+        assert rank_keywords(counts, top_n) == full[:top_n]
+
+
+def test_exact_below_capacity() -> None:
+    text = synthetic_resume(30_000, seed=2)
+    summary = count_keywords_bounded(text, capacity=1_000)
+    assert summary.exact and summary.error == 0
+    assert dict(summary) == count_keywords(text)
+    assert extract_keywords(text) == extract_keywords(text, max_exact=None)
+
+
+@pytest.mark.parametrize("capacity", [8, 50, 500])
+def test_memory_capped_with_error_bounds(capacity: int) -> None:
+    stream = _adversarial_stream(20_000)
+    exact = Counter(stream)
+    summary = HeavyHitters(capacity).update(stream)
+    assert not summary.exact and len(summary) <= capacity
+    assert summary.total == len(stream)
+    assert summary.error <= len(stream) // (capacity + 1)
+    for term, true in exact.items():
+        low, high = summary.bounds(term)
+        assert low <= true <= high
+    # Terms above N / (capacity + 1) are always held; the ranking finds the heavy ones.
+    ranked = [t for t, _ in summary.ranked(4)]
+    if summary.error < 100:
+        assert ranked == ["python", "kafka", "docker", "go"]
+
+
+def test_merge_combines_summaries() -> None:
+    stream = _adversarial_stream(5_000, seed=1)
+    half = len(stream) // 2
+    merged = HeavyHitters(64).update(stream[:half]).merge(HeavyHitters(64).update(stream[half:]))
+    assert merged.total == len(stream) and len(merged) <= 64
+    assert merged.error <= len(stream) // 65
+    for term, true in Counter(stream).items():
+        low, high = merged.bounds(term)
+        assert low <= true <= high
+
+
+def test_extract_keywords_switches_to_summary_above_threshold() -> None:
+    text = " ".join(_adversarial_stream(3_000, seed=2))
+    exact = extract_keywords(text, top_n=4, max_exact=None)
+    bounded = extract_keywords(text, top_n=4, max_exact=100)
+    assert [t for t, _ in bounded] == [t for t, _ in exact] == ["python", "kafka", "docker", "go"]
+    assert all(c <= true for (_, c), (_, true) in zip(bounded, exact))
+    assert extract_keywords("", max_exact=100) == []
+    with pytest.raises(ValueError):
+        HeavyHitters(0)
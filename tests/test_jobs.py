@@ -0,0 +1,138 @@
+"""Tests for the job registry (api/jobs.py) and the /jobs endpoints."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.jobs import JobStore, VersionConflict, get_job_store
+from api.main import app
+from resume_analyzer.analyzer import analyze_and_summary, score_only
+
+JD = "Looking for a Python developer with Kubernetes, PostgreSQL and React experience."
+RESUME = "Python and Postgres developer; deployed services on k8s."
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> Iterator[JobStore]:
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture()
+def client(store: JobStore) -> Iterator[TestClient]:
+    app.dependency_overrides[get_job_store] = lambda: store
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_job_store, None)
+
+
+def test_store_round_trip_and_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    job = store.create(job_description=JD, keywords=["go"])
+    assert job.version == 1 and job.target_count > 0
+    store.close()
+    reopened = JobStore(path)
+    assert reopened.get(job.id) == job
+    assert reopened.get("missing") is None
+    reopened.close()
+
+
+def test_store_update_checks_expected_version(store: JobStore) -> None:
+    job = store.create(keywords=["python"])
+    updated = store.update(job.id, keywords=["rust"], expected_version=1)
+    assert updated is not None and updated.version == 2 and updated.keywords == ["rust"]
+    with pytest.raises(VersionConflict) as exc:
+        store.update(job.id, keywords=["go"], expected_version=1)
+    assert exc.value.current == 2
+    assert store.update("missing", keywords=["go"]) is None
+
+
+def test_compiled_targets_cached_per_version(store: JobStore) -> None:
+    job = store.create(keywords=["python", "developer"])
+    version, targets, compiled = store.targets(job.id)
+    assert version == 1 and targets == {"python", "developer"}
+    assert store.targets(job.id)[2] is compiled
+    assert store.targets(job.id, stem=True)[2] is not compiled
+    store.update(job.id, keywords=["rust"])
+    version, targets, recompiled = store.targets(job.id)
+    assert version == 2 and targets == {"rust"} and recompiled is not compiled
+
+
+def test_stored_stems_follow_stemmer_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    job = store.create(keywords=["deployments", "python"])
+    store.close()
+    with sqlite3.connect(path) as conn:  # what an older stemmer might have stored
+        conn.execute('UPDATE jobs SET stemmed_targets = \'{"stale": "stale"}\'')
+    store = JobStore(path)
+    assert store.targets(job.id, stem=True)[1] == {"stale"}  # same stemmer: stored set is used
+    store.close()
+
+    monkeypatch.setattr("api.jobs.STEMMER_VERSION", 99)
+    store = JobStore(path)
+    _, targets, compiled = store.targets(job.id, stem=True)
+    assert targets == {"deploy", "python"} and compiled.surface_forms["deploy"] == "deployments"
+    assert store.targets(job.id)[1] == {"deployments", "python"}
+    store.close()
+
+
+def test_create_get_and_analyze_match_inline_analysis(client: TestClient) -> None:
+    created = client.post("/jobs", json={"job_description": JD})
+    assert created.status_code == 201
+    job = created.json()
+    assert created.headers["etag"] == '"1"'
+    assert created.headers["location"] == f"/jobs/{job['id']}"
+    assert client.get(f"/jobs/{job['id']}").json() == job
+
+    for stem in (False, True):
+        response = client.post(
+            f"/jobs/{job['id']}/analyze", json={"resume_text": RESUME, "stem": stem}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"1"'
+        result, summary = analyze_and_summary(RESUME, job_description=JD, stem=stem)
+        assert response.json() == {"result": result.to_dict(), "readable_summary": summary}
+
+    fast = client.post(
+        f"/jobs/{job['id']}/analyze", json={"resume_text": RESUME, "score_only": True}
+    )
+    assert fast.json()["result"] == {"overall_score": score_only(RESUME, job_description=JD)}
+
+
+def test_if_match_and_if_none_match(client: TestClient) -> None:
+    job_id = client.post("/jobs", json={"keywords": ["python"]}).json()["id"]
+    assert client.get(f"/jobs/{job_id}", headers={"If-None-Match": '"1"'}).status_code == 304
+
+    stale = {"If-Match": '"0"'}
+    assert (
+        client.put(f"/jobs/{job_id}", json={"keywords": ["go"]}, headers=stale).status_code == 412
+    )
+    updated = client.put(f"/jobs/{job_id}", json={"keywords": ["go"]}, headers={"If-Match": '"1"'})
+    assert updated.status_code == 200
+    assert updated.headers["etag"] == '"2"' and updated.json()["version"] == 2
+
+    body = {"resume_text": "go developer"}
+    pinned = client.post(f"/jobs/{job_id}/analyze", json=body, headers={"If-Match": '"1"'})
+    assert pinned.status_code == 412
+    current = client.post(f"/jobs/{job_id}/analyze", json=body, headers={"If-Match": '"2"'})
+    assert current.json()["result"]["matched_keywords"] == ["go"]
+
+
+def test_errors(client: TestClient) -> None:
+    assert client.post("/jobs", json={}).status_code == 400
+    assert client.get("/jobs/missing").status_code == 404
+    assert client.put("/jobs/missing", json={"keywords": ["go"]}).status_code == 404
+    assert client.post("/jobs/missing/analyze", json={"resume_text": "x"}).status_code == 404
+    job_id = client.post("/jobs", json={"keywords": ["go"]}).json()["id"]
+    assert client.post(f"/jobs/{job_id}/analyze", json={"resume_text": "  "}).status_code == 422
+    assert client.delete(f"/jobs/{job_id}").status_code == 204
+    assert client.delete(f"/jobs/{job_id}").status_code == 404
@@ -0,0 +1,56 @@
+"""Tests for the in-process API load-test harness."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks.loadtest import (
+    LoadTestConfig,
+    compare_reports,
+    parse_mix,
+    percentile,
+    run_load_test,
+)
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_parse_mix() -> None:
+    assert parse_mix("analyze=8,health") == {"analyze": 8, "health": 1}
+    with pytest.raises(ValueError):
+        parse_mix("nope=1")
+
+
+def test_run_load_test_in_process() -> None:
+    config = LoadTestConfig(
+        concurrency=3,
+        requests=12,
+        mix={"analyze": 2, "analyze_file": 1, "health": 1},
+        resume_kb=[1],
+    )
+    report = asyncio.run(run_load_test(config))
+    assert report["total"]["requests"] == 12
+    assert report["total"]["errors"] == 0
+    for stats in report["endpoints"].values():
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert set(report["endpoints"]) <= {
+        "GET /health",
+        "POST /analyze 1KB",
+        "POST /analyze/file 1KB",
+    }
+
+
+def test_compare_reports_flags_regressions() -> None:
+    base = {"endpoints": {"GET /health": {"p95_ms": 10.0, "throughput_rps": 100.0}}}
+    same = {"endpoints": {"GET /health": {"p95_ms": 11.0, "throughput_rps": 95.0}}}
+    worse = {"endpoints": {"GET /health": {"p95_ms": 20.0, "throughput_rps": 50.0}}}
+    assert compare_reports(same, base) == []
+    assert len(compare_reports(worse, base)) == 2
@@ -0,0 +1,106 @@
+"""Tests for offline synonym mining and loading mined synonym files."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from benchmarks.bench_mining import PLANTED, write_corpus
+from resume_analyzer.cli import app
+from resume_analyzer.mining import count_terms, mine_synonyms, plan_shards, propose_pairs
+from resume_analyzer.synonyms import load_synonym_file, merge_synonyms
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_propose_pairs_rules() -> None:
+    counts = Counter(
+        {
+            "ci-cd": 20,
+            "cicd": 10,
+            "quality": 30,
+            "assurance": 20,
+            "quality assurance": 20,
+            "qa": 15,
+            "internationalization": 10,
+            "i18n": 10,
+            "github ci-cd": 8,
+            "github cicd": 8,
+            "caching": 500,
+            "designed": 500,
+            "caching designed": 10,  # frequent words, not a collocation
+            "cd": 40,
+            "kubernetes": 10,
+            "k8s": 10,  # already in SYNONYM_MAP
+            "rare": 1,
+            "r2e": 1,
+        }
+    )
+    pairs = propose_pairs(counts, min_count=5, tokens=10_000)
+    assert pairs == {
+        ("ci-cd", "cicd"): "punctuation",
+        ("quality assurance", "qa"): "abbreviation",
+        ("internationalization", "i18n"): "numeronym",
+    }
+
+
+def test_count_terms_prunes_to_max_terms(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.jsonl"
+    records = [{"resume_text": " ".join(f"w{i}x{j}" for j in range(50))} for i in range(20)]
+    path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+    (shard,) = plan_shards([path])
+    docs, tokens, counts = count_terms(shard, max_terms=100)
+    assert (docs, tokens) == (20, 1000)
+    assert len(counts) <= 100
+
+
+def test_mine_planted_variants_in_parallel(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.jsonl"
+    write_corpus(path, documents=300, size=200)
+    report = mine_synonyms([path], workers=2, shard_bytes=4096)
+    assert report["stats"]["documents"] == 300
+    assert report["stats"]["shards"] > 2
+    found = {(c["canonical"], c["variant"]) for c in report["candidates"]}
+    assert {(c, v) for c, v, _ in PLANTED} <= found
+    assert all(c["accept"] is False for c in report["candidates"])
+    serial = mine_synonyms([path], workers=1, shard_bytes=4096)
+    assert serial["candidates"] == report["candidates"]
+
+
+def test_mined_file_loads_into_synonym_tables(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.jsonl"
+    write_corpus(path, documents=200, size=200)
+    out = tmp_path / "candidates.json"
+    result = CliRunner().invoke(app, ["mine-synonyms", str(path), "-o", str(out)])
+    assert result.exit_code == 0, result.output
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert load_synonym_file(out) == {}  # nothing accepted yet
+    for row in data["candidates"]:
+        row["accept"] = row["variant"] == "cicd" or row["canonical"] == "cicd"
+    out.write_text(json.dumps(data), encoding="utf-8")
+    assert load_synonym_file(out) == {"ci-cd": {"ci-cd", "cicd"}}
+
+    code = (
+        "from resume_analyzer.synonyms import all_canonical_forms; "
+        "print(sorted(all_canonical_forms('cicd')))"
+    )
+    env = {"SYNONYMS_FILE": str(out), "PATH": ""}
+    shown = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    assert shown.stdout.strip() == "['ci-cd', 'cicd']"
+
+
+def test_merge_synonyms_joins_existing_groups() -> None:
+    base = {"kubernetes": {"kubernetes", "k8s"}}
+    merged = merge_synonyms(base, {"k8s": {"kube"}, "qa": {"quality assurance"}})
+    assert merged == {
+        "kubernetes": {"kubernetes", "k8s", "kube"},
+        "qa": {"qa", "quality assurance"},
+    }
+    assert base == {"kubernetes": {"kubernetes", "k8s"}}
@@ -0,0 +1,72 @@
+"""Tests for parallel tokenization of a single large document: identical to serial output."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from typer.testing import CliRunner
+
+from benchmarks.common import synthetic_resume
+from resume_analyzer.analyzer import analyze_text
+from resume_analyzer.cli import app
+from resume_analyzer.extract import count_keywords
+from resume_analyzer.normalize import tokenize
+from resume_analyzer.parallel import (
+    count_keywords_parallel,
+    split_at_whitespace,
+    tokenize_parallel,
+)
+
+TRICKY = (
+    "Senior NodeJS/Node.js dev; C++, C#, .NET and Python3.\tMySQL NoSQL "
+    "ci-cd e-commerce k8s i18n React.js... İstanbul ΣΟΦΟΣ developed developers -x- "
+)
+TEXT = TRICKY * 20 + synthetic_resume(5_000, seed=3)
+
+
+@pytest.mark.parametrize("segment_chars", [1, 7, 50, 1_000, 10**9])
+def test_split_cuts_only_at_whitespace(segment_chars: int) -> None:
+    segments = split_at_whitespace(TEXT, segment_chars)
+    assert "".join(segments) == TEXT
+    assert all(s[:1].isspace() for s in segments[1:])
+    assert all(len(s) >= segment_chars for s in segments[:-1])
+
+
+@pytest.mark.parametrize("segment_chars", [1, 13, 97, 4_096])
+def test_segments_tokenize_like_the_whole_text(segment_chars: int) -> None:
+    with ThreadPoolExecutor(4) as pool:
+        tokens = tokenize_parallel(TEXT, segment_chars=segment_chars, executor=pool)
+        assert tokens == tokenize(TEXT)
+        for stem in (False, True):
+            counts = count_keywords_parallel(
+                TEXT, stem=stem, segment_chars=segment_chars, executor=pool
+            )
+            expected = count_keywords(TEXT, stem=stem)
+            assert counts == expected
+            assert list(counts) == list(expected)  # first-occurrence order too
+
+
+def test_process_pool_matches_serial() -> None:
+    assert tokenize_parallel(TEXT, workers=2, segment_chars=2_000) == tokenize(TEXT)
+    assert count_keywords_parallel(TEXT, workers=2, segment_chars=2_000) == count_keywords(TEXT)
+    assert tokenize_parallel("", workers=2) == []
+    assert count_keywords_parallel("python", workers=2) == count_keywords("python")
+
+
+def test_analyze_with_workers_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("resume_analyzer.parallel.MIN_SEGMENT_CHARS", 1_000)
+    jd = synthetic_resume(6_000, seed=9)
+    serial = analyze_text(TEXT, job_description=jd, fuzzy=True)
+    assert analyze_text(TEXT, job_description=jd, fuzzy=True, workers=2) == serial
+
+
+def test_cli_workers_option(tmp_path) -> None:
+    resume = tmp_path / "resume.txt"
+    resume.write_text(TEXT, encoding="utf-8")
+    args = ["analyze", "-r", str(resume), "-k", "python,kafka,c++", "-f", "json"]
+    serial = CliRunner().invoke(app, args)
+    parallel = CliRunner().invoke(app, [*args, "--workers", "2"])
+    assert parallel.exit_code == 0, parallel.output
+    assert parallel.stdout == serial.stdout
+    assert CliRunner().invoke(app, [*args, "--workers", "0"]).exit_code == 1
@@ -0,0 +1,129 @@
+"""Tests for warm-up, the readiness endpoint and the prefork launcher."""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main
+import api.prefork
+from api.main import app
+from api.prefork import PreforkServer, describe_exit, process_memory, respawn_delay
+from benchmarks.loadtest import _free_port
+
+HAS_PROC = Path("/proc/self/status").exists()
+
+
+def test_ready_reports_503_until_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api.main, "_ready", threading.Event())
+    client = TestClient(app)  # no lifespan: warm-up has not run
+    assert client.get("/ready").status_code == 503
+    assert client.get("/health").json() == {"status": "ok"}
+    with TestClient(app) as started:
+        assert started.get("/ready").json() == {"status": "ready"}
+
+
+def test_warm_up_is_idempotent() -> None:
+    api.main.warm_up()
+    api.main.warm_up()
+    assert api.main._ready.is_set()
+
+
+def test_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        PreforkServer(0)
+
+
+def test_respawn_delay_doubles_up_to_the_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("api.prefork.RESPAWN_BACKOFF", 0.5)
+    monkeypatch.setattr("api.prefork.MAX_RESPAWN_BACKOFF", 3.0)
+    assert [respawn_delay(n) for n in range(6)] == [0.0, 0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_describe_exit_decodes_wait_status() -> None:
+    pid = os.fork()
+    if pid == 0:
+        os._exit(3)
+    assert describe_exit(os.waitpid(pid, 0)[1]) == "exit code 3"
+    pid = os.fork()
+    if pid == 0:
+        os.kill(os.getpid(), signal.SIGKILL)
+    assert describe_exit(os.waitpid(pid, 0)[1]) == f"killed by signal {int(signal.SIGKILL)}"
+
+
+class _CrashingServer(PreforkServer):
+    def preload(self) -> None:
+        pass
+
+    def _run_worker(self) -> None:
+        os._exit(3)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_crash_looping_workers_back_off_then_exit_nonzero(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr("api.prefork.RESPAWN_BACKOFF", 0.01)
+    monkeypatch.setattr("api.prefork.MAX_RAPID_FAILURES", 4)
+    delays: list[float] = []
+    real_delay = api.prefork.respawn_delay
+    monkeypatch.setattr(
+        "api.prefork.respawn_delay", lambda n: delays.append(real_delay(n)) or real_delay(n)
+    )
+    spawned: list[int] = []
+    server = _CrashingServer(1, host="127.0.0.1", port=0)
+    real_spawn = server.spawn
+    monkeypatch.setattr(server, "spawn", lambda: spawned.append(real_spawn()) or spawned[-1])
+    handlers = {
+        sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1)
+    }
+    try:
+        assert server.run() == 1
+    finally:
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+    assert delays == [0.01, 0.02, 0.04] and len(spawned) == 4 and not server.pids
+    assert "exited (exit code 3); restarting" in caplog.text
+
+
+@pytest.mark.skipif(not HAS_PROC, reason="needs /proc")
+def test_process_memory_reads_proc() -> None:
+    mem = process_memory(os.getpid())
+    assert mem is not None and mem["rss_kb"] > 0
+    assert process_memory(2**22 + 12345) is None
+
+
+@pytest.mark.skipif(not HAS_PROC or not hasattr(os, "fork"), reason="needs fork and /proc")
+def test_launcher_serves_from_forked_workers() -> None:
+    port = _free_port()
+    cmd = [sys.executable, "-m", "api.prefork", "--workers", "2", "--port", str(port)]
+    cmd += ["--host", "127.0.0.1", "--log-level", "warning"]
+    proc = subprocess.Popen(cmd, cwd=Path(__file__).resolve().parent.parent)
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/ready").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            assert time.monotonic() < deadline, "launcher did not become ready"
+            time.sleep(0.05)
+        body = {"resume_text": "Python and SQL", "keywords": ["python"], "score_only": True}
+        resp = httpx.post(f"http://127.0.0.1:{port}/analyze", json=body)
+        assert resp.json()["result"] == {"overall_score": 100.0}
+        children = Path(f"/proc/{proc.pid}/task/{proc.pid}/children").read_text().split()
+        assert len(children) == 2
+    finally:
+        proc.terminate()
+        assert proc.wait(timeout=30) == 0
@@ -0,0 +1,153 @@
+"""Tests for size-aware scheduling lanes and GET /metrics/lanes."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main
+from api.main import app
+from api.scheduling import (
+    DEFAULT_LARGE_REQUEST_COST,
+    KEYWORD_COST,
+    LaneConfig,
+    Scheduler,
+    default_lanes,
+    estimate_cost,
+)
+
+
+def _scheduler(small_limit: int = 2, large_limit: int = 1) -> Scheduler:
+    return Scheduler(
+        [LaneConfig("large", math.inf, large_limit), LaneConfig("small", 1_000, small_limit)]
+    )
+
+
+def test_estimate_cost_weights_keywords() -> None:
+    assert estimate_cost(100, 50) == 150
+    assert estimate_cost(100, 0, keyword_count=2) == 100 + 2 * KEYWORD_COST
+
+
+def test_routes_by_cost_to_first_covering_lane() -> None:
+    scheduler = _scheduler()
+    assert [lane.config.name for lane in scheduler.lanes] == ["small", "large"]
+    assert scheduler.lane_for(0).config.name == "small"
+    assert scheduler.lane_for(1_000).config.name == "small"
+    assert scheduler.lane_for(1_001).config.name == "large"
+
+
+def test_last_lane_must_be_unbounded() -> None:
+    with pytest.raises(ValueError):
+        Scheduler([LaneConfig("small", 1_000, 1)])
+
+
+def test_default_lanes_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    small, large = default_lanes()
+    assert small.max_cost == DEFAULT_LARGE_REQUEST_COST
+    monkeypatch.setenv("LARGE_REQUEST_COST", "10")
+    monkeypatch.setenv("LARGE_LANE_LIMIT", "3")
+    small, large = default_lanes()
+    assert (small.max_cost, large.limit) == (10, 3)
+
+
+def test_busy_large_lane_does_not_block_small_requests() -> None:
+    scheduler = _scheduler(large_limit=1)
+    release = threading.Event()
+    order: list[str] = []
+
+    def large() -> str:
+        release.wait(5)
+        order.append("large")
+        return "large"
+
+    def small() -> str:
+        order.append("small")
+        release.set()
+        return "small"
+
+    async def main() -> None:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(scheduler.run, 10_000, large)
+            tg.start_soon(scheduler.run, 10_000, large)  # queues behind the first
+            await anyio.sleep(0.05)
+            assert scheduler.stats()["large"]["waiting"] == 1
+            assert await scheduler.run(10, small) == "small"
+
+    anyio.run(main)
+    assert order[0] == "small"
+    stats = scheduler.stats()
+    assert stats["large"]["completed"] == 2
+    assert stats["large"]["queue_ms_max"] > 0
+    assert stats["small"]["completed"] == 1
+    assert stats["large"]["in_flight"] == stats["large"]["waiting"] == 0
+
+
+def test_failed_work_releases_its_slot() -> None:
+    scheduler = _scheduler(small_limit=1)
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    async def main() -> None:
+        with pytest.raises(RuntimeError):
+            await scheduler.run(1, fail)
+        assert await scheduler.run(1, lambda: 42) == 42
+
+    anyio.run(main)
+    assert scheduler.stats()["small"]["in_flight"] == 0
+
+
+def test_endpoints_record_lane_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api.main, "scheduler", _scheduler())
+    client = TestClient(app)
+    body = {"resume_text": "python developer", "keywords": ["python"]}
+    assert client.post("/analyze", json=body).status_code == 200
+    big = {**body, "resume_text": "python " * 500}
+    assert client.post("/analyze", json=big).status_code == 200
+    files = {"resume": ("cv.txt", b"python developer", "text/plain")}
+    response = client.post("/analyze/file", files=files, data={"keywords": ["python"]})
+    assert response.status_code == 200
+    stats = client.get("/metrics/lanes").json()
+    assert stats["small"]["completed"] == 2
+    assert stats["large"]["completed"] == 1
+    assert stats["large"]["max_cost"] == "inf"
+    assert {"queue_ms_mean", "queue_ms_p50", "queue_ms_p95"} <= stats["small"].keys()
+
+
+def test_batch_items_run_concurrently_in_their_own_lanes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api.main, "scheduler", _scheduler(small_limit=2, large_limit=1))
+    client = TestClient(app)
+    small = {"resume_text": "python developer", "keywords": ["python"]}
+    big = {**small, "resume_text": "python " * 500, "keywords": ["go"]}
+    response = client.post("/analyze/batch", json={"items": [big, small, {}, small]})
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 200, 422, 200]
+    assert results[0]["result"]["missing_keywords"] == ["go"]
+    assert results[1] == results[3] and results[1]["result"]["matched_keywords"] == ["python"]
+    stats = client.get("/metrics/lanes").json()
+    assert (stats["small"]["completed"], stats["large"]["completed"]) == (2, 1)
+
+    peak = in_flight = 0
+    lock = threading.Lock()
+    analyze_body = api.main._analyze_body
+
+    def tracked(body: api.main.AnalyzeRequest) -> api.main.AnalyzeResponse:
+        nonlocal peak, in_flight
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            time.sleep(0.05)
+            return analyze_body(body)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(api.main, "_analyze_body", tracked)
+    assert client.post("/analyze/batch", json={"items": [small] * 4}).status_code == 200
+    assert peak == 2  # the small lane's limit, not one item at a time
@@ -0,0 +1,89 @@
+"""Tests for the score-only fast path: same score as analyze(), early termination."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+from typer.testing import CliRunner
+
+from api.main import app as api_app
+from resume_analyzer.analyzer import analyze, score_only, score_only_fragments, score_tokens
+from resume_analyzer.cli import app
+from resume_analyzer.match import CompiledTargets
+from resume_analyzer.normalize import SPECIAL_TOKENS
+from resume_analyzer.synonyms import SYNONYM_MAP
+
+WORDS = (
+    list(SPECIAL_TOKENS)
+    + [v for variants in SYNONYM_MAP.values() for v in variants]
+    + "developed developers kubernets postgress pipelines led reach python3 nodejs teams".split()
+)
+
+
+@pytest.mark.parametrize("fuzzy", [False, True])
+@pytest.mark.parametrize("stem", [False, True])
+def test_score_only_equals_full_score(fuzzy: bool, stem: bool) -> None:
+    rng = random.Random(7)
+    for _ in range(300):
+        resume = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40)))
+        keywords = [rng.choice(WORDS) for _ in range(rng.randint(0, 8))]
+        jd = (
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 10)))
+            if rng.random() < 0.5
+            else None
+        )
+        expected = analyze(
+            resume, job_description=jd, keywords=keywords, fuzzy=fuzzy, stem=stem
+        ).overall_score
+        assert (
+            score_only(resume, job_description=jd, keywords=keywords, fuzzy=fuzzy, stem=stem)
+            == expected
+        )
+
+
+def test_stops_reading_once_every_target_matched() -> None:
+    consumed: list[str] = []
+
+    def tokens():
+        for t in ["python", "js", "sql", "docker", "never", "reached"]:
+            consumed.append(t)
+            yield t
+
+    targets = CompiledTargets({"python", "node.js", "sql"})
+    assert score_tokens(tokens(), targets) == 100.0
+    assert consumed == ["python", "js", "sql"]
+
+
+def test_fragments_path_matches_text_path() -> None:
+    text = "Python and Docker on AWS; SQL reporting."
+    kwargs = {"keywords": ["python", "docker", "kafka"]}
+    assert score_only_fragments([text[:9], text[9:]], **kwargs) == score_only(text, **kwargs)
+
+
+def test_api_score_only() -> None:
+    body = {
+        "resume_text": "Python and SQL",
+        "keywords": ["python", "sql", "kafka", "docker"],
+        "score_only": True,
+    }
+    data = TestClient(api_app).post("/analyze", json=body).json()
+    assert data == {"result": {"overall_score": 50.0}, "readable_summary": None}
+
+
+def test_cli_score_only(tmp_path) -> None:
+    resume = tmp_path / "r.txt"
+    resume.write_text("Python and SQL", encoding="utf-8")
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["analyze", "-r", str(resume), "-k", "python,sql,kafka,docker", "--score-only"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "50.0"
+    result = runner.invoke(
+        app, ["batch", str(resume), "-k", "python,sql,kafka,docker", "--score-only"]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["result"] == {"overall_score": 50.0}
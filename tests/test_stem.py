@@ -0,0 +1,122 @@
+"""Tests for the memoized stemming stage."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from resume_analyzer.analyzer import analyze
+from resume_analyzer.cache import TokenCache, tokenizer_fingerprint
+from resume_analyzer.extract import (
+    count_keywords,
+    count_keywords_compact,
+    count_keywords_from_fragments,
+)
+from resume_analyzer.stem import clear_stem_cache, stem, stem_cache_info
+
+
+@pytest.mark.parametrize(
+    "words, base",
+    [
+        (
+            ("develop", "developed", "developing", "developer", "developers", "development"),
+            "develop",
+        ),
+        (("microservice", "microservices"), "microservic"),
+        (("manage", "managed", "managing", "management"), "manag"),
+        (("technology", "technologies"), "technology"),
+        (("map", "mapped", "mapping"), "map"),
+        (("test", "tests", "tested", "testing"), "test"),
+    ],
+)
+def test_inflections_share_a_stem(words: tuple[str, ...], base: str) -> None:
+    assert {stem(w) for w in words} == {base}
+
+
+def test_exceptions_and_non_plurals() -> None:
+    assert stem("built") == "build"
+    assert stem("analyses") == stem("analysis") == "analysis"
+    assert stem("status") == "status"
+    assert stem("process") == "process"
+    assert stem("spring") == stem("springs") == "spring"  # "spr" has no vowel
+
+
+def test_one_suffix_is_stripped_per_word() -> None:
+    assert {stem(w) for w in ("engineer", "engineers", "engineering", "engineered")} == {"engineer"}
+    assert stem("engine") == "engin" and stem("career") == "career"
+    result = analyze("Managed engine tuning", keywords=["engineer"], stem=True)
+    assert result.overall_score == 0.0 and result.missing_keywords == ["engineer"]
+
+
+def test_tech_terms_are_not_stemmed() -> None:
+    for term in (
+        "kubernetes",
+        "postgres",
+        "reactjs",
+        "docker",
+        "node.js",
+        "c++",
+        "k8s",
+        "aws",
+        "js",
+    ):
+        assert stem(term) == term
+
+
+def test_stem_is_memoized() -> None:
+    clear_stem_cache()
+    stem("deployments")
+    stem("deployments")
+    info = stem_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+    assert info["hit_rate"] == 0.5
+    assert info["maxsize"] > 0
+
+
+def test_counting_paths_agree_when_stemming() -> None:
+    text = "Developed and deployed microservices. Developing microservice deployments."
+    counts = count_keywords(text, stem=True)
+    assert counts["develop"] == 2 and counts["microservic"] == 2 and counts["deploy"] == 2
+    assert dict(count_keywords_compact(text, stem=True)) == dict(counts)
+    assert count_keywords_from_fragments([text[:20], text[20:]], stem=True) == counts
+
+
+def test_analyze_matches_inflected_targets() -> None:
+    resume = "Developed microservices and managed deployments."
+    jd = "Developer with microservice development and deployment management."
+    assert analyze(resume, job_description=jd).overall_score == 0.0
+    result = analyze(resume, job_description=jd, stem=True)
+    # Targets show the job description's words, resume keywords the resume's.
+    assert result.matched_keywords == ["deployment", "developer", "management", "microservice"]
+    assert [k.term for k in result.top_keywords] == [
+        "deployments",
+        "developed",
+        "managed",
+        "microservices",
+    ]
+    assert result.overall_score == 100.0
+
+
+def test_synonyms_still_match_when_stemming() -> None:
+    result = analyze(
+        "Python3 and Node.js services on Postgres",
+        keywords=["python", "javascript", "postgresql"],
+        stem=True,
+    )
+    assert result.missing_keywords == []
+
+
+def test_cache_fingerprint_depends_on_stem(tmp_path) -> None:
+    assert tokenizer_fingerprint(stem=True) != tokenizer_fingerprint()
+    cache = TokenCache(tmp_path, stem=True)
+    entry = cache.load_or_tokenize("Developers developing developing")
+    assert entry.counts == {"develop": 3} and entry.surface == {"develop": "developing"}
+    assert cache.load_or_tokenize("Developers developing developing") == entry
+
+
+def test_api_stem_flag() -> None:
+    body = {"resume_text": "Managed teams", "keywords": ["management"], "stem": True}
+    data = TestClient(app).post("/analyze", json=body).json()
+    assert data["result"]["matched_keywords"] == ["management"]
+    assert data["result"]["top_keywords"][0]["term"] == "managed"
@@ -0,0 +1,228 @@
+"""Tests for versioned, hot-swappable tokenizer and synonym tables (resume_analyzer/tables.py)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.jobs import JobStore
+from api.main import app
+from resume_analyzer.analyzer import analyze_text
+from resume_analyzer.cache import tokenizer_fingerprint
+from resume_analyzer.fuzzy import known_vocabulary_index
+from resume_analyzer.normalize import SPECIAL_TOKENS, STOPWORDS, tokenize
+from resume_analyzer.stem import stem, stem_tokens
+from resume_analyzer.synonyms import SYNONYM_MAP, all_canonical_forms
+from resume_analyzer.tables import (
+    TablesWatcher,
+    compile_tables,
+    current_tables,
+    default_tables,
+    load_tables_file,
+    pin_tables,
+    reset_tables,
+    swap_tables,
+    tables_from_data,
+)
+
+TEXT = "ASP.NET and Golang developer; Go, Rails"
+NEW = {
+    "special_tokens": ["asp.net", "rails", *SPECIAL_TOKENS],
+    "synonyms": {**{k: sorted(v) for k, v in SYNONYM_MAP.items()}, "golang": ["go"]},
+}
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def _builtin_tables() -> Iterator[None]:
+    reset_tables()
+    yield
+    reset_tables()
+
+
+def test_compile_validates_and_hashes_contents() -> None:
+    base = default_tables()
+    same = compile_tables(SPECIAL_TOKENS, STOPWORDS, SYNONYM_MAP, source="copy")
+    assert same.digest == base.digest and same is not base
+    with pytest.raises(ValueError, match="whitespace"):
+        compile_tables(["ruby on rails"], STOPWORDS, SYNONYM_MAP)
+    with pytest.raises(ValueError):
+        compile_tables("c++", STOPWORDS, SYNONYM_MAP)
+    with pytest.raises(ValueError):
+        tables_from_data({"synonyms": {"go": "golang"}}, "test")
+    with pytest.raises(ValueError, match="unknown"):
+        tables_from_data({"stop_words": []}, "test")
+
+
+def test_swap_changes_tokenizing_matching_and_caches() -> None:
+    before = tokenize(TEXT)
+    assert before == ["asp", ".net", "golang", "developer", "go", "rails"]
+    assert stem("rails") == "rail"
+    fingerprint = tokenizer_fingerprint()
+    old_index = known_vocabulary_index()
+
+    installed = swap_tables(tables_from_data(NEW, "test"))
+    assert installed.version == default_tables().version + 1
+    assert current_tables() is installed
+    assert tokenize(TEXT) == ["asp.net", "golang", "developer", "go", "rails"]
+    assert "go" in all_canonical_forms("golang")
+    assert stem("rails") == "rails"  # now a special token
+    assert tokenizer_fingerprint() != fingerprint
+    assert "asp.net" in known_vocabulary_index() and known_vocabulary_index() is not old_index
+    result = analyze_text("Go developer", keywords=["golang"])
+    assert result.matched_keywords == ("golang",)
+
+    assert swap_tables(tables_from_data(NEW, "again")) is installed  # same contents: no-op
+    restored = reset_tables()
+    assert restored.version == installed.version + 1
+    assert tokenize(TEXT) == before and tokenizer_fingerprint() == fingerprint
+
+
+def test_pinned_snapshot_survives_swap() -> None:
+    with pin_tables() as pinned:
+        swap_tables(tables_from_data(NEW, "test"))
+        assert current_tables() is pinned
+        assert tokenize(TEXT)[:2] == ["asp", ".net"]
+        assert stem("rails") == "rail"  # stems follow the pinned snapshot, before and after
+    assert tokenize(TEXT)[0] == "asp.net"
+    assert stem("rails") == "rails"
+    with pin_tables(pinned):
+        assert list(stem_tokens(["rails"])) == ["rail"]
+
+
+def test_watcher_reloads_changed_file_and_keeps_tables_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "tables.json"
+    path.write_text(json.dumps(NEW), encoding="utf-8")
+    watcher = TablesWatcher(path, interval=0.01)
+    installed = watcher.check()
+    assert installed is current_tables() and installed.source == str(path)
+    assert watcher.check() is None  # unchanged
+
+    path.write_text("{not json", encoding="utf-8")
+    assert watcher.check() is None
+    assert watcher.last_error and current_tables() is installed
+
+    watcher.start()
+    try:
+        path.write_text(json.dumps({"stopwords": ["developer"]}), encoding="utf-8")
+        deadline = time.monotonic() + 5
+        while current_tables() is installed and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+    assert watcher.last_error is None
+    assert "developer" not in tokenize(TEXT) and "asp" in tokenize(TEXT)
+
+
+def test_job_targets_follow_tables_version(tmp_path: Path) -> None:
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    job = store.create(job_description="ASP.NET developer", keywords=["golang"])
+    _, targets, compiled = store.targets(job.id)
+    assert {"asp", ".net", "golang"} <= targets
+    swap_tables(tables_from_data(NEW, "test"))
+    version, targets, recompiled = store.targets(job.id)
+    assert version == 1 and "asp.net" in targets and "asp" not in targets
+    assert recompiled is not compiled and recompiled.tables_version == current_tables().version
+    assert store.targets(job.id)[2] is recompiled
+    store.close()
+
+
+def test_store_migrates_databases_without_tables_column(tmp_path: Path) -> None:
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, version INTEGER NOT NULL, spec TEXT NOT NULL,"
+        " targets TEXT NOT NULL, stemmed_targets TEXT NOT NULL, created_at REAL NOT NULL,"
+        " updated_at REAL NOT NULL)"
+    )
+    spec = {"job_description": None, "role_title": None, "keywords": ["python"]}
+    conn.execute(
+        "INSERT INTO jobs VALUES ('a', 3, ?, '[\"stale\"]', '[]', 0, 0)", (json.dumps(spec),)
+    )
+    conn.commit()
+    conn.close()
+    store = JobStore(path)
+    assert store.targets("a")[:2] == (3, frozenset({"python"}))  # re-tokenized from the spec
+    assert store.targets("a", stem=True)[1] == {"python"}
+    store.close()
+
+
+def test_admin_endpoints(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(app)
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    monkeypatch.delenv("TABLES_FILE", raising=False)
+    assert client.get("/admin/tables").status_code == 403
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert client.get("/admin/tables", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+    info = client.get("/admin/tables", headers=ADMIN).json()
+    assert info["digest"] == default_tables().digest and info["watching"] is None
+    bad = client.put("/admin/tables", json={"special_tokens": ["a b"]}, headers=ADMIN)
+    assert bad.status_code == 422
+
+    body = {"resume_text": "Go developer", "keywords": ["golang"]}
+    before = client.post("/analyze", json=body)
+    assert before.json()["result"]["missing_keywords"] == ["golang"]
+    updated = client.put("/admin/tables", json=NEW, headers=ADMIN).json()
+    assert updated["version"] == int(before.headers["x-tables-version"]) + 1
+    assert updated["written_to"] is None  # no TABLES_FILE: this process only
+    after = client.post("/analyze", json=body)
+    assert after.headers["x-tables-version"] == str(updated["version"])
+    assert (
+        after.headers["x-tables-digest"] == updated["digest"] != before.headers["x-tables-digest"]
+    )
+    assert after.json()["result"]["matched_keywords"] == ["golang"]
+    reset = client.delete("/admin/tables", headers=ADMIN).json()
+    assert reset["digest"] == default_tables().digest
+
+
+def test_requests_in_flight_finish_on_their_snapshot() -> None:
+    started, release = threading.Event(), threading.Event()
+    seen: list[int] = []
+
+    def slow_request() -> None:
+        with pin_tables() as tables:
+            started.set()
+            release.wait(5)
+            seen.append(current_tables().version)
+            seen.append(tables.version)
+
+    worker = threading.Thread(target=slow_request)
+    worker.start()
+    started.wait(5)
+    installed = swap_tables(tables_from_data(NEW, "test"))
+    release.set()
+    worker.join()
+    assert seen == [installed.version - 1] * 2
+
+
+def test_lifespan_loads_and_watches_tables_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "tables.json"
+    path.write_text(json.dumps(NEW), encoding="utf-8")
+    monkeypatch.setenv("TABLES_FILE", str(path))
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    with TestClient(app) as client:
+        info = client.get("/admin/tables", headers=ADMIN).json()
+        assert info["watching"] == str(path) and info["source"] == str(path)
+        response = client.post("/analyze", json={"resume_text": TEXT, "keywords": ["asp.net"]})
+        assert response.json()["result"]["matched_keywords"] == ["asp.net"]
+
+        # Admin updates go to the shared file, which every worker's watcher loads.
+        update = {"stopwords": ["developer"]}
+        updated = client.put("/admin/tables", json=update, headers=ADMIN).json()
+        assert updated["written_to"] == str(path)
+        assert updated["digest"] == tables_from_data(update, "x").digest
+        assert load_tables_file(path).digest == updated["digest"]
+        response = client.post("/analyze", json={"resume_text": TEXT, "keywords": ["go"]})
+        assert response.headers["x-tables-digest"] == updated["digest"]
+        reset = client.delete("/admin/tables", headers=ADMIN).json()
+        assert reset["digest"] == load_tables_file(path).digest == default_tables().digest
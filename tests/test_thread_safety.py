@@ -0,0 +1,53 @@
+"""Concurrency tests: shared tables are immutable and concurrent analyze() is deterministic."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from resume_analyzer.analyzer import analyze
+from resume_analyzer.cache import TokenCache
+from resume_analyzer.synonyms import _TERM_TO_CANONICAL, SYNONYM_MAP, all_canonical_forms
+
+JD = (Path(__file__).parent.parent / "examples" / "sample_jd.txt").read_text(encoding="utf-8")
+WORDS = (
+    "python c++ node.js .net sql nosql k8s kubernetes js react postgres docker go rust api".split()
+)
+
+
+def _resume(i: int) -> str:
+    return " ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(40 + i % 13))
+
+
+def test_tables_are_read_only() -> None:
+    with pytest.raises(TypeError):
+        SYNONYM_MAP["go"] = frozenset({"golang"})  # type: ignore[index]
+    with pytest.raises(TypeError):
+        _TERM_TO_CANONICAL["golang"] = "go"  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        SYNONYM_MAP["python"].add("py")  # type: ignore[attr-defined]
+    forms = all_canonical_forms("python")
+    forms.add("py")  # callers get a private copy
+    assert "py" not in all_canonical_forms("python")
+
+
+def test_concurrent_analyze_matches_single_threaded() -> None:
+    resumes = [_resume(i) for i in range(64)]
+    expected = [analyze(r, job_description=JD, keywords=["go", "rust"]) for r in resumes]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            got = list(
+                pool.map(lambda r: analyze(r, job_description=JD, keywords=["go", "rust"]), resumes)
+            )
+            assert got == expected
+
+
+def test_shared_token_cache_counts_all_lookups(tmp_path: Path) -> None:
+    cache = TokenCache(tmp_path)
+    resumes = [_resume(i % 8) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(cache.load_or_tokenize, resumes))
+    assert cache.hits + cache.misses == 200
+    assert cache.misses >= 8
@@ -0,0 +1,69 @@
+"""Tests for the integer token-ID pipeline (interned vocabulary, array-backed counts)."""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+import pytest
+
+from resume_analyzer.analyzer import analyze
+from resume_analyzer.extract import count_keywords, count_keywords_compact, rank_keywords
+from resume_analyzer.vocab import HAS_NUMPY, Vocabulary, count_ids
+
+TEXT = "Python python API api api C++ Node.js nodejs SQL NoSQL docker docker backend"
+
+
+def _random_text(seed: int, n: int = 3000) -> str:
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(300)] + ["python", "c++", ".net", "sql"]
+    return " ".join(rng.choice(words) for _ in range(n))
+
+
+def test_vocabulary_interns_terms() -> None:
+    vocab = Vocabulary(["python", "sql"])
+    assert vocab.id_for("python") == 0
+    assert vocab.id_for("go") == 2
+    assert vocab.get("rust") is None
+    assert vocab.term(1) == "sql"
+    assert list(vocab.encode(["sql", "go", "sql"])) == [1, 2, 1]
+
+
+def test_compact_counts_is_a_counter_mapping() -> None:
+    compact = count_keywords_compact(TEXT, Vocabulary())
+    assert dict(compact) == dict(count_keywords(TEXT))
+    assert compact["api"] == 3
+    with pytest.raises(KeyError):
+        compact["missing"]
+
+
+def test_default_vocabulary_is_per_call_and_fallback_counts_sparse_ids() -> None:
+    first, second = count_keywords_compact(TEXT), count_keywords_compact("Rust and Go")
+    assert first.vocab is not second.vocab and len(second.vocab) == len(second) == 2
+
+    vocab = Vocabulary(f"t{i}" for i in range(100_000))
+    compact = count_ids(array("I", [99_999, 5, 99_999]), vocab, use_numpy=False)
+    assert list(compact.ids) == [5, 99_999] and dict(compact) == {"t5": 1, "t99999": 2}
+
+
+NUMPY = pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed"))
+
+
+@pytest.mark.parametrize("use_numpy", [False, NUMPY])
+@pytest.mark.parametrize("top_n", [1, 5, 30, 1000])
+def test_ranked_matches_full_sort(use_numpy: bool, top_n: int) -> None:
+    vocab = Vocabulary()
+    for seed in range(5):
+        text = _random_text(seed)
+        compact = count_ids(
+            vocab.encode(count_keywords(text).elements()), vocab, use_numpy=use_numpy
+        )
+        assert compact.ranked(top_n, use_numpy=use_numpy) == rank_keywords(
+            count_keywords(text), top_n
+        )
+
+
+def test_analyze_compact_matches_default() -> None:
+    text = _random_text(9)
+    jd = "Python, SQL, .NET and Kubernetes"
+    assert analyze(text, job_description=jd, compact=True) == analyze(text, job_description=jd)